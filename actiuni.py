@@ -0,0 +1,202 @@
+from typing import Callable, List, Optional
+
+from simboluri import citesteSimboluri, formateazaSimboluri
+
+# O acțiune semantică primește place values ale părții drepte, în ordinea simbolurilor
+# (o felie din stiva de atribute), și generatorul de cod; returnează place value-ul
+# neterminalului din stânga. Pentru a fi folosite de verificaSiruri (pool de procese),
+# acțiunile trebuie să poată fi serializate cu pickle (funcții la nivel de modul sau
+# instanțe ale claselor de mai jos).
+ActiuneSemantica = Callable[[list, object], object]
+
+# Separatorul dintre producție și acțiune într-un fișier de acțiuni
+SEPARATOR = '=>'
+
+# Traducerea implicită a expresiilor E/T/F (aceleași declarații ca gramatica.act), folosită
+# pentru gramaticile fără fișier de acțiuni; se aplică doar producțiilor existente
+ACTIUNI_IMPLICITE = (
+    'E->E+T => binar + 0 2',
+    'E->T   => copiaza 0',
+    'T->T*F => binar * 0 2',
+    'T->F   => copiaza 0',
+    'F->(E) => copiaza 1',
+    'F->a   => copiaza 0',
+)
+
+
+class Copiaza:
+    """Acțiunea `copiaza i`: place value-ul neterminalului este cel al simbolului i."""
+    __slots__ = ('index',)
+
+    def __init__(self, index: int):
+        self.index = index
+
+    def __call__(self, valori, generator):
+        return valori[self.index]
+
+    def indici(self):
+        return (self.index,)
+
+    def __repr__(self):
+        return f'copiaza {self.index}'
+
+
+class Binar:
+    """Acțiunea `binar op i j`: emite `t := v[i] op v[j]` într-o temporară nouă."""
+    __slots__ = ('operator', 'stanga', 'dreapta')
+
+    def __init__(self, operator: str, stanga: int, dreapta: int):
+        self.operator = operator
+        self.stanga = stanga
+        self.dreapta = dreapta
+
+    def __call__(self, valori, generator):
+        temporar = generator.newtemp()
+        generator.emit(self.operator, valori[self.stanga], valori[self.dreapta], temporar)
+        return temporar
+
+    def indici(self):
+        return (self.stanga, self.dreapta)
+
+    def __repr__(self):
+        return f'binar {self.operator} {self.stanga} {self.dreapta}'
+
+
+class Unar:
+    """Acțiunea `unar op i`: emite `t := op v[i]` într-o temporară nouă."""
+    __slots__ = ('operator', 'index')
+
+    def __init__(self, operator: str, index: int):
+        self.operator = operator
+        self.index = index
+
+    def __call__(self, valori, generator):
+        temporar = generator.newtemp()
+        generator.emit(self.operator, valori[self.index], None, temporar)
+        return temporar
+
+    def indici(self):
+        return (self.index,)
+
+    def __repr__(self):
+        return f'unar {self.operator} {self.index}'
+
+
+def _construiesteActiune(tip: str, argumente: List[str]) -> Optional[ActiuneSemantica]:
+    """Construiește o acțiune predefinită din tipul și argumentele ei (ca în fișierul de acțiuni)."""
+    try:
+        if tip == 'copiaza' and len(argumente) == 1:
+            return Copiaza(int(argumente[0]))
+        if tip == 'binar' and len(argumente) == 3:
+            return Binar(argumente[0], int(argumente[1]), int(argumente[2]))
+        if tip == 'unar' and len(argumente) == 2:
+            return Unar(argumente[0], int(argumente[1]))
+        if tip == 'nimic' and not argumente:
+            return None
+    except ValueError:
+        pass
+    raise ValueError(f"Acțiune necunoscută sau argumente greșite: {tip} {' '.join(argumente)}")
+
+
+class RegistruActiuni:
+    """
+    Acțiunile semantice ale unei gramatici, indexate după numărul producției
+    (poziția în listaProductii). Driverul apelează direct actiuni[numar_productie],
+    fără nicio comparație de șiruri; None înseamnă producție fără acțiune.
+    """
+    def __init__(self, productii):
+        """
+        Args:
+            productii: Lista de producții a gramaticii (augmentată)
+        """
+        self.productii = productii
+        self.actiuni: List[Optional[ActiuneSemantica]] = [None] * len(productii)
+        self.indexProductie = {}  # Dicționar {(A, simbolurile lui w): număr producție}
+        self.simboluri = set()  # Simbolurile producțiilor, pentru citirea textelor 'A->w'
+        for index, productie in enumerate(productii):
+            self._indexeaza(index, productie)
+
+    def _indexeaza(self, index: int, productie):
+        self.indexProductie.setdefault((productie.simbolNeterminal, productie.sirInlocuire), index)
+        self.simboluri.add(productie.simbolNeterminal)
+        self.simboluri.update(productie.sirInlocuire)
+
+    def adaugaProductie(self, productie):
+        """Înregistrează o producție adăugată la finalul listei de producții, fără acțiune."""
+        self.actiuni.append(None)
+        self._indexeaza(len(self.actiuni) - 1, productie)
+
+    def rezolvaProductie(self, productie) -> int:
+        """
+        Returnează numărul producției date ca index sau ca text 'A->w'; partea dreaptă
+        este citită ca în fișierul gramaticii (citesteSimboluri), deci 'E->E+T' și
+        'E -> E + T' sunt aceeași producție, iar simbolurile de mai multe caractere
+        sunt separate prin spații ('expr -> expr + term').
+        """
+        if isinstance(productie, int):
+            if not 0 <= productie < len(self.productii):
+                raise ValueError(f"Producție inexistentă: {productie}")
+            return productie
+        stanga, separator, dreapta = productie.partition('->')
+        cheie = (stanga.strip(), citesteSimboluri(dreapta, self.simboluri))
+        if not separator or cheie not in self.indexProductie:
+            raise ValueError(f"Producție inexistentă: {productie}")
+        return self.indexProductie[cheie]
+
+    def inregistreaza(self, productie, actiune: Optional[ActiuneSemantica]):
+        """
+        Asociază acțiunea unei producții (index sau text 'A->w'); None șterge acțiunea.
+        Pentru acțiunile predefinite, indicii sunt verificați față de lungimea părții drepte.
+        """
+        index = self.rezolvaProductie(productie)
+        lungime = len(self.productii[index].sirInlocuire)
+        if actiune is not None and hasattr(actiune, 'indici'):
+            for i in actiune.indici():
+                if not 0 <= i < lungime:
+                    raise ValueError(f"Indicele {i} depășește partea dreaptă a producției "
+                                     f"{self.productii[index].simbolNeterminal}->"
+                                     f"{formateazaSimboluri(self.productii[index].sirInlocuire)}")
+        self.actiuni[index] = actiune
+
+    def incarcaDinFisier(self, numeFisier: str):
+        """
+        Citește declarațiile de acțiuni: câte o linie `A->w => tip argumente`, unde tipul
+        este copiaza i, binar op i j, unar op i sau nimic. Indicii numără simbolurile
+        părții drepte de la stânga la dreapta, de la 0.
+        Liniile goale și cele care încep cu '#' sunt ignorate.
+        """
+        with open(numeFisier, 'r') as f:
+            for numarLinie, linie in enumerate(f, 1):
+                linie = linie.strip()
+                if not linie or linie.startswith('#'):
+                    continue
+                try:
+                    self._inregistreazaDeclaratie(linie)
+                except ValueError as eroare:
+                    raise ValueError(f"{numeFisier}:{numarLinie}: {eroare}") from None
+
+    def incarcaImplicite(self) -> int:
+        """
+        Înregistrează traducerea implicită (ACTIUNI_IMPLICITE) pentru producțiile ei care
+        există în gramatică; celelalte declarații sunt ignorate.
+
+        Returns:
+            Numărul de acțiuni înregistrate
+        """
+        inregistrate = 0
+        for declaratie in ACTIUNI_IMPLICITE:
+            try:
+                self._inregistreazaDeclaratie(declaratie)
+            except ValueError:
+                continue
+            inregistrate += 1
+        return inregistrate
+
+    def _inregistreazaDeclaratie(self, linie: str):
+        """Înregistrează o declarație `A->w => tip argumente`."""
+        productie, separator, actiune = linie.partition(SEPARATOR)
+        cuvinte = actiune.split()
+        if not separator or not cuvinte:
+            raise ValueError(f"se așteaptă 'A->w {SEPARATOR} acțiune'")
+        self.inregistreaza(productie.strip(), _construiesteActiune(cuvinte[0], cuvinte[1:]))
+
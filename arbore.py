@@ -0,0 +1,256 @@
+from array import array
+from typing import Iterator, List, Tuple
+
+# Indicele unui nod absent (fără copil, fără frate, fără rădăcină)
+FARA = -1
+
+
+class ArboreSintaxa:
+    """
+    Arborele de derivare al unei parsări, păstrat într-o arenă de coloane array('i')
+    paralele, indexate după numărul nodului (fără câte un obiect Python pe nod):
+    simbolul (coloana din tabel), producția (FARA pentru frunze), primul copil,
+    fratele următor și intervalul de tokeni [inceput, sfarsit) acoperit de nod.
+    Lexemele tokenilor sunt păstrate o singură dată, în ordinea intrării.
+
+    Memoria: 6 coloane * 4 octeți = 24 de octeți pe nod, plus o referință de 8 octeți
+    pe token în lista de lexeme (caracterele singulare sunt obiecte partajate de Python).
+    Pentru gramatica E/T/F, o intrare de n caractere dă aproximativ 2,4n noduri, deci
+    un arbore de 10 milioane de noduri (o intrare de ~4 MB) ocupă în jur de 275 MB,
+    plus rezerva de creștere a coloanelor array. Vezi raportMemorie.
+    """
+    def __init__(self, coloane: List[str], coloaneStanga):
+        """
+        Args:
+            coloane: Numele coloanelor tabelului (terminale, apoi neterminale)
+            coloaneStanga: Coloana neterminalului din stânga pentru fiecare producție
+        """
+        self.coloane = coloane
+        self.coloaneStanga = coloaneStanga
+        self.simbol = array('i')
+        self.productie = array('i')
+        self.primCopil = array('i')
+        self.urmatorFrate = array('i')
+        self.inceput = array('i')
+        self.sfarsit = array('i')
+        self.lexeme = []             # Lexemul fiecărui token, după indexul lui în intrare
+        self.pozitieCurenta = 0      # Indexul tokenului citit cel mai recent de driver
+        self.radacina = FARA
+        # Nodurile simbolurilor de pe stiva driver-ului; frunza tokenului de anticipare
+        # intră pe stivă abia când driverul cere tokenul următor (deci după deplasare)
+        self.stivaNoduri = []
+        self.frunzaInAsteptare = FARA
+
+    @classmethod
+    def pentruTabel(cls, tabel) -> 'ArboreSintaxa':
+        """Arbore gol pentru un tabel compilat (dens sau comprimat)."""
+        return cls(tabel.coloane, tabel.coloaneStanga)
+
+    def __len__(self):
+        return len(self.simbol)
+
+    def reduce(self, productie: int, lungime: int) -> int:
+        """
+        Adaugă nodul unei reduceri, cu ultimele `lungime` noduri de pe stivă drept copii,
+        și îl pune pe stivă în locul lor; returnează numărul nodului.
+        """
+        nod = len(self.simbol)
+        self.simbol.append(self.coloaneStanga[productie])
+        self.productie.append(productie)
+        self.urmatorFrate.append(FARA)
+        stivaNoduri = self.stivaNoduri
+        if lungime:
+            primul = stivaNoduri[-lungime]
+            ultimul = stivaNoduri[-1]
+            if lungime > 1:
+                urmatorFrate = self.urmatorFrate
+                for i in range(len(stivaNoduri) - lungime, len(stivaNoduri) - 1):
+                    urmatorFrate[stivaNoduri[i]] = stivaNoduri[i + 1]
+            del stivaNoduri[-lungime:]
+            self.primCopil.append(primul)
+            self.inceput.append(self.inceput[primul])
+            self.sfarsit.append(self.sfarsit[ultimul])
+        else:
+            # Producție vidă: interval gol la tokenul de anticipare
+            self.primCopil.append(FARA)
+            self.inceput.append(self.pozitieCurenta)
+            self.sfarsit.append(self.pozitieCurenta)
+        stivaNoduri.append(nod)
+        return nod
+
+    def frunze(self, perechi, coloanaSfarsit: int):
+        """
+        Generator care trece mai departe perechile (coloană, place value) citite de driver
+        și adaugă câte o frunză pentru fiecare token ('$' nu primește frunză).
+        Driverul cere o pereche nouă doar după ce a deplasat-o pe cea anterioară, deci
+        atunci frunza ei este pusă pe stiva de noduri.
+        """
+        stivaNoduri = self.stivaNoduri
+        lexeme = self.lexeme
+        # Frunzele sunt adăugate direct, cu metodele append legate o singură dată
+        adaugaSimbol, adaugaProductie = self.simbol.append, self.productie.append
+        adaugaCopil, adaugaFrate = self.primCopil.append, self.urmatorFrate.append
+        adaugaInceput, adaugaSfarsit = self.inceput.append, self.sfarsit.append
+        for coloana, place_val in perechi:
+            if self.frunzaInAsteptare != FARA:
+                stivaNoduri.append(self.frunzaInAsteptare)
+            pozitie = self.pozitieCurenta = len(lexeme)
+            if coloana == coloanaSfarsit:
+                self.frunzaInAsteptare = FARA
+            else:
+                self.frunzaInAsteptare = len(self.simbol)
+                lexeme.append(place_val)
+                adaugaSimbol(coloana)
+                adaugaProductie(FARA)
+                adaugaCopil(FARA)
+                adaugaFrate(FARA)
+                adaugaInceput(pozitie)
+                adaugaSfarsit(pozitie + 1)
+            yield coloana, place_val
+
+    def actiuniCuNoduri(self, actiuni: list, lungimiProductii) -> List['ActiuneCuNod']:
+        """
+        Returnează acțiunile semantice învelite astfel încât fiecare reducere să adauge
+        nodul ei în arbore înainte de a executa acțiunea.
+        """
+        return [ActiuneCuNod(actiune, index, lungimiProductii[index], self)
+                for index, actiune in enumerate(actiuni)]
+
+    def numeSimbol(self, nod: int) -> str:
+        return self.coloane[self.simbol[nod]]
+
+    def esteFrunza(self, nod: int) -> bool:
+        return self.productie[nod] == FARA
+
+    def copii(self, nod: int) -> Iterator[int]:
+        """Generator de numere ale copiilor nodului, de la stânga la dreapta."""
+        urmatorFrate = self.urmatorFrate
+        copil = self.primCopil[nod]
+        while copil != FARA:
+            yield copil
+            copil = urmatorFrate[copil]
+
+    def text(self, nod: int, separator: str = '') -> str:
+        """Lexemele acoperite de nod, unite cu separatorul dat."""
+        return separator.join(map(str, self.lexeme[self.inceput[nod]:self.sfarsit[nod]]))
+
+    def parcurge(self, nod: int = None) -> Iterator[Tuple[int, bool]]:
+        """
+        Parcurgere în adâncime, fără recursivitate: produce (nod, True) la intrarea în nod
+        și (nod, False) la ieșire, copiii fiind vizitați de la stânga la dreapta.
+        """
+        if nod is None:
+            nod = self.radacina
+        if nod == FARA:
+            return
+        primCopil = self.primCopil
+        urmatorFrate = self.urmatorFrate
+        stiva = [nod]
+        yield nod, True
+        copil = primCopil[nod]
+        while stiva:
+            if copil != FARA:
+                stiva.append(copil)
+                yield copil, True
+                copil = primCopil[copil]
+            else:
+                terminat = stiva.pop()
+                yield terminat, False
+                copil = urmatorFrate[terminat] if stiva else FARA
+
+    def cursor(self, nod: int = None) -> 'CursorArbore':
+        return CursorArbore(self, self.radacina if nod is None else nod)
+
+    def afiseaza(self, nod: int = None, fisier=None):
+        """Afișează arborele indentat, câte un nod pe linie (frunzele cu lexemul lor)."""
+        adancime = 0
+        for curent, intrare in self.parcurge(nod):
+            if not intrare:
+                adancime -= 1
+                continue
+            if self.esteFrunza(curent):
+                print(f"{'  ' * adancime}{self.numeSimbol(curent)} '{self.text(curent)}'", file=fisier)
+            else:
+                print(f"{'  ' * adancime}{self.numeSimbol(curent)}", file=fisier)
+            adancime += 1
+
+    def raportMemorie(self) -> dict:
+        """Numărul de noduri și octeții ocupați de coloane și de lista de lexeme."""
+        coloane = sum(len(a) * a.itemsize for a in (self.simbol, self.productie, self.primCopil,
+                                                    self.urmatorFrate, self.inceput, self.sfarsit))
+        lexeme = len(self.lexeme) * 8
+        return {
+            'noduri': len(self),
+            'tokeni': len(self.lexeme),
+            'octetiColoane': coloane,
+            'octetiLexeme': lexeme,
+            'octetiPeNod': (coloane + lexeme) / len(self) if len(self) else 0.0,
+        }
+
+
+class ActiuneCuNod:
+    """
+    Învelește acțiunea semantică a unei producții: adaugă nodul reducerii în arbore,
+    apoi execută acțiunea.
+    """
+    __slots__ = ('actiune', 'index', 'lungime', 'arbore')
+
+    def __init__(self, actiune, index: int, lungime: int, arbore: ArboreSintaxa):
+        self.actiune = actiune
+        self.index = index
+        self.lungime = lungime
+        self.arbore = arbore
+
+    def __call__(self, valori, generator):
+        self.arbore.reduce(self.index, self.lungime)
+        return self.actiune(valori, generator) if self.actiune is not None else None
+
+
+class CursorArbore:
+    """
+    Cursor de navigare prin arbore (fără copierea nodurilor): ține nodul curent și
+    drumul de la nodul de pornire, pentru revenirea la părinte.
+    """
+    __slots__ = ('arbore', 'nod', 'drum')
+
+    def __init__(self, arbore: ArboreSintaxa, nod: int):
+        self.arbore = arbore
+        self.nod = nod
+        self.drum = []
+
+    @property
+    def simbol(self) -> str:
+        return self.arbore.numeSimbol(self.nod)
+
+    @property
+    def productie(self) -> int:
+        return self.arbore.productie[self.nod]
+
+    @property
+    def interval(self) -> Tuple[int, int]:
+        return self.arbore.inceput[self.nod], self.arbore.sfarsit[self.nod]
+
+    @property
+    def text(self) -> str:
+        return self.arbore.text(self.nod)
+
+    def mergiLaPrimulCopil(self) -> bool:
+        copil = self.arbore.primCopil[self.nod]
+        if copil == FARA:
+            return False
+        self.drum.append(self.nod)
+        self.nod = copil
+        return True
+
+    def mergiLaFrate(self) -> bool:
+        frate = self.arbore.urmatorFrate[self.nod]
+        if frate == FARA or not self.drum:
+            return False
+        self.nod = frate
+        return True
+
+    def mergiLaParinte(self) -> bool:
+        if not self.drum:
+            return False
+        self.nod = self.drum.pop()
+        return True
@@ -0,0 +1,523 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from esantionare import Esantionator
+from gramatica import Gramatica, TabelComprimat, MOD_SLR, MOD_LALR, VERSIUNE_GENERATOR
+from generare_parser import GeneratorModul
+
+
+def comparaModuri(numeFisier: str) -> dict:
+    """
+    Construiește tabelul în modurile SLR și LALR pe aceeași gramatică și raportează
+    timpul de construcție, numărul de stări, dimensiunea tabelului (dens și comprimat)
+    și conflictele.
+    """
+    rezultate = {}
+    for mod in (MOD_SLR, MOD_LALR):
+        start = time.perf_counter()
+        gramatica = Gramatica(numeFisier, mod=mod)
+        durata = time.perf_counter() - start
+        tabel = gramatica.tabel
+        rezultate[mod] = {
+            'secunde': durata,
+            'stari': tabel.nrStari,
+            'celuleNenule': sum(1 for celula in tabel.celule if celula),
+            'octeti': tabel.nrStari * tabel.nrColoane * tabel.celule.itemsize,
+            'octetiComprimat': TabelComprimat.dinTabel(tabel).raportMemorie()['octetiComprimat'],
+            'conflicte': len(gramatica.conflicte),
+        }
+    return rezultate
+
+
+def afiseazaComparatie(numeFisier: str, rezultate: dict):
+    print(f"Gramatica: {numeFisier}")
+    print(f"{'mod':6}{'timp (ms)':>12}{'stări':>8}{'celule nenule':>15}{'octeți':>10}{'comprimat':>11}{'conflicte':>11}")
+    for mod, r in rezultate.items():
+        print(f"{mod:6}{r['secunde'] * 1000:12.2f}{r['stari']:8}{r['celuleNenule']:15}"
+              f"{r['octeti']:10}{r['octetiComprimat']:11}{r['conflicte']:11}")
+
+
+def numarTokeni(gramatica, sir: str) -> int:
+    """
+    Numărul de terminale ale intrării, așa cum le primește driverul: tokenii lexerului,
+    cuvintele (dacă simbolurile sunt separate prin spații) sau caracterele.
+    """
+    if gramatica.lexer is not None:
+        return sum(1 for _ in gramatica.lexer.tokenizeaza(sir))
+    if gramatica.separator:
+        return len(sir.split())
+    return len(sir)
+
+
+def _timpImport(cod: str, director: str, repetari: int) -> float:
+    """Cea mai bună durată (secunde) a codului dat, rulat într-un interpretor nou din `director`."""
+    program = f"import time\nstart = time.perf_counter()\n{cod}\nprint(time.perf_counter() - start)"
+    return min(float(subprocess.run([sys.executable, '-c', program], cwd=director, check=True,
+                                    capture_output=True, text=True).stdout)
+               for _ in range(repetari))
+
+
+def comparaModulGenerat(numeFisier: str, mod: str = MOD_SLR, propozitii: int = 2000, lungimeMaxima: int = 60,
+                        repetari: int = 3, samanta: int = 0) -> dict:
+    """
+    Compară parserul generat de generare_parser.py cu driverul generic (verificaSir):
+    timpul de pornire într-un interpretor nou (importul modulului generat față de
+    importul proiectului plus construcția Gramatica) și debitul pe propoziții extrase
+    uniform, cu și fără cod intermediar. Rezultatele celor doi parsere sunt verificate.
+    """
+    gramatica = Gramatica(numeFisier, mod=mod)
+    esantionator = Esantionator(gramatica, lungimeMaxima, samanta)
+    intrari = list(esantionator.esantioane(propozitii, {lungime: 1 for lungime in range(1, lungimeMaxima + 1)}))
+    tokeni = sum(numarTokeni(gramatica, intrare) for intrare in intrari)
+
+    with tempfile.TemporaryDirectory() as director:
+        GeneratorModul(gramatica).scrie(os.path.join(director, 'parser_generat.py'))
+        sys.path.insert(0, director)
+        try:
+            import parser_generat
+        finally:
+            sys.path.remove(director)
+        sys.modules.pop('parser_generat', None)
+        importGenerat = _timpImport('import parser_generat', director, repetari)
+    directorProiect = os.path.dirname(os.path.abspath(__file__))
+    importGeneric = _timpImport(f"from gramatica import Gramatica\nGramatica({os.path.abspath(numeFisier)!r}, mod={mod!r})",
+                                directorProiect, repetari)
+
+    def generic():
+        rezultate = []
+        for intrare in intrari:
+            acceptat = gramatica.verificaSir(intrare)
+            rezultate.append(gramatica.generator.cod_intermediar if acceptat else None)
+        return rezultate
+
+    def generat():
+        return [parser_generat.cod_intermediar(intrare) for intrare in intrari]
+
+    rezultateGeneric, timpGeneric = _masoara(generic, repetari)
+    rezultateGenerat, timpGenerat = _masoara(generat, repetari)
+    if rezultateGeneric != rezultateGenerat:
+        raise AssertionError("Parserul generat nu produce același cod intermediar ca driverul generic")
+    _, timpRecunoastere = _masoara(lambda: [parser_generat.parseaza(intrare) for intrare in intrari], repetari)
+    return {
+        'gramatica': numeFisier,
+        'mod': mod,
+        'propozitii': len(intrari),
+        'tokeni': tokeni,
+        'importGeneratSecunde': importGenerat,
+        'importGenericSecunde': importGeneric,
+        'tokeniPeSecundaGeneric': tokeni / timpGeneric,
+        'tokeniPeSecundaGenerat': tokeni / timpGenerat,
+        'tokeniPeSecundaRecunoastere': tokeni / timpRecunoastere,
+    }
+
+
+def afiseazaModulGenerat(r: dict):
+    print(f"Gramatica: {r['gramatica']} ({r['mod']}), {r['propozitii']} propoziții, {r['tokeni']} tokeni")
+    print(f"    pornire: generat {r['importGeneratSecunde'] * 1000:.1f} ms, "
+          f"generic {r['importGenericSecunde'] * 1000:.1f} ms")
+    print(f"    traducere: generat {r['tokeniPeSecundaGenerat']:,.0f} tokeni/s, "
+          f"generic {r['tokeniPeSecundaGeneric']:,.0f} tokeni/s "
+          f"({r['tokeniPeSecundaGenerat'] / r['tokeniPeSecundaGeneric']:.2f}x)")
+    print(f"    doar recunoaștere (generat): {r['tokeniPeSecundaRecunoastere']:,.0f} tokeni/s")
+
+
+def _genereazaExpresie(megaocteti: float) -> str:
+    """Generează o expresie validă pentru gramatica E/T/F cu lexer, de aproximativ dimensiunea dată."""
+    bucati = ['alfa + 42 * (beta_1 + gamma * 7)', 'x * y + (z + 1000) * w2', '(a + (b * c)) * delta']
+    text = []
+    marime = 0
+    i = 0
+    while marime < megaocteti * 1_000_000:
+        bucata = bucati[i % len(bucati)]
+        text.append(bucata)
+        marime += len(bucata) + 3
+        i += 1
+    return ' +\n'.join(text)
+
+
+def masoaraLexer(numeFisier: str = 'gramatica.txt', fisierLexer=True, megaocteti: float = 8.0) -> dict:
+    """
+    Măsoară debitul lexerului (MB/s și tokeni/s), singur și împreună cu parserul, pe o
+    expresie generată. Lexerul este implicit fișierul .lex de lângă gramatică.
+    """
+    gramatica = Gramatica(numeFisier, fisierLexer=fisierLexer)
+    if gramatica.lexer is None:
+        raise ValueError(f"Gramatica {numeFisier} nu are lexer")
+    text = _genereazaExpresie(megaocteti)
+    marime = len(text.encode()) / 1_000_000
+
+    start = time.perf_counter()
+    tokeni = numarTokeni(gramatica, text)
+    durataLexer = time.perf_counter() - start
+
+    start = time.perf_counter()
+    acceptat = gramatica.verificaSir(text)
+    durataParsare = time.perf_counter() - start
+    return {
+        'gramatica': numeFisier,
+        'megaocteti': marime,
+        'tokeni': tokeni,
+        'acceptat': acceptat,
+        'lexerSecunde': durataLexer,
+        'lexerParserSecunde': durataParsare,
+    }
+
+
+def afiseazaLexer(r: dict):
+    print(f"Intrare: {r['megaocteti']:.2f} MB, {r['tokeni']} tokeni, acceptat: {r['acceptat']}")
+    for eticheta, durata in (('Lexer:', r['lexerSecunde']), ('Lexer + parser:', r['lexerParserSecunde'])):
+        print(f"{eticheta:16}{r['megaocteti'] / durata:8.2f} MB/s  ({r['tokeni'] / durata:,.0f} tokeni/s)")
+
+
+# Suita de benchmark: gramatici sintetice de mărimi crescătoare și intrări generate.
+# Simbolurile sunt caractere Unicode (neterminale de la U+0100, terminale de la U+0400),
+# deci gramaticile rămân în formatul gramatica.txt: un simbol = un caracter.
+
+def _neterminale(n: int) -> list:
+    return [chr(0x100 + i) for i in range(n)]
+
+
+def _terminale(n: int) -> list:
+    return [chr(0x400 + i) for i in range(n)]
+
+
+def _textGramatica(neterminale: list, terminale: list, productii: list) -> str:
+    linii = [' '.join(neterminale), ' '.join(terminale), neterminale[0]]
+    linii.extend(f'{stanga}->{dreapta}' for stanga, dreapta in productii)
+    return '\n'.join(linii)
+
+
+class FamilieExpresie:
+    """
+    Gramatică de expresii cu `marime` niveluri de precedență:
+    N_i → N_i op_i N_{i+1} | N_{i+1}, iar ultimul nivel N_k → ( N_0 ) | a.
+    """
+    nume = 'expresie'
+
+    def __init__(self, marime: int):
+        neterminale = _neterminale(marime + 1)
+        self.operatori = _terminale(marime)
+        productii = []
+        for i in range(marime):
+            productii.append((neterminale[i], neterminale[i] + self.operatori[i] + neterminale[i + 1]))
+            productii.append((neterminale[i], neterminale[i + 1]))
+        productii.append((neterminale[marime], '(' + neterminale[0] + ')'))
+        productii.append((neterminale[marime], 'a'))
+        self.text = _textGramatica(neterminale, ['a', '(', ')'] + self.operatori, productii)
+
+    def intrare(self, lungime: int, rnd: random.Random, acceptat: bool) -> str:
+        """Expresie aleatoare de cel puțin `lungime` simboluri, cu paranteze de adâncime mică."""
+        simboluri = []
+        adancime = 0
+        asteaptaOperand = True
+        while len(simboluri) < lungime or asteaptaOperand:
+            if asteaptaOperand:
+                if adancime < 8 and rnd.random() < 0.1:
+                    simboluri.append('(')
+                    adancime += 1
+                else:
+                    simboluri.append('a')
+                    asteaptaOperand = False
+            elif adancime > 0 and rnd.random() < 0.1:
+                simboluri.append(')')
+                adancime -= 1
+            else:
+                simboluri.append(rnd.choice(self.operatori))
+                asteaptaOperand = True
+        simboluri.extend(')' * adancime)
+        if not acceptat:
+            # Doi operatori consecutivi, spre finalul intrării
+            pozitie = _pozitieEroare(simboluri, lambda simbol: simbol in self.operatori)
+            simboluri.insert(pozitie, self.operatori[0])
+        return ''.join(simboluri)
+
+
+class FamilieImbricata:
+    """
+    Gramatică cu imbricare adâncă: S → S , N_0 | N_0, N_i → [_i N_{i+1} ]_i | a,
+    cu `marime` perechi distincte de paranteze.
+    """
+    nume = 'imbricata'
+
+    def __init__(self, marime: int):
+        self.marime = marime
+        neterminale = _neterminale(marime + 2)
+        start, niveluri = neterminale[0], neterminale[1:]
+        terminale = _terminale(2 * marime)
+        self.deschise, self.inchise = terminale[:marime], terminale[marime:]
+        productii = [(start, start + ',' + niveluri[0]), (start, niveluri[0])]
+        for i in range(marime):
+            productii.append((niveluri[i], self.deschise[i] + niveluri[i + 1] + self.inchise[i]))
+            productii.append((niveluri[i], 'a'))
+        productii.append((niveluri[marime], 'a'))
+        self.text = _textGramatica(neterminale, ['a', ','] + terminale, productii)
+
+    def intrare(self, lungime: int, rnd: random.Random, acceptat: bool) -> str:
+        """Listă de elemente imbricate la adâncimi aleatoare, de cel puțin `lungime` simboluri."""
+        simboluri = []
+        while len(simboluri) < lungime:
+            if simboluri:
+                simboluri.append(',')
+            adancime = rnd.randint(0, self.marime)
+            simboluri.extend(self.deschise[:adancime])
+            simboluri.append('a')
+            simboluri.extend(reversed(self.inchise[:adancime]))
+        if not acceptat:
+            # O paranteză închisă imediat după ',' spre finalul intrării
+            pozitie = _pozitieEroare(simboluri, lambda simbol: simbol == ',')
+            simboluri.insert(pozitie, self.inchise[0])
+        return ''.join(simboluri)
+
+
+class FamilieAlternativa:
+    """
+    Gramatică cu alternare largă: S → S A | A, A → t_i | t_i v, cu `marime` terminale t_i.
+    """
+    nume = 'alternativa'
+
+    def __init__(self, marime: int):
+        neterminale = _neterminale(2)
+        self.alternative = _terminale(marime)
+        self.sufix = 'v'
+        productii = [(neterminale[0], neterminale[0] + neterminale[1]), (neterminale[0], neterminale[1])]
+        for terminal in self.alternative:
+            productii.append((neterminale[1], terminal))
+            productii.append((neterminale[1], terminal + self.sufix))
+        self.text = _textGramatica(neterminale, [self.sufix] + self.alternative, productii)
+
+    def intrare(self, lungime: int, rnd: random.Random, acceptat: bool) -> str:
+        """Secvență aleatoare de alternative, de cel puțin `lungime` simboluri."""
+        simboluri = []
+        while len(simboluri) < lungime:
+            simboluri.append(rnd.choice(self.alternative))
+            if rnd.random() < 0.3:
+                simboluri.append(self.sufix)
+        if not acceptat:
+            # Sufixul dublat spre finalul intrării
+            pozitie = _pozitieEroare(simboluri, lambda simbol: simbol == self.sufix)
+            simboluri.insert(pozitie, self.sufix)
+        return ''.join(simboluri)
+
+
+FAMILII = {familie.nume: familie for familie in (FamilieExpresie, FamilieImbricata, FamilieAlternativa)}
+
+
+def _pozitieEroare(simboluri: list, potrivire) -> int:
+    """
+    Poziția imediat după primul simbol potrivit din ultimele ~10% ale intrării; acolo se
+    inserează simbolul greșit, ca parserul să facă aproape toată munca înainte de eroare.
+    """
+    for i in range(len(simboluri) * 9 // 10, len(simboluri)):
+        if potrivire(simboluri[i]):
+            return i + 1
+    for i in range(len(simboluri) - 1, -1, -1):
+        if potrivire(simboluri[i]):
+            return i + 1
+    raise ValueError("Intrarea nu conține niciun punct de inserare a erorii")
+
+
+def _masoara(functie, repetari: int):
+    """Returnează (rezultat, cea mai bună durată din `repetari` rulări)."""
+    celMaiBun = None
+    for _ in range(repetari):
+        start = time.perf_counter()
+        rezultat = functie()
+        durata = time.perf_counter() - start
+        if celMaiBun is None or durata < celMaiBun:
+            celMaiBun = durata
+    return rezultat, celMaiBun
+
+
+def _varfMemorie(functie) -> int:
+    """Vârful memoriei alocate (octeți, după tracemalloc) în timpul apelului."""
+    tracemalloc.start()
+    try:
+        functie()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def ruleazaSuita(familii, marimi, lungimi, moduri=(MOD_SLR,), repetari: int = 3,
+                 samanta: int = 0, memorie: bool = True) -> dict:
+    """
+    Rulează suita: pentru fiecare familie, mărime de gramatică și mod construiește tabelul
+    (timp pe faze, vârf de memorie), apoi parsează intrări acceptate și respinse de
+    fiecare lungime (tokeni/s, vârf de memorie).
+    Timpii sunt cei mai buni din `repetari` rulări; memoria este măsurată într-o rulare
+    separată, pentru că tracemalloc încetinește execuția.
+
+    Returns:
+        Dicționar serializabil JSON: {'meta': ..., 'rezultate': [...]}
+    """
+    rezultate = []
+    with tempfile.TemporaryDirectory() as director:
+        for numeFamilie in familii:
+            for marime in marimi:
+                familie = FAMILII[numeFamilie](marime)
+                numeFisier = os.path.join(director, f'{numeFamilie}_{marime}.txt')
+                with open(numeFisier, 'w') as f:
+                    f.write(familie.text)
+
+                for mod in moduri:
+                    gramatica, durata = _masoara(lambda: Gramatica(numeFisier, mod=mod), repetari)
+                    rezultat = {
+                        'familie': numeFamilie,
+                        'marime': marime,
+                        'mod': mod,
+                        'stari': gramatica.tabel.nrStari,
+                        'coloane': gramatica.tabel.nrColoane,
+                        'conflicte': len(gramatica.conflicte),
+                        'constructieSecunde': durata,
+                        'faze': gramatica.durateFaze,
+                        'intrari': [],
+                    }
+                    if memorie:
+                        rezultat['constructieVarfOcteti'] = _varfMemorie(lambda: Gramatica(numeFisier, mod=mod))
+
+                    rnd = random.Random(samanta)
+                    for lungime in lungimi:
+                        for asteptat in (True, False):
+                            sir = familie.intrare(lungime, rnd, asteptat)
+                            acceptat, durata = _masoara(lambda: gramatica.verificaSir(sir), repetari)
+                            intrare = {
+                                'lungime': len(sir),
+                                'asteptat': asteptat,
+                                'acceptat': acceptat,
+                                'secunde': durata,
+                                'tokeniPeSecunda': numarTokeni(gramatica, sir) / durata,
+                            }
+                            if memorie:
+                                intrare['varfOcteti'] = _varfMemorie(lambda: gramatica.verificaSir(sir))
+                            rezultat['intrari'].append(intrare)
+                    rezultate.append(rezultat)
+
+    return {
+        'meta': {
+            'versiuneGenerator': VERSIUNE_GENERATOR,
+            'python': platform.python_version(),
+            'platforma': platform.platform(),
+            'data': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repetari': repetari,
+            'samanta': samanta,
+        },
+        'rezultate': rezultate,
+    }
+
+
+def _cheieRezultat(rezultat: dict, intrare: dict = None) -> str:
+    cheie = f"{rezultat['familie']}[{rezultat['marime']}] {rezultat['mod']}"
+    if intrare is not None:
+        cheie += f" {'acceptat' if intrare['asteptat'] else 'respins'} {intrare['lungime']}"
+    return cheie
+
+
+def comparaCuReferinta(referinta: dict, curent: dict, prag: float = 0.2) -> list:
+    """
+    Compară două rulări ale suitei și returnează regresiile: măsurătorile (construcție
+    sau parsare) cu peste `prag` mai lente decât în referință, plus intrările al căror
+    rezultat (acceptat/respins) nu este cel așteptat.
+
+    Returns:
+        Listă de mesaje, goală dacă nu există regresii
+    """
+    timpi = {}
+    for rezultat in referinta['rezultate']:
+        timpi[_cheieRezultat(rezultat)] = rezultat['constructieSecunde']
+        for intrare in rezultat['intrari']:
+            timpi[_cheieRezultat(rezultat, intrare)] = intrare['secunde']
+
+    regresii = []
+    for rezultat in curent['rezultate']:
+        masuratori = [(_cheieRezultat(rezultat), rezultat['constructieSecunde'])]
+        masuratori.extend((_cheieRezultat(rezultat, intrare), intrare['secunde']) for intrare in rezultat['intrari'])
+        for cheie, durata in masuratori:
+            vechi = timpi.get(cheie)
+            if vechi and durata > vechi * (1 + prag):
+                regresii.append(f"{cheie}: {vechi * 1000:.2f} ms -> {durata * 1000:.2f} ms")
+        for intrare in rezultat['intrari']:
+            if intrare['acceptat'] != intrare['asteptat']:
+                regresii.append(f"{_cheieRezultat(rezultat, intrare)}: rezultat greșit")
+    return regresii
+
+
+def afiseazaSuita(raport: dict):
+    for r in raport['rezultate']:
+        faze = ', '.join(f"{nume} {durata * 1000:.1f}" for nume, durata in r['faze'].items())
+        print(f"{r['familie']}[{r['marime']}] {r['mod']}: {r['stari']} stări, "
+              f"construcție {r['constructieSecunde'] * 1000:.1f} ms ({faze})")
+        for intrare in r['intrari']:
+            stare = 'acceptat' if intrare['acceptat'] else 'respins'
+            print(f"    {intrare['lungime']:>9} simboluri  {stare:9}{intrare['tokeniPeSecunda']:>14,.0f} tokeni/s")
+
+
+def main(argumente=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru construcția tabelului și parsare.")
+    parser.add_argument('gramatici', nargs='*',
+                        help="Fișiere de gramatică pentru comparația SLR/LALR (fără --suita)")
+    parser.add_argument('--suita', action='store_true', help="Rulează suita pe gramatici sintetice")
+    parser.add_argument('--generat', action='store_true',
+                        help="Compară parserul generat (generare_parser.py) cu driverul generic")
+    parser.add_argument('--lexer', action='store_true',
+                        help="Măsoară debitul lexerului (MB/s) pe gramaticile date, cu fișierul .lex de lângă ele")
+    parser.add_argument('--megaocteti', type=float, default=8.0, help="Mărimea intrării pentru --lexer")
+    parser.add_argument('--familii', nargs='+', default=list(FAMILII), choices=list(FAMILII))
+    parser.add_argument('--marimi', nargs='+', type=int, default=[5, 20, 80])
+    parser.add_argument('--lungimi', nargs='+', type=int, default=[1000, 100000])
+    parser.add_argument('--moduri', nargs='+', default=[MOD_SLR], choices=[MOD_SLR, MOD_LALR])
+    parser.add_argument('--repetari', type=int, default=3)
+    parser.add_argument('--samanta', type=int, default=0)
+    parser.add_argument('--fara-memorie', action='store_true', help="Nu măsura vârful de memorie")
+    parser.add_argument('--iesire', help="Fișierul JSON cu rezultatele ('-' pentru stdout)")
+    parser.add_argument('--referinta', help="Rezultatele JSON ale unei rulări anterioare")
+    parser.add_argument('--prag', type=float, default=0.2,
+                        help="Încetinirea relativă raportată ca regresie (implicit 0.2 = 20%%)")
+    argumente = parser.parse_args(argumente)
+
+    if argumente.lexer:
+        for numeFisier in argumente.gramatici or ['gramatica.txt']:
+            afiseazaLexer(masoaraLexer(numeFisier, megaocteti=argumente.megaocteti))
+        return 0
+
+    if argumente.generat:
+        for numeFisier in argumente.gramatici or ['gramatica.txt']:
+            for mod in argumente.moduri:
+                afiseazaModulGenerat(comparaModulGenerat(numeFisier, mod, repetari=argumente.repetari,
+                                                         samanta=argumente.samanta))
+        return 0
+
+    if not argumente.suita:
+        for numeFisier in argumente.gramatici or ['gramatica.txt']:
+            afiseazaComparatie(numeFisier, comparaModuri(numeFisier))
+        return 0
+
+    raport = ruleazaSuita(argumente.familii, argumente.marimi, argumente.lungimi, argumente.moduri,
+                          argumente.repetari, argumente.samanta, not argumente.fara_memorie)
+    if argumente.iesire == '-':
+        json.dump(raport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    else:
+        afiseazaSuita(raport)
+        if argumente.iesire:
+            with open(argumente.iesire, 'w') as f:
+                json.dump(raport, f, indent=2, ensure_ascii=False)
+
+    if argumente.referinta:
+        with open(argumente.referinta) as f:
+            regresii = comparaCuReferinta(json.load(f), raport, argumente.prag)
+        for mesaj in regresii:
+            print(f"REGRESIE {mesaj}", file=sys.stderr)
+        return 1 if regresii else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,107 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+# Format fișier cache (toate câmpurile antetului sunt little-endian):
+#   antet   = magic, versiune format, ordinea octeților celulelor, sha256 al cheii,
+#             număr de stări, număr de coloane, lungimea metadatelor
+#   metadate = JSON UTF-8 (simboluri, simbol de start, producții, coloane)
+#   celule   = tabelul compilat, int32 în ordinea nativă, aliniat la 8 octeți (poate fi mmap-uit)
+MAGIC = b'LR0T'
+VERSIUNE_FORMAT = 1
+_ANTET = struct.Struct('<4sHH32sIII')
+_ORDINE_OCTETI = 1 if sys.byteorder == 'little' else 2
+_EXTENSIE = '.lrt'
+
+
+def cheieCache(continutGramatica: bytes, versiuneGenerator: int, optiuni: str = '') -> bytes:
+    """
+    Calculează cheia cache-ului: hash-ul conținutului gramaticii, al versiunii
+    generatorului și al opțiunilor de construcție.
+    """
+    h = hashlib.sha256()
+    h.update(f'{versiuneGenerator}\0{optiuni}\0'.encode())
+    h.update(continutGramatica)
+    return h.digest()
+
+
+def caleCache(directorCache: str, numeFisier: str, cheie: bytes, optiuni: str = '') -> str:
+    """
+    Returnează calea fișierului cache pentru gramatica, opțiunile și cheia date.
+    Numele este <gramatică>.<hash al căii>.<opțiuni>.<cheie>.lrt: gramaticile cu același
+    nume din directoare diferite și opțiunile diferite ale aceleiași gramatici au
+    prefixe diferite, deci nu își invalidează una alteia intrările.
+    """
+    hashCale = hashlib.sha256(os.path.realpath(numeFisier).encode()).hexdigest()[:8]
+    prefix = f'{os.path.basename(numeFisier)}.{hashCale}.{optiuni or "-"}'
+    return os.path.join(directorCache, f'{prefix}.{cheie.hex()[:16]}{_EXTENSIE}')
+
+
+def citesteCache(cale: str, cheie: bytes):
+    """
+    Încarcă un tabel din cache prin mmap, fără a copia celulele.
+
+    Returns:
+        (metadate, celule) unde celule este un memoryview de int32,
+        sau None dacă fișierul lipsește sau nu corespunde cheii.
+    """
+    try:
+        with open(cale, 'rb') as f:
+            harta = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(harta) < _ANTET.size:
+        return None
+    magic, versiune, ordine, cheieFisier, nrStari, nrColoane, lungimeMetadate = _ANTET.unpack_from(harta, 0)
+    if (magic != MAGIC or versiune != VERSIUNE_FORMAT or ordine != _ORDINE_OCTETI
+            or cheieFisier != cheie):
+        return None
+
+    inceputCelule = _aliniaza(_ANTET.size + lungimeMetadate)
+    sfarsitCelule = inceputCelule + 4 * nrStari * nrColoane
+    if len(harta) < sfarsitCelule:
+        return None
+
+    metadate = json.loads(harta[_ANTET.size:_ANTET.size + lungimeMetadate].decode('utf-8'))
+    celule = memoryview(harta)[inceputCelule:sfarsitCelule].cast('i')
+    return metadate, celule
+
+
+def scrieCache(cale: str, cheie: bytes, metadate: dict, celule, nrColoane: int):
+    """
+    Scrie atomic tabelul în cache și șterge intrările vechi ale aceleiași gramatici
+    (aceeași cale și aceleași opțiuni, deci același prefix în caleCache).
+    """
+    director = os.path.dirname(cale) or '.'
+    os.makedirs(director, exist_ok=True)
+
+    octetiMetadate = json.dumps(metadate, ensure_ascii=False).encode('utf-8')
+    nrStari = len(celule) // nrColoane
+    antet = _ANTET.pack(MAGIC, VERSIUNE_FORMAT, _ORDINE_OCTETI, cheie, nrStari, nrColoane, len(octetiMetadate))
+    umplutura = _aliniaza(len(antet) + len(octetiMetadate)) - len(antet) - len(octetiMetadate)
+
+    temporar = f'{cale}.{os.getpid()}.tmp'
+    with open(temporar, 'wb') as f:
+        f.write(antet)
+        f.write(octetiMetadate)
+        f.write(b'\0' * umplutura)
+        f.write(memoryview(celule).cast('B'))
+    os.replace(temporar, cale)
+
+    # Invalidează automat versiunile anterioare ale aceleiași gramatici, cu aceleași opțiuni
+    prefix = os.path.basename(cale).rsplit('.', 2)[0] + '.'
+    for nume in os.listdir(director):
+        caleVeche = os.path.join(director, nume)
+        if nume.startswith(prefix) and nume.endswith(_EXTENSIE) and caleVeche != cale:
+            try:
+                os.remove(caleVeche)
+            except OSError:
+                pass
+
+
+def _aliniaza(pozitie: int) -> int:
+    return (pozitie + 7) & ~7
@@ -0,0 +1,226 @@
+from array import array
+from typing import Callable
+
+# Codul operatorului pentru instrucțiunile emise ca text liber (emit cu un singur argument)
+_OPERATOR_TEXT = 0
+# Codul unui operand absent; temporarele sunt codificate negativ (-n pentru tn),
+# iar ceilalți operanzi internați, ca index + 1
+_ABSENT = 0
+
+
+class Temporar(int):
+    """
+    Variabilă temporară tn, păstrată ca întreg; se afișează ca 'tn'.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return f't{int(self)}'
+
+    __repr__ = __str__
+
+    def __format__(self, specificator):
+        return format(str(self), specificator)
+
+
+def formateazaQuad(op, arg1, arg2, rezultat) -> str:
+    """Textul unei instrucțiuni three-address code pentru quadrupla dată."""
+    if op is None:
+        return arg1
+    if arg2 is None:
+        if op == ':=':
+            return f"{rezultat} := {arg1}"
+        return f"{rezultat} := {op} {arg1}"
+    return f"{rezultat} := {arg1} {op} {arg2}"
+
+
+class DestinatieFisier:
+    """
+    Destinație care scrie fiecare instrucțiune, ca text, într-un fișier (câte una pe linie).
+    """
+    def __init__(self, fisier):
+        """
+        Args:
+            fisier: Calea fișierului sau un obiect fișier deja deschis (nu este închis de inchide())
+        """
+        self.detinut = isinstance(fisier, str)
+        self.fisier = open(fisier, 'w') if self.detinut else fisier
+
+    def scrie(self, op, arg1, arg2, rezultat):
+        self.fisier.write(formateazaQuad(op, arg1, arg2, rezultat))
+        self.fisier.write('\n')
+
+    def inchide(self):
+        if self.detinut:
+            self.fisier.close()
+        else:
+            self.fisier.flush()
+
+
+class DestinatieCallback:
+    """
+    Destinație care apelează o funcție f(op, arg1, arg2, rezultat) pentru fiecare quadruplă.
+    """
+    def __init__(self, functie: Callable):
+        self.functie = functie
+
+    def scrie(self, op, arg1, arg2, rezultat):
+        self.functie(op, arg1, arg2, rezultat)
+
+    def inchide(self):
+        pass
+
+
+class GeneratorCodIntermediar:
+    """
+    Gestionează generarea de cod intermediar și variabile temporare.
+    Codul este păstrat ca quadruple (op, arg1, arg2, rezultat) în coloane array('i'):
+    operatorii și operanzii sunt internați, iar temporarele sunt codificate direct.
+    Textul instrucțiunilor este generat doar la cerere (cod_intermediar, afiseaza_cod_intermediar).
+    Quadruplele pot fi trimise și în destinații (fișier, callback) pe măsură ce sunt emise;
+    cu pastreaza=False nu sunt păstrate deloc, deci memoria nu crește cu intrarea.
+    """
+    def __init__(self, destinatii: list = None, pastreaza: bool = True):
+        """
+        Args:
+            destinatii: Destinații (obiecte cu scrie/inchide) care primesc fiecare quadruplă
+            pastreaza: Dacă este False, quadruplele sunt doar trimise destinațiilor
+        """
+        self.destinatii = list(destinatii or [])
+        self.pastreaza = pastreaza
+        self.contor_temp = 0
+        self.operatori = [None]     # Operatorii internați; codul 0 este instrucțiunea text
+        self.indexOperator = {}
+        self.operanzi = []          # Operanzii internați (alții decât temporarele)
+        self.indexOperand = {}
+        self.coloanaOp = array('i')
+        self.coloanaArg1 = array('i')
+        self.coloanaArg2 = array('i')
+        self.coloanaRezultat = array('i')
+
+    def adaugaDestinatie(self, destinatie):
+        """Adaugă o destinație; o funcție simplă este învelită într-o DestinatieCallback."""
+        if not hasattr(destinatie, 'scrie'):
+            destinatie = DestinatieCallback(destinatie)
+        self.destinatii.append(destinatie)
+
+    def inchideDestinatii(self):
+        for destinatie in self.destinatii:
+            destinatie.inchide()
+
+    def newtemp(self):
+        """
+        Generează și returnează o nouă variabilă temporară.
+        Returns: Temporar, afișat ca 't1', 't2', etc.
+        """
+        self.contor_temp += 1
+        return Temporar(self.contor_temp)
+
+    def emit(self, op, arg1=None, arg2=None, rezultat=None):
+        """
+        Emite (adaugă) o instrucțiune de cod intermediar.
+        Args:
+            op: Operatorul (ex. '+', ':=' pentru copiere); apelat doar cu un șir, ex.
+                emit("t1 := a + b"), instrucțiunea este păstrată ca text
+            arg1, arg2: Operanzii (arg2 este None pentru operatorii unari și copiere)
+            rezultat: Destinația (de obicei un Temporar)
+        """
+        if arg1 is None and rezultat is None:
+            op, arg1 = None, op
+        for destinatie in self.destinatii:
+            destinatie.scrie(op, arg1, arg2, rezultat)
+        if not self.pastreaza:
+            return
+
+        codOp = _OPERATOR_TEXT if op is None else self.indexOperator.get(op)
+        if codOp is None:
+            codOp = self.indexOperator[op] = len(self.operatori)
+            self.operatori.append(op)
+        self.coloanaOp.append(codOp)
+        indexOperand = self.indexOperand
+        # Temporarele sunt codificate direct; ceilalți operanzi sunt căutați în tabela internată
+        self.coloanaArg1.append(-arg1 if type(arg1) is Temporar else
+                                indexOperand.get(arg1) or self._interneaza(arg1))
+        self.coloanaArg2.append(-arg2 if type(arg2) is Temporar else
+                                indexOperand.get(arg2) or self._interneaza(arg2))
+        self.coloanaRezultat.append(-rezultat if type(rezultat) is Temporar else
+                                    indexOperand.get(rezultat) or self._interneaza(rezultat))
+
+    def inlocuiesteCod(self, quadruple):
+        """
+        Înlocuiește codul păstrat cu quadruplele date (ex. după optimizare), fără a le
+        retrimite destinațiilor; contorul de temporare rămâne neschimbat.
+        """
+        contor, destinatii, pastreaza = self.contor_temp, self.destinatii, self.pastreaza
+        self.reseteaza()
+        self.contor_temp, self.destinatii, self.pastreaza = contor, [], True
+        try:
+            for quad in quadruple:
+                self.emit(*quad)
+        finally:
+            self.destinatii, self.pastreaza = destinatii, pastreaza
+
+    def trunchiaza(self, lungime: int, contor_temp: int):
+        """
+        Păstrează doar primele `lungime` instrucțiuni și revine la contorul de temporare dat
+        (ex. la reluarea unei parsări dintr-un punct de control). Operanzii internați rămân,
+        deci codurile din coloanele păstrate în altă parte sunt în continuare valide.
+        """
+        for coloana in (self.coloanaOp, self.coloanaArg1, self.coloanaArg2, self.coloanaRezultat):
+            del coloana[lungime:]
+        self.contor_temp = contor_temp
+
+    def _interneaza(self, operand) -> int:
+        if operand is None:
+            return _ABSENT
+        cod = self.indexOperand[operand] = len(self.operanzi) + 1
+        self.operanzi.append(operand)
+        return cod
+
+    def _operand(self, cod: int):
+        if cod == _ABSENT:
+            return None
+        if cod < 0:
+            return Temporar(-cod)
+        return self.operanzi[cod - 1]
+
+    def __len__(self):
+        return len(self.coloanaOp)
+
+    def quadruple(self):
+        """Generator de quadruple (op, arg1, arg2, rezultat) decodificate, în ordinea emiterii."""
+        return self.decodifica(self.coloanaOp, self.coloanaArg1, self.coloanaArg2, self.coloanaRezultat)
+
+    def decodifica(self, coloanaOp, coloanaArg1, coloanaArg2, coloanaRezultat):
+        """Generator de quadruple decodificate din coloane codificate de acest generator (ex. copii ale lor)."""
+        operatori = self.operatori
+        operand = self._operand
+        for op, arg1, arg2, rezultat in zip(coloanaOp, coloanaArg1, coloanaArg2, coloanaRezultat):
+            yield operatori[op], operand(arg1), operand(arg2), operand(rezultat)
+
+    @property
+    def cod_intermediar(self):
+        """Instrucțiunile păstrate, ca text (generat la fiecare acces)."""
+        return [formateazaQuad(*quad) for quad in self.quadruple()]
+
+    def afiseaza_cod_intermediar(self):
+        """
+        Afișează tot codul intermediar generat.
+        """
+        print("Cod Intermediar Generat:")
+        for i, quad in enumerate(self.quadruple(), 1):
+            print(f"{i}. {formateazaQuad(*quad)}")
+
+    def reseteaza(self):
+        """
+        Resetează generatorul pentru o nouă parsare (destinațiile rămân atașate).
+        """
+        self.contor_temp = 0
+        self.operatori = [None]
+        self.indexOperator = {}
+        self.operanzi = []
+        self.indexOperand = {}
+        self.coloanaOp = array('i')
+        self.coloanaArg1 = array('i')
+        self.coloanaArg2 = array('i')
+        self.coloanaRezultat = array('i')
@@ -0,0 +1,247 @@
+import random
+import sys
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Dict, Iterator, List
+
+
+class Esantionator:
+    """
+    Numără derivările gramaticii pe lungimi și extrage propoziții aleatoare uniform
+    dintre derivările de o lungime exactă (uniform dintre propoziții pentru o gramatică
+    neambiguă; o propoziție ambiguă are ponderea numărului ei de derivări).
+
+    Programarea dinamică peste listaProductii calculează numar[A][n], numărul de
+    derivări din A ale unui șir de n terminale, și, pentru sufixul de la poziția i al
+    fiecărei producții, numărul de moduri în care el derivă n terminale. Numerele sunt
+    întregi Python exacți. La extragere, alegerile (producția, apoi lungimea fiecărui
+    simbol) sunt făcute cu ponderile cumulate, păstrate în cache, și căutare binară.
+    """
+    def __init__(self, gramatica, lungimeMaxima: int, samanta=None):
+        """
+        Args:
+            gramatica: Gramatica (poate fi și încărcată din cache)
+            lungimeMaxima: Cea mai mare lungime pentru care se numără derivările
+            samanta: Sămânța generatorului de numere aleatoare (None = nedeterminist)
+
+        Raises:
+            ValueError: Dacă gramatica este ciclică (A ⇒+ A), caz în care numărul de derivări este infinit
+        """
+        self.lungimeMaxima = lungimeMaxima
+        self.aleator = random.Random(samanta)
+        self.terminale = set(gramatica.listaTerminale)
+        self.separator = gramatica.separator  # Propozițiile sunt scrise ca textele citite de verificaSir
+
+        # Producțiile, ca tupluri de simboluri; forma inițială este o pseudo-producție a lui None
+        self.productii = [tuple(productie.sirInlocuire) for productie in gramatica.listaProductii]
+        self.productii.append(gramatica.formaInitiala())
+        self.productiiNeterminal = {}
+        for index, productie in enumerate(gramatica.listaProductii):
+            self.productiiNeterminal.setdefault(productie.simbolNeterminal, []).append(index)
+        self.productiiNeterminal[None] = [len(self.productii) - 1]
+
+        self.lungimiMinime = self._calculeazaLungimiMinime()
+        # Lungimea minimă a sufixului de la fiecare poziție a fiecărei producții (None dacă nu derivă nimic)
+        self._minimeSufix = []
+        for productie in self.productii:
+            minime = [0]
+            for simbol in reversed(productie):
+                minimSimbol = self._lungimeMinima(simbol)
+                minime.append(None if minimSimbol is None or minime[-1] is None else minime[-1] + minimSimbol)
+            self._minimeSufix.append(minime[::-1])
+
+        self.numar: Dict[object, List[int]] = {neterminal: [] for neterminal in self.productiiNeterminal}
+        self._sufixe = {}       # Dicționar {(producție, poziție): [număr de derivări pe lungimi]}
+        self._inLucru = set()
+        self._alegeriProductie = {}  # Cache {(neterminal, lungime): (producții, ponderi cumulate)}
+        self._alegeriLungime = {}    # Cache {(producție, poziție, lungime): (lungimi, ponderi cumulate)}
+        for lungime in range(lungimeMaxima + 1):
+            for neterminal in self.productiiNeterminal:
+                self._numarNeterminal(neterminal, lungime)
+
+    def _calculeazaLungimiMinime(self) -> dict:
+        """Lungimea celui mai scurt șir de terminale derivat din fiecare neterminal productiv (punct fix)."""
+        minime = {}
+        schimbat = True
+        while schimbat:
+            schimbat = False
+            for neterminal, indici in self.productiiNeterminal.items():
+                for index in indici:
+                    total = 0
+                    for simbol in self.productii[index]:
+                        minimSimbol = 1 if simbol not in self.productiiNeterminal else minime.get(simbol)
+                        if minimSimbol is None:
+                            break
+                        total += minimSimbol
+                    else:
+                        if total < minime.get(neterminal, total + 1):
+                            minime[neterminal] = total
+                            schimbat = True
+        return minime
+
+    def _lungimeMinima(self, simbol):
+        if simbol in self.productiiNeterminal:
+            return self.lungimiMinime.get(simbol)
+        return 1
+
+    def _numarSimbol(self, simbol, lungime: int) -> int:
+        if simbol in self.productiiNeterminal:
+            return self._numarNeterminal(simbol, lungime)
+        return 1 if lungime == 1 else 0
+
+    def _numarNeterminal(self, neterminal, lungime: int) -> int:
+        numere = self.numar[neterminal]
+        if lungime < len(numere):
+            return numere[lungime]
+        # Lungimile mai mici sunt deja calculate; la aceeași lungime, dependențele
+        # (producții unitare, simboluri anulabile) formează un graf aciclic, altfel gramatica e ciclică
+        if neterminal in self._inLucru:
+            raise ValueError(f"Gramatica este ciclică: {neterminal} ⇒+ {neterminal}")
+        self._inLucru.add(neterminal)
+        total = sum(self._numarSufix(index, 0, lungime) for index in self.productiiNeterminal[neterminal])
+        self._inLucru.discard(neterminal)
+        numere.append(total)
+        return total
+
+    def _numarSufix(self, index: int, pozitie: int, lungime: int) -> int:
+        """Numărul de derivări ale sufixului producției `index` de la `pozitie`, de exact `lungime` terminale."""
+        productie = self.productii[index]
+        if pozitie == len(productie):
+            return 1 if lungime == 0 else 0
+        numere = self._sufixe.setdefault((index, pozitie), [])
+        simbol = productie[pozitie]
+        minimSimbol = self._lungimeMinima(simbol)
+        minimRest = self._minimeSufix[index][pozitie + 1]
+        # Lista este completată în ordinea lungimilor, până la cea cerută
+        while len(numere) <= lungime:
+            lungimeSufix = len(numere)
+            total = 0
+            if minimSimbol is not None and minimRest is not None:
+                # Lungimile simbolului sunt limitate de lungimile minime: pentru A → a A sau
+                # A → A a, A de lungime întreagă nu este cerut; este cerut doar dacă restul,
+                # respectiv simbolul, poate fi vid, adică dacă gramatica e ciclică
+                for lungimeSimbol in range(minimSimbol, lungimeSufix - minimRest + 1):
+                    numarSimbol = self._numarSimbol(simbol, lungimeSimbol)
+                    if numarSimbol:
+                        total += numarSimbol * self._numarSufix(index, pozitie + 1, lungimeSufix - lungimeSimbol)
+            numere.append(total)
+        return numere[lungime]
+
+    def numarDerivari(self, lungime: int, neterminal=None) -> int:
+        """Numărul de derivări de exact `lungime` terminale (implicit din forma inițială)."""
+        if lungime > self.lungimeMaxima:
+            raise ValueError(f"Lungimea {lungime} depășește lungimea maximă {self.lungimeMaxima}")
+        return self.numar[neterminal][lungime]
+
+    def _alege(self, candidati: list, cumulate: list):
+        return candidati[bisect_right(cumulate, self.aleator.randrange(cumulate[-1]))]
+
+    def _alegeProductie(self, neterminal, lungime: int) -> int:
+        alegeri = self._alegeriProductie.get((neterminal, lungime))
+        if alegeri is None:
+            indici = [index for index in self.productiiNeterminal[neterminal]
+                      if self._numarSufix(index, 0, lungime)]
+            ponderi = [self._numarSufix(index, 0, lungime) for index in indici]
+            alegeri = self._alegeriProductie[(neterminal, lungime)] = (indici, list(accumulate(ponderi)))
+        return self._alege(*alegeri)
+
+    def _alegeLungime(self, index: int, pozitie: int, lungime: int) -> int:
+        alegeri = self._alegeriLungime.get((index, pozitie, lungime))
+        if alegeri is None:
+            simbol = self.productii[index][pozitie]
+            lungimi = []
+            ponderi = []
+            for lungimeSimbol in range(lungime + 1):
+                pondere = self._numarSufix(index, pozitie + 1, lungime - lungimeSimbol)
+                if pondere:
+                    pondere *= self._numarSimbol(simbol, lungimeSimbol)
+                if pondere:
+                    lungimi.append(lungimeSimbol)
+                    ponderi.append(pondere)
+            alegeri = self._alegeriLungime[(index, pozitie, lungime)] = (lungimi, list(accumulate(ponderi)))
+        return self._alege(*alegeri)
+
+    def esantion(self, lungime: int) -> str:
+        """
+        Extrage o propoziție de exact `lungime` terminale, uniform dintre derivări.
+
+        Raises:
+            ValueError: Dacă nu există nicio propoziție de această lungime
+        """
+        if not self.numarDerivari(lungime):
+            raise ValueError(f"Gramatica nu are propoziții de lungime {lungime}")
+        terminale = []
+        # Stivă explicită de simboluri de expandat, cu lungimea aleasă pentru fiecare
+        deExpandat = [(None, lungime)]
+        while deExpandat:
+            simbol, lungimeSimbol = deExpandat.pop()
+            if simbol not in self.productiiNeterminal:
+                terminale.append(simbol)
+                continue
+            index = self._alegeProductie(simbol, lungimeSimbol)
+            productie = self.productii[index]
+            ramas = lungimeSimbol
+            alese = []
+            for pozitie in range(len(productie)):
+                lungimePozitie = self._alegeLungime(index, pozitie, ramas)
+                alese.append((productie[pozitie], lungimePozitie))
+                ramas -= lungimePozitie
+            deExpandat.extend(reversed(alese))
+        return self.separator.join(terminale)
+
+    def esantioane(self, numar: int, lungimi) -> Iterator[str]:
+        """
+        Generator de `numar` propoziții. `lungimi` este o lungime fixă sau o distribuție
+        {lungime: pondere}; lungimile fără propoziții sunt ignorate din distribuție.
+        """
+        if isinstance(lungimi, int):
+            for _ in range(numar):
+                yield self.esantion(lungimi)
+            return
+        valide = [(lungime, pondere) for lungime, pondere in sorted(lungimi.items())
+                  if pondere > 0 and self.numarDerivari(lungime)]
+        if not valide:
+            raise ValueError("Distribuția nu conține nicio lungime cu propoziții")
+        valoriLungimi = [lungime for lungime, _ in valide]
+        cumulate = list(accumulate(pondere for _, pondere in valide))
+        for lungime in self.aleator.choices(valoriLungimi, cum_weights=cumulate, k=numar):
+            yield self.esantion(lungime)
+
+    def scrieCorpus(self, numeFisier: str, numar: int, lungimi, marimeBloc: int = 10000) -> int:
+        """
+        Scrie `numar` propoziții extrase (câte una pe linie) direct în fișier, pe blocuri,
+        codificate UTF-8.
+
+        Returns:
+            Numărul de octeți scriși
+        """
+        octeti = 0
+        # Fișierul este scris binar (UTF-8), ca write() să întoarcă octeți, nu caractere
+        with open(numeFisier, 'wb') as f:
+            bloc = []
+            for propozitie in self.esantioane(numar, lungimi):
+                bloc.append(propozitie)
+                if len(bloc) >= marimeBloc:
+                    octeti += f.write(('\n'.join(bloc) + '\n').encode('utf-8'))
+                    bloc = []
+            if bloc:
+                octeti += f.write(('\n'.join(bloc) + '\n').encode('utf-8'))
+        return octeti
+
+
+if __name__ == '__main__':
+    # python esantionare.py gramatica.txt corpus.txt numar lungimeMinima [lungimeMaxima]
+    from gramatica import Gramatica
+
+    numeGramatica, numeCorpus, numar, lungimeMinima = sys.argv[1], sys.argv[2], int(sys.argv[3]), int(sys.argv[4])
+    lungimeMaxima = int(sys.argv[5]) if len(sys.argv) > 5 else lungimeMinima
+    start = time.perf_counter()
+    esantionator = Esantionator(Gramatica(numeGramatica), lungimeMaxima)
+    pregatire = time.perf_counter() - start
+    start = time.perf_counter()
+    octeti = esantionator.scrieCorpus(numeCorpus, numar,
+                                      {lungime: 1 for lungime in range(lungimeMinima, lungimeMaxima + 1)})
+    durata = time.perf_counter() - start
+    print(f"Numărare: {pregatire:.2f} s; {numar} propoziții ({octeti / 1_000_000:.1f} MB) "
+          f"în {durata:.2f} s ({numar / durata:,.0f} propoziții/s)")
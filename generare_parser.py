@@ -0,0 +1,271 @@
+import sys
+import time
+from typing import List
+
+from actiuni import Binar, Copiaza, Unar
+from gramatica import Gramatica, TabelComprimat, DEPLASARE, REDUCERE, ACCEPTARE
+from simboluri import formateazaSimboluri
+
+# Numărul de valori pe linie în tablourile scrise în modulul generat
+VALORI_PE_LINIE = 20
+
+
+def _tablou(nume: str, valori) -> List[str]:
+    """Liniile unei constante array('i', (...)) din modulul generat."""
+    valori = list(valori)
+    linii = [f"{nume} = array('i', ("]
+    for i in range(0, len(valori), VALORI_PE_LINIE):
+        linii.append('    ' + ', '.join(map(str, valori[i:i + VALORI_PE_LINIE])) + ',')
+    linii.append('))')
+    return linii
+
+
+class GeneratorModul:
+    """
+    Generează, dintr-o Gramatica construită, sursa unui modul Python de sine stătător:
+    tabelul împachetat (TabelComprimat) ca tablouri constante, eventual lexerul, și
+    driverul LR specializat, cu acțiunea semantică a fiecărei producții scrisă direct
+    în ramura ei de reducere (ramurile sunt alese printr-un arbore de comparații după
+    numărul producției). Modulul generat nu importă nimic din acest proiect.
+
+    Sunt generate patru variante ale buclei: pe caractere sau pe tokeni (terminal, lexem),
+    fiecare cu sau fără cod intermediar; varianta fără cod nu mai ține stiva de atribute.
+    """
+    def __init__(self, gramatica: Gramatica):
+        """
+        Raises:
+            ValueError: Dacă o producție are o acțiune care nu este predefinită
+                (Copiaza, Binar, Unar), deci nu poate fi scrisă în modul
+        """
+        self.gramatica = gramatica
+        self.tabel = TabelComprimat.dinTabel(gramatica.tabel)
+        self.actiuni = gramatica.registruActiuni.actiuni
+        for index, actiune in enumerate(self.actiuni):
+            if actiune is not None and type(actiune) not in (Copiaza, Binar, Unar):
+                productie = gramatica.listaProductii[index]
+                raise ValueError(f"Acțiunea producției {productie.simbolNeterminal}->"
+                                 f"{formateazaSimboluri(productie.sirInlocuire, gramatica.separator)} "
+                                 f"nu este predefinită și nu poate fi generată: {actiune!r}")
+
+    def sursa(self) -> str:
+        """Textul complet al modulului generat."""
+        tabel = self.tabel
+        gramatica = self.gramatica
+        baza, verificare, valori, implicit = tabel.structuriDriver()
+        nrTerminale = tabel.coloanaSfarsit + 1
+        linii = [
+            '"""',
+            f"Parser {gramatica.mod} generat pentru gramatica cu simbolul de start {gramatica.simbolStart}",
+            f"({len(gramatica.listaProductii)} producții, {tabel.nrStari} stări), de generare_parser.py.",
+            "Nu depinde de codul de construcție; nu se editează manual, ci se regenerează.",
+            "",
+            "parseaza(text) -> bool; traduce(text) -> lista de quadruple (op, arg1, arg2, rezultat)",
+            "sau None dacă textul este respins; cod_intermediar(text) -> instrucțiunile ca text.",
+        ]
+        if tabel.separator and gramatica.lexer is None:
+            linii.append("Fără lexer, terminalele textului sunt separate prin spații.")
+        linii += [
+            '"""',
+            'import re',
+            'from array import array',
+            'from itertools import chain',
+            '',
+            f'COLOANE = {tuple(tabel.coloane)!r}',
+            f'INDEX_COLOANA = {dict((simbol, i) for i, simbol in enumerate(tabel.coloane[:nrTerminale]))!r}',
+            f'NR_TERMINALE = {nrTerminale}',
+            f'NR_STARI = {tabel.nrStari}',
+            "SFARSIT = ('$', '$')",
+            "SFARSIT_TOKENI = (('$', '$'), ('$', '$'))",
+            '',
+        ]
+        linii += _tablou('BAZA', baza)
+        linii += _tablou('VERIFICARE', verificare)
+        linii += _tablou('VALORI', valori)
+        linii += _tablou('IMPLICIT', implicit)
+        linii.append('')
+        linii += self._sursaLexer()
+        linii += [
+            '',
+            'def formateaza(quad) -> str:',
+            '    op, arg1, arg2, rezultat = quad',
+            '    if arg2 is None:',
+            "        return f'{rezultat} := {op} {arg1}'",
+            "    return f'{rezultat} := {arg1} {op} {arg2}'",
+            '',
+        ]
+        for peTokeni in (False, True):
+            for cuCod in (False, True):
+                linii += self._sursaDriver(peTokeni, cuCod)
+                linii.append('')
+        linii += [
+            'def parseaza(text) -> bool:',
+            '    """True dacă textul este acceptat."""',
+            '    return _recunoasteTokeni(tokenizeaza(text)) if LEXER else _recunoaste(text)',
+            '',
+            'def traduce(text):',
+            '    """Quadruplele codului intermediar sau None dacă textul este respins."""',
+            '    cod = []',
+            '    acceptat = _traduceTokeni(tokenizeaza(text), cod) if LEXER else _traduce(text, cod)',
+            '    return cod if acceptat else None',
+            '',
+            'def parseazaTokeni(tokeni) -> bool:',
+            '    """True dacă secvența de tokeni (terminal, lexem) este acceptată."""',
+            '    return _recunoasteTokeni(tokeni)',
+            '',
+            'def traduceTokeni(tokeni):',
+            '    cod = []',
+            '    return cod if _traduceTokeni(tokeni, cod) else None',
+            '',
+            'def cod_intermediar(text):',
+            '    cod = traduce(text)',
+            '    return None if cod is None else [formateaza(quad) for quad in cod]',
+            '',
+        ]
+        return '\n'.join(linii)
+
+    def _sursaLexer(self) -> List[str]:
+        lexer = self.gramatica.lexer
+        if lexer is None:
+            return ['LEXER = False', '', 'def tokenizeaza(text):',
+                    "    raise ValueError('Parserul a fost generat fără lexer')"]
+        return [
+            'LEXER = True',
+            f'MASTER = re.compile({lexer.master.pattern!r}, re.DOTALL)',
+            f'TERMINAL_PE_GRUP = {tuple(lexer.terminalPeGrup)!r}',
+            f'INDEX_EROARE = {lexer.indexEroare}',
+            '',
+            'def tokenizeaza(text):',
+            '    """Generator de tokeni (terminal, lexem); la un caracter nerecunoscut produce (None, caracter)."""',
+            '    for potrivire in MASTER.finditer(text):',
+            '        grup = potrivire.lastindex',
+            '        if grup is None:',
+            '            return',
+            '        if grup == INDEX_EROARE:',
+            '            yield None, potrivire.group(grup)',
+            '            return',
+            '        yield TERMINAL_PE_GRUP[grup], potrivire.group(grup)',
+        ]
+
+    def _sursaDriver(self, peTokeni: bool, cuCod: bool) -> List[str]:
+        nume = ('_traduce' if cuCod else '_recunoaste') + ('Tokeni' if peTokeni else '')
+        linii = [
+            f"def {nume}({'tokeni' if peTokeni else 'text'}{', cod' if cuCod else ''}):",
+            '    baza = BAZA',
+            '    verificare = VERIFICARE',
+            '    valori = VALORI',
+            '    implicit = IMPLICIT',
+            '    index = INDEX_COLOANA.get',
+            '    stari = [0]',
+        ]
+        if cuCod:
+            linii += ['    atribute = []', '    adauga = cod.append', '    temp = 0']
+        if peTokeni:
+            linii += ['    for terminal, valoare in chain(tokeni, SFARSIT_TOKENI):',
+                      '        coloana = index(terminal, NR_TERMINALE)']
+        else:
+            # Cu simboluri de mai multe caractere, terminalele textului sunt cuvintele lui
+            intrare = 'text.split()' if self.tabel.separator else 'text'
+            linii += [f'    for valoare in chain({intrare}, SFARSIT):',
+                      '        coloana = index(valoare, NR_TERMINALE)']
+        linii += [
+            '        if coloana == NR_TERMINALE:',
+            '            return False',
+        ]
+        productii = [index for index, coloana in enumerate(self.tabel.coloaneStanga) if coloana >= 0]
+        if any(self.tabel.lungimiProductii[index] == 0 for index in productii):
+            # Ca în ParserPush._consuma: peste NR_STARI reduceri epsilon fără deplasare, driverul ar cicla
+            linii.append('        limita = len(stari) + NR_STARI')
+        linii += [
+            '        while True:',
+            '            stare = stari[-1]',
+            '            b = baza[stare]',
+            '            actiune = valori[b + coloana] if verificare[b + coloana] == b else implicit[stare]',
+            '            tip = actiune & 3',
+            f'            if tip == {DEPLASARE}:',
+            '                stari.append(actiune >> 2)',
+        ]
+        if cuCod:
+            linii.append('                atribute.append(valoare)')
+        linii += [
+            '                break',
+            f'            if tip == {REDUCERE}:',
+            '                p = actiune >> 2',
+        ]
+        linii += self._arboreReduceri(productii, cuCod, 4)
+        linii += [
+            f'            elif tip == {ACCEPTARE}:',
+            '                return True',
+            '            else:',
+            '                return False',
+            '    return False',
+        ]
+        return linii
+
+    def _arboreReduceri(self, productii: List[int], cuCod: bool, nivel: int) -> List[str]:
+        """Ramurile de reducere, alese prin comparații binare după numărul producției p."""
+        indent = '    ' * nivel
+        if len(productii) == 1:
+            return self._reducere(productii[0], cuCod, nivel)
+        mijloc = len(productii) // 2
+        return ([f'{indent}if p < {productii[mijloc]}:']
+                + self._arboreReduceri(productii[:mijloc], cuCod, nivel + 1)
+                + [f'{indent}else:']
+                + self._arboreReduceri(productii[mijloc:], cuCod, nivel + 1))
+
+    def _reducere(self, index: int, cuCod: bool, nivel: int) -> List[str]:
+        """Codul reducerii cu producția `index`: acțiunea, scoaterea părții drepte și goto."""
+        indent = '    ' * nivel
+        productie = self.gramatica.listaProductii[index]
+        lungime = self.tabel.lungimiProductii[index]
+        coloana = self.tabel.coloaneStanga[index]
+        actiune = self.actiuni[index]
+        linii = [f'{indent}# {productie.simbolNeterminal}->'
+                 f'{formateazaSimboluri(productie.sirInlocuire, self.gramatica.separator)}'
+                 + (f' => {actiune!r}' if actiune is not None else '')]
+
+        # Copierea primului simbol dintr-o producție unitară lasă stivele pe loc, doar starea se schimbă
+        unitara = lungime == 1 and (not cuCod or (isinstance(actiune, Copiaza) and actiune.index == 0))
+        if not lungime:
+            linii += [f'{indent}if len(stari) > limita:', f'{indent}    return False']
+        if cuCod and not unitara:
+            if isinstance(actiune, Copiaza):
+                linii.append(f'{indent}valoare = atribute[{actiune.index - lungime}]')
+            elif isinstance(actiune, Binar):
+                linii += [f'{indent}temp += 1',
+                          f"{indent}valoare = 't%d' % temp",
+                          f'{indent}adauga(({actiune.operator!r}, atribute[{actiune.stanga - lungime}], '
+                          f'atribute[{actiune.dreapta - lungime}], valoare))']
+            elif isinstance(actiune, Unar):
+                linii += [f'{indent}temp += 1',
+                          f"{indent}valoare = 't%d' % temp",
+                          f'{indent}adauga(({actiune.operator!r}, atribute[{actiune.index - lungime}], None, valoare))']
+            else:
+                linii.append(f'{indent}valoare = None')
+            if lungime:
+                linii.append(f'{indent}del atribute[-{lungime}:]')
+            linii.append(f'{indent}atribute.append(valoare)')
+
+        if unitara:
+            linii.append(f'{indent}b = baza[stari[-2]]')
+        else:
+            if lungime:
+                linii.append(f'{indent}del stari[-{lungime}:]')
+            linii.append(f'{indent}b = baza[stari[-1]]')
+        linii += [f'{indent}salt = valori[b + {coloana}]',
+                  f'{indent}if not salt or verificare[b + {coloana}] != b:',
+                  f'{indent}    return False',
+                  f'{indent}stari[-1] = salt >> 2' if unitara else f'{indent}stari.append(salt >> 2)']
+        return linii
+
+    def scrie(self, numeFisier: str):
+        with open(numeFisier, 'w') as f:
+            f.write(self.sursa())
+
+
+if __name__ == '__main__':
+    # python generare_parser.py gramatica.txt parser_generat.py [lexer.lex] (implicit fără lexer)
+    numeGramatica, numeModul = sys.argv[1], sys.argv[2]
+    start = time.perf_counter()
+    gramatica = Gramatica(numeGramatica, fisierLexer=sys.argv[3] if len(sys.argv) > 3 else None)
+    GeneratorModul(gramatica).scrie(numeModul)
+    print(f"{numeModul}: generat în {time.perf_counter() - start:.2f} s")
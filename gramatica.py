@@ -1,72 +1,81 @@
-from typing import List, Set
+import os
+import tempfile
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Optional, Set
 
-class GeneratorCodIntermediar:
-    """
-    Gestionează generarea de cod intermediar și variabile temporare.
-    """
-    def __init__(self):
-        self.contor_temp = 0
-        self.cod_intermediar = []
-    
-    def newtemp(self):
-        """
-        Generează și returnează o nouă variabilă temporară.
-        Returns: string de forma 't1', 't2', etc.
-        """
-        self.contor_temp += 1
-        return f't{self.contor_temp}'
-    
-    def emit(self, instructiune):
-        """
-        Emite (adaugă) o instrucțiune de cod intermediar.
-        Args:
-            instructiune: string cu instrucțiunea (ex: "t1 := a + b")
-        """
-        self.cod_intermediar.append(instructiune)
-    
-    def afiseaza_cod_intermediar(self):
-        """
-        Afișează tot codul intermediar generat.
-        """
-        print("Cod Intermediar Generat:")
-        for i, instructiune in enumerate(self.cod_intermediar, 1):
-            print(f"{i}. {instructiune}")
-    
-    def reseteaza(self):
-        """
-        Resetează generatorul pentru o nouă parsare.
-        """
-        self.contor_temp = 0
-        self.cod_intermediar = []
+import cache_tabel
+from actiuni import RegistruActiuni
+from arbore import FARA, ArboreSintaxa
+from cod_intermediar import GeneratorCodIntermediar
+from instrumentare import Statistici
+from lexer import Lexer
+from simboluri import citesteSimboluri, formateazaSimboluri, separatorSimboluri
+
+# Versiunea generatorului de tabele; intră în cheia cache-ului, deci trebuie
+# incrementată la orice schimbare în construcția tabelului
+VERSIUNE_GENERATOR = 2
+
+# Modurile de calcul al reducerilor în tabelul ACTION
+MOD_SLR = 'SLR'    # anticipări din FOLLOW(A) global
+MOD_LALR = 'LALR'  # anticipări LALR(1) pe automatonul LR(0), prin propagare DeRemer–Pennello
+
+# Tipurile de acțiuni din tabelul compilat (ocupă cei 2 biți de jos ai unei celule)
+EROARE = 0
+DEPLASARE = 1
+REDUCERE = 2
+ACCEPTARE = 3
 
+# Codul de simbol din simbolDupaItem pentru itemii finali (punctul la sfârșitul producției)
+FARA_SIMBOL = -1
 
 class Item:
     """
     Reprezintă un item LR(0) - o regulă gramaticală cu un punct care indică poziția în parsare.
     De exemplu, E → E • + B indică faptul că am recunoscut E și așteptăm + B în continuare.
+    Itemii sunt internați de Gramatica: fiecare (producție, poziție punct) are un singur
+    obiect și un cod întreg dens, folosit de seturile de itemi.
     """
-    def __init__(self, productie, pozitiePunct):
+    __slots__ = ('productie', 'pozitiePunct', 'cod')
+    
+    def __init__(self, productie, pozitiePunct, cod: int = None):
         """
         Inițializează un item LR(0).
         
         Args:
             productie: Un obiect Productie care conține regula gramaticală
-            pozitiePunct: Poziția întreagă a punctului (0 până la len(sirInlocuire))
+            pozitiePunct: Poziția întreagă a punctului (0 până la numărul de simboluri din dreapta)
+            cod: Codul întreg al itemului internat (None pentru itemi neinternați)
         """
-        self.simbolNeterminal = productie.simbolNeterminal
-        self.sirInlocuire = productie.sirInlocuire
+        self.productie = productie
         self.pozitiePunct = pozitiePunct
-        
-        # Generează reprezentarea string cu punct
-        self.sirCuPunct = self.sirInlocuire[:pozitiePunct] + '.' + self.sirInlocuire[pozitiePunct:]
+        self.cod = cod
+    
+    @property
+    def simbolNeterminal(self):
+        return self.productie.simbolNeterminal
+    
+    @property
+    def sirInlocuire(self):
+        return self.productie.sirInlocuire
+    
+    @property
+    def idProductie(self):
+        return self.productie.index
+    
+    @property
+    def sirCuPunct(self):
+        """Reprezentarea string cu punct, construită doar la cerere."""
+        simboluri = self.sirInlocuire
+        return separatorSimboluri(simboluri).join(
+            (*simboluri[:self.pozitiePunct], '.', *simboluri[self.pozitiePunct:]))
     
     def esteFinal(self):
         """Verifică dacă punctul este la sfârșit (item de reducere)."""
-        return self.pozitiePunct >= len(self.sirInlocuire)
-    
-    def esteInitial(self):
-        """Verifică dacă punctul este la început."""
-        return self.pozitiePunct == 0
+        return self.pozitiePunct >= len(self.productie.sirInlocuire)
     
     def simbolDupaPunct(self):
         """
@@ -75,16 +84,7 @@ class Item:
         """
         if self.esteFinal():
             return None
-        return self.sirInlocuire[self.pozitiePunct]
-    
-    def avansare(self, productie):
-        """
-        Creează un nou item cu punctul avansat cu o poziție.
-        Folosit când se deplasează un simbol pe stivă.
-        """
-        if self.esteFinal():
-            return None
-        return Item(productie, self.pozitiePunct + 1)
+        return self.productie.sirInlocuire[self.pozitiePunct]
     
     def __str__(self):
         """Reprezentarea string a item-ului."""
@@ -108,36 +108,42 @@ class Item:
 class SetItemi:
     """
     Reprezintă un set de itemi LR(0) - o stare în automatonul LR.
-    Fiecare set conține mai mulți itemi (kernel + closure).
+    Itemii sunt ținuți ca tupluri sortate de coduri de itemi internați: nucleul (kernel)
+    identifică starea, iar coduri conține kernel + closure.
+    Egalitatea și hash-ul (calculat o singură dată) folosesc doar nucleul.
     """
-    def __init__(self, itemi: Set[Item] = None, id_set: int = None):
+    __slots__ = ('nucleu', 'coduri', 'id', 'itemiInternati', '_hash')
+    
+    def __init__(self, nucleu: tuple, coduri: tuple, itemiInternati: List[Item], id_set: int = None):
         """
         Inițializează un set de itemi.
         
         Args:
-            itemi: Setul de itemi (kernel + closure)
+            nucleu: Codurile sortate ale itemilor din kernel
+            coduri: Codurile sortate ale tuturor itemilor (kernel + closure)
+            itemiInternati: Tabelul de itemi internați al gramaticii (cod -> Item)
             id_set: ID-ul unic al acestui set (stare)
         """
-        self.itemi = itemi if itemi is not None else set()
+        self.nucleu = nucleu
+        self.coduri = coduri
+        self.itemiInternati = itemiInternati
         self.id = id_set
+        self._hash = hash(nucleu)
     
-    def adaugaItem(self, item: Item):
-        """Adaugă un item în set."""
-        self.itemi.add(item)
-    
-    def contineItem(self, item: Item) -> bool:
-        """Verifică dacă setul conține deja itemul."""
-        return item in self.itemi
+    @property
+    def itemi(self) -> List[Item]:
+        """Itemii setului (kernel + closure) ca obiecte Item."""
+        itemiInternati = self.itemiInternati
+        return [itemiInternati[cod] for cod in self.coduri]
     
     def __eq__(self, other):
-        """Două seturi sunt egale dacă conțin aceiași itemi."""
+        """Două stări sunt egale dacă au același kernel (closure-ul este determinat de el)."""
         if not isinstance(other, SetItemi):
             return False
-        return self.itemi == other.itemi
+        return self.nucleu == other.nucleu
     
     def __hash__(self):
-        """Face setul hashable pentru utilizare în dicționare și seturi."""
-        return hash(frozenset(self.itemi))
+        return self._hash
     
     def __str__(self):
         """Reprezentarea string a setului de itemi."""
@@ -150,47 +156,178 @@ class SetItemi:
         return rezultat
     
     def __repr__(self):
-        return f"SetItemi(id={self.id}, {len(self.itemi)} itemi)"
+        return f"SetItemi(id={self.id}, {len(self.coduri)} itemi)"
+
+
+def fisierAsociat(numeFisierGramatica: str, extensie: str) -> Optional[str]:
+    """
+    Fișierul de lângă gramatică cu același nume și extensia dată (ex. gramatica.act,
+    gramatica.lex pentru gramatica.txt), dacă există; altfel None.
+    """
+    cale = os.path.splitext(numeFisierGramatica)[0] + extensie
+    return cale if os.path.exists(cale) else None
+
 
 class Gramatica:
-    def __init__(self, numeFisier: str):
+    def __init__(self, numeFisier: str, fisierTabel: str = None, directorCache: str = None,
+                 fisierLexer=None, mod: str = MOD_SLR, comprimaTabel: bool = False,
+                 minimizeaza: bool = False, statistici: Statistici = None, fisierActiuni=None):
+        """
+        Citește gramatica și construiește tabelul de parsare compilat.
+
+        Args:
+            numeFisier: Fișierul cu gramatica
+            fisierTabel: Dacă este dat, tabelul este exportat și în format text
+            directorCache: Dacă este dat, tabelul compilat este încărcat din (sau salvat în)
+                cache-ul binar din acest director, cu cheia dată de conținutul gramaticii
+            fisierLexer: Declarațiile lexerului (ex. gramatica.lex); True = fișierul .lex de
+                lângă gramatică; implicit fără lexer. Cu lexer, intrarea
+                este tokenizată, iar lexemele devin place values
+            mod: MOD_SLR sau MOD_LALR - cum se calculează anticipările pentru reduceri
+            comprimaTabel: Dacă este True, parserul folosește TabelComprimat (reduceri implicite,
+                rânduri deduplicate, împachetare prin deplasarea rândurilor) în locul tabelului dens
+            minimizeaza: Dacă este True, stările cu comportament identic sunt unite înainte
+                de compilarea tabelului (vezi minimizeazaStari)
+            statistici: Dacă este dat, obiectul Statistici completat la construcție și la
+                fiecare verificaSir; fără el nu se colectează nimic
+            fisierActiuni: Declarațiile acțiunilor semantice; implicit fișierul .act de lângă
+                gramatică (ex. gramatica.act), dacă există, altfel traducerea implicită a
+                expresiilor E/T/F (ACTIUNI_IMPLICITE), pentru producțiile ei prezente în
+                gramatică; False = fără acțiuni. Alte acțiuni pot fi adăugate cu inregistreazaActiune
+        """
+        if mod not in (MOD_SLR, MOD_LALR):
+            raise ValueError(f"Mod de construcție necunoscut: {mod}")
+        self.mod = mod
+        self.comprimaTabel = comprimaTabel
+        self.minimizeaza = minimizeaza
+        self.statistici = statistici
         self.listaNeterminale = []
         self.listaTerminale = []
         self.simbolStart = ""
         self.listaProductii = []
-        self.tabel = None
+        self.tabel = None  # TabelCompilat dens (export, cache, inspecție)
+        self.tabelParsare = None  # Tabelul folosit de driver: self.tabel sau varianta comprimată
+        self.simboluri = []  # Numele simbolurilor, după cod: terminalele, apoi neterminalele
+        self.idSimbol = {}  # Dicționar {simbol: cod întreg}, vezi indexeazaProductii
+        self.nrTerminale = 0  # Codurile mai mici sunt terminale, celelalte neterminale
+        self.separator = ''  # ' ' dacă simbolurile au mai multe caractere (vezi separatorSimboluri)
         self.seturiItemi = []  # Lista de SetItemi (stările automatonului LR)
-        self.tranzitii = {}  # Dicționar {(id_set, simbol): id_set_destinație}
-        self.tabelAction = {}  # Dicționar {(stare, terminal): acțiune}
-        self.tabelGoto = {}  # Dicționar {(stare, neterminal): stare_nouă}
+        self.tranzitii = {}  # Dicționar {(id_set, cod simbol): id_set_destinație}
+        self.tabelAction = {}  # Dicționar {(stare, cod terminal): acțiune}
+        self.tabelGoto = {}  # Dicționar {(stare, cod neterminal): stare_nouă}
         self.first = {}  # Dicționar {neterminal: set(terminali)}
         self.follow = {}  # Dicționar {neterminal: set(terminali)}
+        self.firstBiti = []  # FIRST ca bitset-uri peste listaTerminale, indexate după listaNeterminale
+        self.followBiti = []  # FOLLOW ca bitset-uri, la fel
+        self.bitTerminal = {}  # Dicționar {terminal: bitul lui în bitset-uri}
+        self.indexNeterminal = {}  # Dicționar {neterminal: poziția în listaNeterminale}
+        self.anulabile = set()  # Neterminalele care pot deriva șirul vid
+        self.anulabil = bytearray()  # La fel, ca indicator pentru fiecare cod de simbol
+        self.anticipari = {}  # LALR: Dicționar {(stare, număr regulă): bitset de terminale}
+        self.conflicte = []  # Lista de (stare, terminal, acțiune păstrată, acțiune respinsă)
+        self.clasaStare = []  # După minimizare: starea nouă pentru fiecare stare a automatonului inițial
+        self.productiiSimbol = []  # Pentru fiecare cod de simbol: [index producție] (gol pentru terminale)
+        self.productiiNeterminal = {}  # Dicționar {neterminal: [index producție]}, aceleași liste
+        self.closureNeterminal = {}  # Cache {cod neterminal: tuplu de coduri ale itemilor B → • γ}
+        self.itemiInternati = []  # Lista de Item, indexată după codul itemului
+        self.bazaItem = []  # Codul itemului cu punctul la început, pentru fiecare producție
+        self.simbolDupaItem = array('i')  # Codul simbolului după punct pentru fiecare item (FARA_SIMBOL dacă e final)
+        self.aparitiiSimbol = []  # Pentru fiecare cod de simbol: [(index producție, poziție în partea dreaptă)]
         self.generator = GeneratorCodIntermediar()  # Generator pentru cod intermediar
-        self.citesteGramaticaDinFisier(numeFisier)
-        self.genereazaTabel("tabel_generat_" + numeFisier)
+        self.lexer = None  # Lexer opțional; fără el fiecare caracter este un terminal
+        self.registruActiuni = None  # RegistruActiuni: acțiunile semantice indexate după producție
+        self.dinCache = False  # True dacă tabelul a fost încărcat din cache (fără automaton)
+        self.durateFaze = {}  # Dicționar {fază a genereazaTabel: durată în secunde}
+        self.arbore = None  # ArboreSintaxa al ultimului verificaSir cu construiesteArbore=True
         
-        try:
-            self.tabel = TabelGramatica("tabel_generat_" + numeFisier)
-        except Exception as e:
-            print(f"Eroare la citirea tabelului: {e}")
+        if directorCache is not None:
+            with open(numeFisier, 'rb') as f:
+                optiuni = mod + ('+min' if minimizeaza else '')
+                cheie = cache_tabel.cheieCache(f.read(), VERSIUNE_GENERATOR, optiuni)
+            caleCache = cache_tabel.caleCache(directorCache, numeFisier, cheie, optiuni)
+            self.dinCache = self.incarcaDinCache(caleCache, cheie)
+        
+        if self.dinCache:
+            if fisierTabel is not None:
+                self.scrieTabelInFisier(fisierTabel)
+        else:
+            self.citesteGramaticaDinFisier(numeFisier)
+            self.genereazaTabel(fisierTabel)
+            if directorCache is not None:
+                self.salveazaInCache(caleCache, cheie)
+        
+        self.separator = separatorSimboluri(self.coloaneTabel())
+        # Lexerul schimbă ce acceptă gramatica, deci este folosit doar la cerere;
+        # fisierLexer=True îl ia din fișierul .lex de lângă gramatică
+        if fisierLexer is True:
+            fisierLexer = os.path.splitext(numeFisier)[0] + '.lex'
+        if fisierLexer:
+            self.lexer = Lexer.dinFisier(fisierLexer, self.listaTerminale)
         
-    def genereazaTabel(self, numeFisier: str):
+        # Acțiunile sunt căutate implicit lângă gramatică, în fișierul .act
+        self.registruActiuni = RegistruActiuni(self.listaProductii)
+        if fisierActiuni is None:
+            fisierActiuni = fisierAsociat(numeFisier, '.act')
+            if fisierActiuni is None:
+                self.registruActiuni.incarcaImplicite()
+        if fisierActiuni:
+            self.registruActiuni.incarcaDinFisier(fisierActiuni)
+    
+    def inregistreazaActiune(self, productie, actiune):
+        """
+        Asociază o acțiune semantică unei producții.
+        
+        Args:
+            productie: Numărul producției (index în listaProductii) sau textul ei, ex. 'E->E+T'
+            actiune: Funcție f(valori, generator) -> place value, unde valori sunt place values
+                ale părții drepte în ordine; None elimină acțiunea
+        """
+        self.registruActiuni.inregistreaza(productie, actiune)
+    
+    def genereazaTabel(self, numeFisier: str = None):
         """
         Generează tabelul de parsare LR.
         1. Augmentează gramatica (S' → S)
         2. Construiește itemii LR(0)
         3. Calculează closure și goto pentru stări
         4. Generează tabelul ACTION și GOTO
+        5. Opțional, unește stările echivalente (minimizare)
+        6. Compilează tabelul în rânduri dense de întregi (opțional îl exportă în fișier)
+        Durata fiecărei faze este păstrată în self.durateFaze.
         """
-        # Pasul 1: Augmentează gramatica
-        self.augmenteazaGramatica()
-        # Pasul 2: Calculează FIRST și FOLLOW pentru SLR
-        self.calculeazaFirst()
-        self.calculeazaFollow()
-        # Pasul 3: Generează seturile de itemi
-        self.genereazaSetItemi()
-        self.construiesteTabel()
-        self.scrieTabelInFisier(numeFisier)
+        faze = [
+            # Pasul 1: Augmentează gramatica și indexează producțiile
+            ('augmentare', self.augmenteazaGramatica),
+            ('indexare', self.indexeazaProductii),
+            # Pasul 2: Calculează NULLABLE, FIRST și FOLLOW
+            ('anulabile', self.calculeazaAnulabile),
+            ('cicluri', self.verificaCicluri),
+            ('first', self.calculeazaFirst),
+            ('follow', self.calculeazaFollow),
+            # Pasul 3: Generează seturile de itemi
+            ('seturiItemi', self.genereazaSetItemi),
+        ]
+        # Pasul 4: Pentru LALR, calculează anticipările pe automatonul LR(0)
+        if self.mod == MOD_LALR:
+            faze.append(('anticipariLALR', self.calculeazaAnticipariLALR))
+        faze.append(('actionGoto', self.construiesteTabel))
+        # Pasul 5: Minimizarea are nevoie de reduceri, deci rulează pe tabelele ACTION/GOTO
+        if self.minimizeaza:
+            faze.append(('minimizare', self.minimizeazaStari))
+        faze.append(('compilare', self.compileazaTabel))
+        if numeFisier is not None:
+            faze.append(('scriereTabel', lambda: self.scrieTabelInFisier(numeFisier)))
+        
+        self.durateFaze = {}
+        for nume, faza in faze:
+            inceput = self.statistici.incepeFaza() if self.statistici is not None else None
+            start = time.perf_counter()
+            faza()
+            self.durateFaze[nume] = time.perf_counter() - start
+            if self.statistici is not None:
+                self.statistici.inregistreazaFaza(nume, self.durateFaze[nume], inceput)
+        if self.statistici is not None:
+            self.statistici.inregistreazaConstructie(len(self.seturiItemi))
         
     def construiesteTabel(self):
         """
@@ -199,54 +336,65 @@ class Gramatica:
         self.construiesteTabelAction()
         self.construiesteTabelGoto()
     
-    def construiesteTabelAction(self):
+    def construiesteTabelAction(self, seturi=None):
         """
         Construiește tabelul ACTION pentru parserul LR(0).
         Tabelul conține acțiuni shift, reduce și accept pentru fiecare combinație (stare, terminal).
+        Reducerile folosesc FOLLOW(A) în modul SLR și anticipările LALR(1) în modul LALR.
+        La conflict se păstrează acțiunea existentă (shift înaintea reduce), iar conflictul
+        este înregistrat în self.conflicte.
+        
+        Args:
+            seturi: Stările (SetItemi) ale căror rânduri sunt construite; implicit toate
         """
+        simbolDupaItem = self.simbolDupaItem
+        itemiInternati = self.itemiInternati
+        nrTerminale = self.nrTerminale
+        sfarsit = self.idSimbol['$']
+        
         # Iterează prin toate seturile de itemi (stările)
-        for setItemi in self.seturiItemi:
+        for setItemi in (self.seturiItemi if seturi is None else seturi):
             indexSet = setItemi.id
             
             # Prima trecere: adaugă acțiunile shift daca itemul nu este final iar simbolul dupa punct este terminal 
             # si exista tranzitie pentru el din starea curenta
-            for item in setItemi.itemi:
-                if not item.esteFinal():
-                    # Item ne-final: A → α • X β
-                    # Verifică dacă există tranziție cu un terminal
-                    simbolDupaPunct = item.simbolDupaPunct()
-                    if simbolDupaPunct and simbolDupaPunct in self.listaTerminale:
-                        # Există tranziție cu terminal -> shift
-                        if (indexSet, simbolDupaPunct) in self.tranzitii:
-                            indexSetDestinatie = self.tranzitii[(indexSet, simbolDupaPunct)]
-                            self.tabelAction[(indexSet, simbolDupaPunct)] = f'd{indexSetDestinatie}'
+            for cod in setItemi.coduri:
+                simbolDupaPunct = simbolDupaItem[cod]
+                # Item ne-final: A → α • X β, cu X terminal (cod sub nrTerminale) -> shift
+                if 0 <= simbolDupaPunct < nrTerminale:
+                    if (indexSet, simbolDupaPunct) in self.tranzitii:
+                        indexSetDestinatie = self.tranzitii[(indexSet, simbolDupaPunct)]
+                        self.tabelAction[(indexSet, simbolDupaPunct)] = f'd{indexSetDestinatie}'
             
             # A doua trecere: adaugă acțiunile reduce (doar unde nu există shift)
-            for item in setItemi.itemi:
-                if item.esteFinal():
-                    # Item final: A → w •
+            for cod in setItemi.coduri:
+                if simbolDupaItem[cod] == FARA_SIMBOL:
+                    # Item final: A → w •; numărul regulii (index în listaProductii) este purtat de item
+                    item = itemiInternati[cod]
+                    numarRegula = item.idProductie
                     
-                    # Găsește numărul regulii (index în listaProductii)
-                    numarRegula = None
-                    for idx, productie in enumerate(self.listaProductii):
-                        if (productie.simbolNeterminal == item.simbolNeterminal and 
-                            productie.sirInlocuire == item.sirInlocuire):
-                            numarRegula = idx
-                            break
-                    
-                    if numarRegula is not None:
-                        if numarRegula == 0:
-                            # Regula augmentată S' → S$ •
-                            # Adaugă accept pentru simbolul '$'
-                            self.tabelAction[(indexSet, '$')] = 'acc'
+                    if numarRegula == 0:
+                        # Regula augmentată S' → S$ •
+                        # Adaugă accept pentru simbolul '$'
+                        self.tabelAction[(indexSet, sfarsit)] = 'acc'
+                    else:
+                        # Reducere cu regula m (m > 0)
+                        # SLR: doar pentru terminalii din FOLLOW(A); LALR: anticipările itemului în această stare
+                        if self.mod == MOD_LALR:
+                            anticipari = self.anticipari.get((indexSet, numarRegula), 0)
                         else:
-                            # Reducere cu regula m (m > 0) - SLR
-                            # Adaugă reduce doar pentru terminalii din FOLLOW(A)
-                            neterminal = item.simbolNeterminal
-                            followSet = self.follow.get(neterminal, set())
-                            for terminal in followSet:
-                                if (indexSet, terminal) not in self.tabelAction:
-                                    self.tabelAction[(indexSet, terminal)] = f'r{numarRegula}'
+                            anticipari = self.followBiti[item.productie.idStanga - nrTerminale]
+                        reducere = f'r{numarRegula}'
+                        # Bitul i al anticipărilor este terminalul cu codul i
+                        while anticipari:
+                            bitJos = anticipari & -anticipari
+                            anticipari ^= bitJos
+                            terminal = bitJos.bit_length() - 1
+                            existenta = self.tabelAction.get((indexSet, terminal))
+                            if existenta is None:
+                                self.tabelAction[(indexSet, terminal)] = reducere
+                            elif existenta != reducere:
+                                self.conflicte.append((indexSet, self.simboluri[terminal], existenta, reducere))
     
     def construiesteTabelGoto(self):
         """
@@ -255,12 +403,143 @@ class Gramatica:
         """
         # Copiază tranzițiile cu neterminale în tabelul GOTO
         for (stare, simbol), stareDestinație in self.tranzitii.items():
-            if simbol in self.listaNeterminale:
+            if simbol >= self.nrTerminale:
                 self.tabelGoto[(stare, simbol)] = stareDestinație
     
+    def minimizeazaStari(self) -> int:
+        """
+        Unește stările echivalente comportamental prin rafinarea partițiilor (Moore):
+        două stări rămân în același bloc cât timp au aceleași reduceri/accept pe aceleași
+        coloane și tranzițiile lor pe fiecare simbol duc în același bloc.
+        Driverul citește doar rândurile tabelului, deci parsarea nu se schimbă.
+        Rescrie tranzitii, tabelAction, tabelGoto, seturiItemi (rămâne setul primei stări
+        din fiecare bloc), anticipari și conflicte; self.clasaStare păstrează corespondența.
+        
+        Returns:
+            Numărul de stări eliminate
+        """
+        nrStari = len(self.seturiItemi)
+        iesiri = [[] for _ in range(nrStari)]
+        for (stare, simbol), destinatie in self.tranzitii.items():
+            iesiri[stare].append((simbol, destinatie))
+        for iesire in iesiri:
+            iesire.sort()
+        
+        # Partiția inițială: reducerile și accept-ul, plus simbolurile cu tranziție
+        reduceri = [[] for _ in range(nrStari)]
+        for (stare, terminal), actiune in self.tabelAction.items():
+            if actiune[0] != 'd':
+                reduceri[stare].append((terminal, actiune))
+        semnaturi = [(tuple(sorted(reduceri[stare])), tuple(simbol for simbol, _ in iesiri[stare]))
+                     for stare in range(nrStari)]
+        clasa = self._numeroteazaBlocuri(semnaturi)
+        
+        # Rafinare până la punct fix: semnătura include blocurile destinațiilor
+        while True:
+            semnaturi = [(clasa[stare], tuple(clasa[destinatie] for _, destinatie in iesiri[stare]))
+                         for stare in range(nrStari)]
+            clasaNoua = self._numeroteazaBlocuri(semnaturi)
+            if max(clasaNoua, default=-1) == max(clasa, default=-1):
+                break
+            clasa = clasaNoua
+        
+        nrBlocuri = max(clasa, default=-1) + 1
+        self.clasaStare = clasa
+        if nrBlocuri == nrStari:
+            return 0
+        
+        reprezentanti = [None] * nrBlocuri
+        for setItemi in self.seturiItemi:
+            if reprezentanti[clasa[setItemi.id]] is None:
+                reprezentanti[clasa[setItemi.id]] = setItemi
+                setItemi.id = clasa[setItemi.id]
+        self.seturiItemi = reprezentanti
+        self.tranzitii = {(clasa[stare], simbol): clasa[destinatie]
+                          for (stare, simbol), destinatie in self.tranzitii.items()}
+        self.tabelGoto = {(clasa[stare], simbol): clasa[destinatie]
+                          for (stare, simbol), destinatie in self.tabelGoto.items()}
+        self.tabelAction = {(clasa[stare], terminal):
+                            f'd{clasa[int(actiune[1:])]}' if actiune[0] == 'd' else actiune
+                            for (stare, terminal), actiune in self.tabelAction.items()}
+        anticipari = {}
+        for (stare, regula), terminale in self.anticipari.items():
+            anticipari[(clasa[stare], regula)] = anticipari.get((clasa[stare], regula), 0) | terminale
+        self.anticipari = anticipari
+        self.conflicte = [(clasa[stare], terminal, existenta, noua)
+                          for stare, terminal, existenta, noua in self.conflicte]
+        return nrStari - nrBlocuri
+    
+    @staticmethod
+    def _numeroteazaBlocuri(semnaturi: list) -> List[int]:
+        """Numerotează semnăturile distincte în ordinea primei apariții (starea 0 rămâne 0)."""
+        blocuri = {}
+        return [blocuri.setdefault(semnatura, len(blocuri)) for semnatura in semnaturi]
+    
+    def incarcaDinCache(self, caleCache: str, cheie: bytes) -> bool:
+        """
+        Încarcă din cache tabelul compilat și producțiile necesare reducerilor.
+        Automatonul (seturiItemi, tranzitii, tabelAction, tabelGoto) nu este reconstruit.
+        
+        Returns:
+            True dacă cache-ul a fost găsit și este valid pentru cheia dată
+        """
+        rezultat = cache_tabel.citesteCache(caleCache, cheie)
+        if rezultat is None:
+            return False
+        metadate, celule = rezultat
+        
+        self.listaNeterminale = metadate['neterminale']
+        self.listaTerminale = metadate['terminale']
+        self.simbolStart = metadate['simbolStart']
+        self.listaProductii = [Productie(stanga, dreapta) for stanga, dreapta in metadate['productii']]
+        self.tabel = TabelCompilat.dinCelule(metadate['coloane'], celule, self.listaProductii)
+        self.pregatesteTabelParsare()
+        return True
+    
+    def salveazaInCache(self, caleCache: str, cheie: bytes):
+        """
+        Salvează tabelul compilat și producțiile în cache-ul binar.
+        """
+        metadate = {
+            'neterminale': self.listaNeterminale,
+            'terminale': self.listaTerminale,
+            'simbolStart': self.simbolStart,
+            'productii': [[p.simbolNeterminal, p.sirInlocuire] for p in self.listaProductii],
+            'coloane': self.tabel.coloane,
+        }
+        cache_tabel.scrieCache(caleCache, cheie, metadate, self.tabel.celule, self.tabel.nrColoane)
+    
+    def coloaneTabel(self) -> List[str]:
+        """
+        Returnează ordinea coloanelor tabelului: terminale (cu '$' la final),
+        apoi neterminale (fără simbolul de start augmentat S').
+        """
+        coloane = [terminal for terminal in self.listaTerminale if terminal != '$']
+        coloane.append('$')
+        coloane.extend(neterminal for neterminal in self.listaNeterminale
+                       if neterminal != self.simbolStart)
+        return coloane
+
+    def compileazaTabel(self):
+        """
+        Compilează tabelele ACTION și GOTO într-un TabelCompilat folosit de verificaSir.
+        """
+        coloane = self.coloaneTabel()
+        indexColoana = {simbol: i for i, simbol in enumerate(coloane)}
+        coloanaSimbol = [indexColoana.get(simbol, -1) for simbol in self.simboluri]
+        self.tabel = TabelCompilat.dinTabele(self.tabelAction, self.tabelGoto, coloane, coloanaSimbol,
+                                             len(self.seturiItemi), self.listaProductii)
+        self.pregatesteTabelParsare()
+    
+    def pregatesteTabelParsare(self):
+        """
+        Alege tabelul folosit de driver: cel dens sau, la cerere, varianta comprimată.
+        """
+        self.tabelParsare = TabelComprimat.dinTabel(self.tabel) if self.comprimaTabel else self.tabel
+
     def scrieTabelInFisier(self, numeFisier: str):
         """
-        Scrie tabelele ACTION și GOTO într-un fișier în formatul standard.
+        Exportă tabelul compilat într-un fișier în formatul standard.
         Format: prima linie = coloane (terminale + neterminale), 
                 linii următoare = stări cu acțiuni/tranziții.
         Valorile goale sunt marcate cu '0'.
@@ -268,259 +547,394 @@ class Gramatica:
         Args:
             numeFisier: Numele fișierului de ieșire
         """
-        # Construiește lista de coloane: terminale + neterminale (fără S' augmentat)
-        coloane = []
-        
-        # Adaugă terminale (fără $ la început, îl adăugăm la sfârșit pentru convenție)
-        for terminal in self.listaTerminale:
-            if terminal != '$':
-                coloane.append(terminal)
-        coloane.append('$')  # $ la final
-        
-        # Adaugă neterminale (exclude simbolul de start augmentat S')
-        for neterminal in self.listaNeterminale:
-            if neterminal != self.simbolStart:  # Exclude S' (simbolul augmentat)
-                coloane.append(neterminal)
+        coloane = self.tabel.coloane
+        # Lățimea fixă a coloanelor: 5 caractere, mai mult dacă un simbol are un nume lung
+        latime = max(5, max(len(col) for col in coloane) + 1)
         
-        # Deschide fișierul pentru scriere
         with open(numeFisier, 'w') as f:
-            # Scrie header-ul (coloanele) - fiecare coloană are lățime fixă de 5 caractere
-            header_parts = [col.ljust(5) for col in coloane]
+            # Scrie header-ul (coloanele) - fiecare coloană are lățime fixă
+            header_parts = [col.ljust(latime) for col in coloane]
             f.write(''.join(header_parts).rstrip() + '\n')
             
-            # Scrie fiecare stare
-            for stare in range(len(self.seturiItemi)):
-                linie = []
-                
-                # Pentru fiecare coloană, găsește valoarea din tabel
-                for coloana in coloane:
-                    valoare = '0'  # Valoarea implicită pentru celule goale
-                    
-                    if coloana in self.listaTerminale:
-                        # Caută în tabelul ACTION
-                        if (stare, coloana) in self.tabelAction:
-                            actiune = self.tabelAction[(stare, coloana)]
-                            # Formatează acțiunea: 'd5', 'r3', 'acc'
-                            valoare = actiune
-                    else:
-                        # Caută în tabelul GOTO
-                        if (stare, coloana) in self.tabelGoto:
-                            valoare = str(self.tabelGoto[(stare, coloana)])
-                    
-                    linie.append(valoare)
-                
-                # Scrie linia pentru această stare - fiecare valoare are lățime fixă de 5 caractere
-                linie_parts = [val.ljust(5) for val in linie]
+            # Scrie fiecare stare - fiecare valoare are lățime fixă
+            for stare in range(self.tabel.nrStari):
+                linie_parts = [self.tabel.obtine(stare, coloana).ljust(latime) for coloana in coloane]
                 f.write(''.join(linie_parts).rstrip() + '\n')
         
     def genereazaSetItemi(self):
         """
         Generează toate seturile de itemi LR(0) accesibile și tranzițiile între ele.
         Construiește automatonul finit pentru parsarea LR.
+        Stările sunt deduplicate după kernel; numerotarea este deterministă (BFS,
+        simbolurile în ordinea primului item care le are după punct).
         """
         # Creează setul inițial cu primul item al regulii augmentate
         # S' → • S$ (unde S este simbolul de start original)
-        itemInițial = Item(self.listaProductii[0], 0)
-        setInițial = SetItemi({itemInițial}, 0)
-        setInițial = self.closure(setInițial)
+        setInițial = self.closure((self.bazaItem[0],))
+        setInițial.id = 0
         
         # Liste de seturi procesate și neprocessate
         self.seturiItemi = [setInițial]
-        seturiNeprocessate = [setInițial]
-        
-        # Dicționar pentru a găsi rapid ID-ul unui set de itemi
-        mapareSeturi = {setInițial: 0}
+        seturiNeprocessate = deque([setInițial])
         
-        idCurent = 1
+        # Dicționar kernel -> ID-ul setului de itemi
+        mapareNuclee = {setInițial.nucleu: 0}
         
         # Procesează fiecare set până când nu mai sunt seturi noi
         while seturiNeprocessate:
-            setCurent = seturiNeprocessate.pop(0)
+            setCurent = seturiNeprocessate.popleft()
+            nucleeSuccesori = self.nucleeSuccesori(setCurent)
             
-            # Găsește toate simbolurile care apar după punct în itemii acestui set
-            simboluriDupaPunct = set()
-            for item in setCurent.itemi:
-                simbol = item.simbolDupaPunct()
-                if simbol is not None:
-                    simboluriDupaPunct.add(simbol)
-            
-            # Pentru fiecare simbol, calculează goto și adaugă tranziția
-            for simbol in simboluriDupaPunct:
-                setNou = self.goto(setCurent, simbol)
+            if self.statistici is not None:
+                self.statistici.apeluriGoto += len(nucleeSuccesori)
+            for simbol, nucleu in nucleeSuccesori.items():
+                idDestinație = mapareNuclee.get(nucleu)
                 
-                # Verifică dacă acest set există deja
-                if setNou not in mapareSeturi:
+                if idDestinație is None:
                     # Set nou - adaugă-l
-                    setNou.id = idCurent
-                    mapareSeturi[setNou] = idCurent
+                    setNou = self.closure(nucleu)
+                    idDestinație = setNou.id = len(self.seturiItemi)
+                    mapareNuclee[nucleu] = idDestinație
                     self.seturiItemi.append(setNou)
                     seturiNeprocessate.append(setNou)
-                    idCurent += 1
                 
                 # Adaugă tranziția
-                idDestinație = mapareSeturi[setNou]
                 self.tranzitii[(setCurent.id, simbol)] = idDestinație
     
+    def nucleeSuccesori(self, setItemi: SetItemi) -> dict:
+        """
+        Kernel-urile succesorilor stării, grupate într-o singură trecere după simbolul de după
+        punct: {cod simbol: kernel}, cu simbolurile în ordinea primului item care le are după punct.
+        Codurile sunt sortate, deci și kernel-urile rezultate sunt sortate.
+        """
+        simbolDupaItem = self.simbolDupaItem
+        nucleeSuccesori = {}
+        for cod in setItemi.coduri:
+            simbol = simbolDupaItem[cod]
+            if simbol != FARA_SIMBOL:
+                nucleu = nucleeSuccesori.get(simbol)
+                if nucleu is None:
+                    nucleeSuccesori[simbol] = [cod + 1]
+                else:
+                    nucleu.append(cod + 1)
+        return {simbol: tuple(nucleu) for simbol, nucleu in nucleeSuccesori.items()}
+    
+    def calculeazaAnulabile(self):
+        """
+        Calculează mulțimea neterminalelor care pot deriva șirul vid, în timp liniar:
+        fiecare producție ține numărul de simboluri din dreapta încă neanulabile, iar
+        un neterminal devenit anulabil decrementează contoarele producțiilor în care apare
+        (aparitiiSimbol are câte o intrare pentru fiecare apariție).
+        """
+        anulabil = self.anulabil = bytearray(len(self.simboluri))
+        ramase = []
+        deProcesat = []
+        for productie in self.listaProductii:
+            ramase.append(len(productie.idDreapta))
+            if not productie.idDreapta:
+                deProcesat.append(productie.idStanga)
+        
+        while deProcesat:
+            neterminal = deProcesat.pop()
+            if anulabil[neterminal]:
+                continue
+            anulabil[neterminal] = 1
+            for index, _ in self.aparitiiSimbol[neterminal]:
+                ramase[index] -= 1
+                if ramase[index] == 0:
+                    deProcesat.append(self.listaProductii[index].idStanga)
+        self.anulabile = {simbol for simbol, cod in self.idSimbol.items() if anulabil[cod]}
+    
+    def verificaCicluri(self):
+        """
+        Respinge gramaticile ciclice (A ⇒+ A): sunt infinit ambigue, iar reducerile lor
+        pot cicla la nesfârșit în driver fără să consume intrare.
+        A ⇒ B într-un pas dacă A → α B β cu α și β anulabile.
+        """
+        nrTerminale = self.nrTerminale
+        anulabil = self.anulabil
+        succesori = [[] for _ in self.simboluri]
+        for productie in self.listaProductii:
+            sirDreapta = productie.idDreapta
+            neanulabile = [simbol for simbol in sirDreapta if not anulabil[simbol]]
+            if len(neanulabile) > 1:
+                continue
+            for simbol in (neanulabile or sirDreapta):
+                if simbol >= nrTerminale:
+                    succesori[productie.idStanga].append(simbol)
+        
+        # DFS iterativ cu trei culori: un arc către un nod aflat pe drum închide un ciclu
+        culoare = bytearray(len(self.simboluri))
+        for radacina in range(nrTerminale, len(self.simboluri)):
+            if culoare[radacina]:
+                continue
+            culoare[radacina] = 1
+            drum = [(radacina, iter(succesori[radacina]))]
+            while drum:
+                nod, vecini = drum[-1]
+                for vecin in vecini:
+                    if culoare[vecin] == 1:
+                        raise ValueError(f"Gramatica este ciclică: {self.simboluri[vecin]} ⇒+ {self.simboluri[vecin]}")
+                    if culoare[vecin] == 0:
+                        culoare[vecin] = 1
+                        drum.append((vecin, iter(succesori[vecin])))
+                        break
+                else:
+                    culoare[nod] = 2
+                    drum.pop()
+    
+    def calculeazaAnticipariLALR(self):
+        """
+        Calculează anticipările LALR(1) pe automatonul LR(0) existent, prin relațiile
+        DeRemer–Pennello: DR/reads dau Read(p, A), includes dă Follow(p, A), iar
+        lookback leagă fiecare reducere (q, A → ω) de tranzițiile (p, A) cu p --ω--> q.
+        Mulțimile de terminale sunt bitset-uri, iar relațiile sunt rezolvate cu
+        algoritmul digraph, deci numărul de stări rămâne cel al automatonului LR(0).
+        Rezultatul este pus în self.anticipari: {(stare, număr regulă): bitset de terminale}.
+        """
+        nrTerminale = self.nrTerminale
+        anulabil = self.anulabil
+        
+        # Tranzițiile pe neterminale (p, A), numerotate, și ieșirile fiecărei stări
+        tranzitiiNeterminale = [cheie for cheie in self.tranzitii if cheie[1] >= nrTerminale]
+        indexTranzitie = {cheie: i for i, cheie in enumerate(tranzitiiNeterminale)}
+        iesiri = {}
+        for (stare, simbol) in self.tranzitii:
+            iesiri.setdefault(stare, []).append(simbol)
+        
+        # DR(p, A) = terminalele deplasate din r, unde p --A--> r;
+        # (p, A) reads (r, C) dacă r --C--> și C este anulabil
+        dr = []
+        reads = []
+        for (stare, neterminal) in tranzitiiNeterminale:
+            destinatie = self.tranzitii[(stare, neterminal)]
+            biti = 0
+            citite = []
+            for simbol in iesiri.get(destinatie, ()):
+                if simbol < nrTerminale:
+                    biti |= 1 << simbol
+                elif anulabil[simbol]:
+                    citite.append(indexTranzitie[(destinatie, simbol)])
+            dr.append(biti)
+            reads.append(citite)
+        read = _digraf(reads, dr)
+        
+        # (p, A) includes (p', B) dacă B → β A γ, γ anulabil și p' --β--> p;
+        # (q, B → ω) lookback (p', B) dacă p' --ω--> q
+        includes = [[] for _ in tranzitiiNeterminale]
+        lookback = {}
+        for j, (stareStart, neterminal) in enumerate(tranzitiiNeterminale):
+            for indexProductie in self.productiiSimbol[neterminal]:
+                sirDreapta = self.listaProductii[indexProductie].idDreapta
+                stari = [stareStart]
+                for simbol in sirDreapta:
+                    stari.append(self.tranzitii[(stari[-1], simbol)])
+                lookback.setdefault((stari[-1], indexProductie), []).append(j)
+                for i in range(len(sirDreapta) - 1, -1, -1):
+                    simbol = sirDreapta[i]
+                    if simbol >= nrTerminale:
+                        includes[indexTranzitie[(stari[i], simbol)]].append(j)
+                    if not anulabil[simbol]:
+                        break
+        follow = _digraf(includes, read)
+        
+        self.anticipari = {}
+        for cheie, tranzitii in lookback.items():
+            biti = 0
+            for j in tranzitii:
+                biti |= follow[j]
+            self.anticipari[cheie] = biti
+    
+    def terminaleDinBiti(self, biti: int) -> Set[str]:
+        """Convertește un bitset peste listaTerminale în mulțimea de terminale."""
+        terminale = set()
+        while biti:
+            bitJos = biti & -biti
+            terminale.add(self.listaTerminale[bitJos.bit_length() - 1])
+            biti ^= bitJos
+        return terminale
+    
     def calculeazaFirst(self):
         """
-        First(A) este multimea de terminali cu care poate incepe un sir derivat din neterminalul A
+        First(A) este multimea de terminali cu care poate incepe un sir derivat din neterminalul A.
+        Mulțimile sunt bitset-uri întregi peste listaTerminale (self.firstBiti, bitul i este
+        terminalul cu codul i), indexate după codul neterminalului minus nrTerminale. A depinde
+        de B dacă A → α B β cu α anulabil; dependențele sunt rezolvate în ordinea componentelor
+        tare conexe (_digraf), deci fiecare mulțime este calculată o singură dată.
+        Necesită self.anulabil (calculeazaAnulabile).
         """
-        # Inițializează FIRST cu mulțimi goale
-        for neterminal in self.listaNeterminale:
-            self.first[neterminal] = set()
+        nrTerminale = self.nrTerminale
+        anulabil = self.anulabil
+        initial = [0] * (len(self.simboluri) - nrTerminale)
+        relatie = [[] for _ in initial]
+        for productie in self.listaProductii:
+            stanga = productie.idStanga - nrTerminale
+            # Parcurge prefixul anulabil al părții drepte, inclusiv primul simbol neanulabil
+            for simbol in productie.idDreapta:
+                if simbol >= nrTerminale:
+                    relatie[stanga].append(simbol - nrTerminale)
+                    if not anulabil[simbol]:
+                        break
+                else:
+                    initial[stanga] |= 1 << simbol
+                    break
         
-        # Repetă până când nu mai sunt schimbări
-        schimbat = True
-        while schimbat:
-            schimbat = False
-            
-            for productie in self.listaProductii:
-                neterminal = productie.simbolNeterminal
-                sirDreapta = productie.sirInlocuire
-                
-                primulSimbol = sirDreapta[0]
-                
-                if primulSimbol in self.listaTerminale:
-                    # Primul simbol este terminal
-                    if primulSimbol not in self.first[neterminal]:
-                        self.first[neterminal].add(primulSimbol)
-                        schimbat = True
-                elif primulSimbol in self.listaNeterminale:
-                    # Primul simbol este neterminal
-                    # Adaugă FIRST(primul simbol) la FIRST(neterminal)
-                    for terminal in self.first[primulSimbol]:
-                        if terminal not in self.first[neterminal]:
-                            self.first[neterminal].add(terminal)
-                            schimbat = True
+        self.firstBiti = _digraf(relatie, initial)
+        self.first = {neterminal: self.terminaleDinBiti(self.firstBiti[i])
+                      for neterminal, i in self.indexNeterminal.items()}
     
     def calculeazaFollow(self):
         """
-        Follow(A) este multimea de terminali care pot aprea imediat dupa neterminalul A intr o derivare
+        Follow(A) este multimea de terminali care pot aprea imediat dupa neterminalul A intr o derivare.
+        Pentru fiecare A → α B β: FOLLOW(B) include FIRST(β), iar dacă β este anulabil,
+        FOLLOW(B) include FOLLOW(A). Ca la FIRST, mulțimile sunt bitset-uri rezolvate
+        în ordinea componentelor tare conexe. Necesită calculeazaFirst.
         """
-        # Inițializează FOLLOW cu mulțimi goale
-        for neterminal in self.listaNeterminale:
-            self.follow[neterminal] = set()
+        nrTerminale = self.nrTerminale
+        anulabil = self.anulabil
+        firstBiti = self.firstBiti
+        initial = [0] * (len(self.simboluri) - nrTerminale)
+        relatie = [[] for _ in initial]
         
         # Adaugă $ în FOLLOW(S) pentru simbolul de start
-        if self.simbolStart in self.listaNeterminale:
-            self.follow[self.simbolStart].add('$')
+        if self.simbolStart in self.indexNeterminal:
+            initial[self.indexNeterminal[self.simbolStart]] |= 1 << self.idSimbol['$']
         
-        # Repetă până când nu mai sunt schimbări
-        schimbat = True
-        while schimbat:
-            schimbat = False
-            
-            for productie in self.listaProductii:
-                neterminalStanga = productie.simbolNeterminal
-                sirDreapta = productie.sirInlocuire
-                
-                # Parcurge fiecare simbol din partea dreaptă
-                for i in range(len(sirDreapta)):
-                    simbol = sirDreapta[i]
-                    
-                    # Interesează doar neterminalele
-                    if simbol not in self.listaNeterminale:
-                        continue
-                    
-                    # Verifică ce urmează după acest neterminal
-                    if i + 1 < len(sirDreapta):
-                        # Mai sunt simboluri după
-                        simbolUrmator = sirDreapta[i + 1]
-                        
-                        if simbolUrmator in self.listaTerminale:
-                            # Următorul simbol este terminal
-                            if simbolUrmator not in self.follow[simbol]:
-                                self.follow[simbol].add(simbolUrmator)
-                                schimbat = True
-                        elif simbolUrmator in self.listaNeterminale:
-                            # Următorul simbol este neterminal
-                            # Adaugă FIRST(simbolUrmator) la FOLLOW(simbol)
-                            for terminal in self.first[simbolUrmator]:
-                                if terminal not in self.follow[simbol]:
-                                    self.follow[simbol].add(terminal)
-                                    schimbat = True
-                            
-                            # Dacă simbolul următor poate deriva epsilon, adaugă FOLLOW(neterminalStanga)
-                            # Pentru simplitate, presupunem că nu avem producții epsilon
+        for productie in self.listaProductii:
+            stanga = productie.idStanga - nrTerminale
+            # Parcurge partea dreaptă de la final, ținând FIRST(sufix) și dacă sufixul este anulabil
+            firstSufix = 0
+            sufixAnulabil = True
+            for simbol in reversed(productie.idDreapta):
+                if simbol >= nrTerminale:
+                    neterminal = simbol - nrTerminale
+                    initial[neterminal] |= firstSufix
+                    if sufixAnulabil:
+                        relatie[neterminal].append(stanga)
+                    if anulabil[simbol]:
+                        firstSufix |= firstBiti[neterminal]
                     else:
-                        # Neterminalul este ultimul simbol: A → αB
-                        # Adaugă FOLLOW(A) la FOLLOW(B)
-                        for terminal in self.follow[neterminalStanga]:
-                            if terminal not in self.follow[simbol]:
-                                self.follow[simbol].add(terminal)
-                                schimbat = True
+                        firstSufix = firstBiti[neterminal]
+                        sufixAnulabil = False
+                else:
+                    firstSufix = 1 << simbol
+                    sufixAnulabil = False
+        
+        self.followBiti = _digraf(relatie, initial)
+        self.follow = {neterminal: self.terminaleDinBiti(self.followBiti[i])
+                       for neterminal, i in self.indexNeterminal.items()}
+    
+    def indexeazaProductii(self):
+        """
+        Internează simbolurile: fiecare primește un cod întreg dens, terminalele 0 .. nrTerminale - 1
+        în ordinea din listaTerminale (bitul i al bitset-urilor FIRST/FOLLOW), apoi neterminalele
+        în ordinea din listaNeterminale. Numerotează producțiile, le scrie părțile ca coduri
+        (idStanga, idDreapta), construiește indexurile după simbol și internează itemii:
+        producția i are itemii cu codurile bazaItem[i] .. bazaItem[i] + len(i).
+        Fazele următoare lucrează doar pe aceste coduri.
+        Trebuie apelată după augmentare, când ordinea din listaProductii este finală.
+        """
+        self.simboluri = self.listaTerminale + self.listaNeterminale
+        self.idSimbol = {}
+        for simbol in self.simboluri:
+            if simbol in self.idSimbol:
+                raise ValueError(f"Simbolul '{simbol}' este declarat de mai multe ori")
+            self.idSimbol[simbol] = len(self.idSimbol)
+        self.nrTerminale = len(self.listaTerminale)
+        self.bitTerminal = {terminal: 1 << i for i, terminal in enumerate(self.listaTerminale)}
+        self.indexNeterminal = {neterminal: i for i, neterminal in enumerate(self.listaNeterminale)}
+        self.productiiSimbol = [[] for _ in self.simboluri]
+        self.productiiNeterminal = {neterminal: self.productiiSimbol[self.idSimbol[neterminal]]
+                                    for neterminal in self.listaNeterminale}
+        self.aparitiiSimbol = [[] for _ in self.simboluri]
+        self.itemiInternati = []
+        self.bazaItem = []
+        self.simbolDupaItem = array('i')
+        for index, productie in enumerate(self.listaProductii):
+            self._indexeazaProductie(index, productie)
+        self.closureNeterminal = {}
+    
+    def _indexeazaProductie(self, index: int, productie):
+        """Numerotează producția, îi internează simbolurile, o adaugă în indexuri și îi internează itemii (la final)."""
+        idSimbol = self.idSimbol
+        for simbol in (productie.simbolNeterminal, *productie.sirInlocuire):
+            if simbol not in idSimbol:
+                raise ValueError(f"Simbol nedeclarat '{simbol}' în producția "
+                                 f"{productie.simbolNeterminal} -> {formateazaSimboluri(productie.sirInlocuire)}")
+        if idSimbol[productie.simbolNeterminal] < self.nrTerminale:
+            raise ValueError(f"Terminalul '{productie.simbolNeterminal}' nu poate fi în stânga unei producții")
+        productie.index = index
+        productie.idStanga = idSimbol[productie.simbolNeterminal]
+        productie.idDreapta = tuple(idSimbol[simbol] for simbol in productie.sirInlocuire)
+        self.productiiSimbol[productie.idStanga].append(index)
+        for pozitie, simbol in enumerate(productie.idDreapta):
+            self.aparitiiSimbol[simbol].append((index, pozitie))
+        self.bazaItem.append(len(self.itemiInternati))
+        for pozitie in range(len(productie.idDreapta) + 1):
+            self.itemiInternati.append(Item(productie, pozitie, len(self.itemiInternati)))
+        self.simbolDupaItem.extend(productie.idDreapta)
+        self.simbolDupaItem.append(FARA_SIMBOL)
     
-    def closure(self, setItemi: SetItemi) -> SetItemi:
+    def closurePentruNeterminal(self, neterminal: int) -> tuple:
+        """
+        Returnează (din cache) codurile itemilor B → • γ adăugați de closure pentru un item
+        cu punctul înaintea neterminalului dat (prin cod): producțiile lui și, tranzitiv, ale
+        neterminalelor cu care acestea încep.
+        """
+        coduri = self.closureNeterminal.get(neterminal)
+        if coduri is not None:
+            return coduri
+        
+        productiiSimbol = self.productiiSimbol
+        bazaItem = self.bazaItem
+        simbolDupaItem = self.simbolDupaItem
+        nrTerminale = self.nrTerminale
+        coduri = []
+        vizitate = {neterminal}
+        deProcesat = [neterminal]
+        while deProcesat:
+            curent = deProcesat.pop()
+            if self.statistici is not None:
+                self.statistici.iteratiiClosure += 1
+            for index in productiiSimbol[curent]:
+                cod = bazaItem[index]
+                coduri.append(cod)
+                primulSimbol = simbolDupaItem[cod]
+                if primulSimbol >= nrTerminale and primulSimbol not in vizitate:
+                    vizitate.add(primulSimbol)
+                    deProcesat.append(primulSimbol)
+        
+        coduri = tuple(coduri)
+        self.closureNeterminal[neterminal] = coduri
+        return coduri
+    
+    def closure(self, nucleu: tuple) -> SetItemi:
         """
         Closure pleaca de la un set de itemi (kernel)
         Pentru fiecare item din set, daca simbolul dupa punct este un neterminal,
         se adauga in set toti itemii proveniti din productiile acelui neterminal, cu punctul la inceput.
+        Itemii adăugați pentru fiecare neterminal sunt precalculați (closurePentruNeterminal),
+        deci este suficientă o singură trecere prin kernel.
         
         Args:
-            setItemi: Setul de itemi inițial (kernel)
+            nucleu: Codurile sortate ale itemilor din kernel
             
         Returns:
             Noul set de itemi cu closure complet
         """
-        # Creează un nou set cu aceiași itemi
-        rezultat = SetItemi(set(setItemi.itemi), setItemi.id)
+        coduri = set(nucleu)
+        neterminaleVazute = set()
+        nrTerminale = self.nrTerminale
+        if self.statistici is not None:
+            self.statistici.iteratiiClosure += len(nucleu)
         
-        # Repetă până când nu mai sunt itemi noi de adăugat
-        adaugatItemiNoi = True
-        while adaugatItemiNoi:
-            adaugatItemiNoi = False
-            itemiCurenți = list(rezultat.itemi)
-
-            # Pentru fiecare item în setul curent
-            for item in itemiCurenți:
-                simbolDupaPunct = item.simbolDupaPunct()
-                
-                # Dacă simbolul după punct este un neterminal
-                if simbolDupaPunct and simbolDupaPunct in self.listaNeterminale:
-                    # Găsește toate producțiile pentru acest neterminal
-                    for productie in self.listaProductii:
-                        if productie.simbolNeterminal == simbolDupaPunct:
-                            # Creează itemul B → • γ
-                            itemNou = Item(productie, 0)
-                            
-                            # Adaugă itemul dacă nu există deja
-                            if not rezultat.contineItem(itemNou):
-                                rezultat.adaugaItem(itemNou)
-                                adaugatItemiNoi = True
+        for cod in nucleu:
+            simbolDupaPunct = self.simbolDupaItem[cod]
+            if simbolDupaPunct >= nrTerminale and simbolDupaPunct not in neterminaleVazute:
+                neterminaleVazute.add(simbolDupaPunct)
+                coduri.update(self.closurePentruNeterminal(simbolDupaPunct))
         
-        return rezultat
-    
-    def goto(self, setItemi: SetItemi, simbol: str) -> SetItemi:
-        """
-        Functia goto returneaza un nou set de itemi (stare) + closure pe acest nou set
-        Functia goto trece prin itemi primiti ca parametru
-        și avansează punctul pentru toți itemii care au simbolul dupa punct egal cu simbolul dat ca parametru.
-        
-        Args:
-            setItemi: Setul de itemi curent
-            simbol: Simbolul (terminal sau neterminal) citit
-            
-        Returns:
-            Noul set de itemi după tranziție
-        """
-        # Kernel-ul noului set: itemi cu punct avansat după simbol
-        itemiNoi = set()
-        
-        for item in setItemi.itemi:
-            # Verifică dacă itemul are simbol după punct egal cu simbolul dat
-            if item.simbolDupaPunct() == simbol:
-                # Avansează punctul
-                # Găsește producția corespunzătoare pentru a crea un nou item
-                for productie in self.listaProductii:
-                    if (productie.simbolNeterminal == item.simbolNeterminal and 
-                        productie.sirInlocuire == item.sirInlocuire):
-                        itemNou = Item(productie, item.pozitiePunct + 1)
-                        itemiNoi.add(itemNou)
-                        break
-        
-        # Creează setul nou și aplică closure
-        setNou = SetItemi(itemiNoi)
-        return self.closure(setNou)
+        return SetItemi(nucleu, tuple(sorted(coduri)), self.itemiInternati)
     
     def augmenteazaGramatica(self):
         """
@@ -542,7 +956,7 @@ class Gramatica:
         self.listaNeterminale.insert(0, simbolStartNou)
         
         # Creează noua producție S' → S$ (simbolul vechi + $)
-        productieNoua = Productie(simbolStartNou, self.simbolStart + "$")
+        productieNoua = Productie(simbolStartNou, (self.simbolStart, "$"))
         
         # Inserează noua producție la începutul listei
         self.listaProductii.insert(0, productieNoua)
@@ -551,20 +965,414 @@ class Gramatica:
         self.simbolStart = simbolStartNou
         
     def citesteGramaticaDinFisier(self, numeFisier: str):
+        """
+        Citește gramatica: neterminalele și terminalele (separate prin spații), simbolul de
+        start, apoi câte o producție A->w pe linie. Numele simbolurilor pot avea mai multe
+        caractere, caz în care simbolurile din partea dreaptă sunt separate prin spații
+        (expr -> expr + term); cu simboluri de un caracter, partea dreaptă poate fi scrisă
+        și compact (E->E+T), vezi citesteSimboluri.
+        """
         with open(numeFisier, 'r') as f:
             linii = f.readlines()
-            self.listaNeterminale = linii[0].strip().split(" ")
-            self.listaTerminale = linii[1].strip().split(" ")
+            self.listaNeterminale = linii[0].split()
+            self.listaTerminale = linii[1].split()
             self.simbolStart = linii[2].strip()
             self.listaProductii = []
+            declarate = set(self.listaNeterminale) | set(self.listaTerminale)
             for i in range(3, len(linii)):
-                linie = linii[i].split("->")
-                productie = Productie(linie[0].strip(), linie[1].strip())
+                # O parte dreaptă vidă (ex. "A->") este o producție epsilon
+                linie = linii[i].split("->", 1)
+                productie = Productie(linie[0].strip(), citesteSimboluri(linie[1], declarate))
                 self.adaugaProductie(productie)
 
     def adaugaProductie(self, productie):
             self.listaProductii.append(productie)
 
+    def adaugaProductieIncremental(self, productie, neterminaleNoi=(), verifica: bool = False) -> dict:
+        """
+        Adaugă o producție unei gramatici deja construite și actualizează analiza și tabelele
+        pe loc, cu același rezultat ca o reconstrucție (vezi diferenteFataDe):
+        - FIRST și FOLLOW cresc doar pentru neterminalele afectate: diferențele de bitset-uri
+          sunt propagate pe aparițiile simbolurilor (aparitiiSimbol);
+        - closure se schimbă exact în stările cu tranziție pe neterminalul din stânga: doar
+          ele și stările noi la care ajung sunt recalculate, iar tranzitii este corectat;
+        - stările sunt renumerotate în ordinea BFS a lui genereazaSetItemi (stările rămase
+          inaccesibile dispar), iar în tabelAction și tabelGoto sunt refăcute doar rândurile
+          stărilor schimbate și ale celor cu reduceri ale unui neterminal cu FOLLOW modificat.
+        Tabelul compilat este regenerat.
+
+        Limitări: actualizarea este complet locală doar în modul SLR și doar dacă niciun
+        neterminal nu devine anulabil. Altfel, o parte este recalculată în întregime:
+        - dacă producția face anulabil un neterminal, relațiile FIRST/FOLLOW se schimbă și
+          FIRST/FOLLOW sunt recalculate complet (raportul are firstFollowComplet=True);
+        - în modul LALR anticipările depind de tot automatonul, deci la fiecare adăugare
+          sunt recalculate toate, împreună cu tot tabelul ACTION (randuriRecalculate este
+          numărul tuturor stărilor).
+        Automatonul LR(0) este actualizat local în toate cazurile.
+        
+        Args:
+            productie: Producția nouă (Productie), adăugată la finalul listei de producții
+            neterminaleNoi: Neterminale noi folosite de producție (declarate la final)
+            verifica: Dacă este True, rezultatul este comparat cu o reconstrucție completă
+                (lista de diferențe este pusă în raport, cheia 'diferente')
+        
+        Returns:
+            Raport: stariAfectate, stariNoi, stariEliminate, randuriRecalculate,
+            firstFollowComplet, secunde
+        
+        Raises:
+            ValueError: Dacă automatonul nu este disponibil (tabel din cache sau minimizat),
+                producția folosește simboluri nedeclarate sau gramatica ar deveni ciclică
+        """
+        start = time.perf_counter()
+        if self.dinCache or self.minimizeaza or not self.seturiItemi:
+            raise ValueError("Actualizarea incrementală necesită automatonul LR(0) complet, neminimizat")
+        stanga, dreapta = productie.simbolNeterminal, productie.sirInlocuire
+        if stanga == self.simbolStart:
+            raise ValueError(f"Simbolul de start augmentat {stanga} nu poate primi producții")
+        for neterminal in neterminaleNoi:
+            if neterminal in self.idSimbol:
+                raise ValueError(f"Simbolul '{neterminal}' este deja declarat")
+        for simbol in (stanga, *dreapta):
+            if simbol not in self.idSimbol and simbol not in neterminaleNoi:
+                raise ValueError(f"Simbol nedeclarat '{simbol}' în producția {stanga} -> {formateazaSimboluri(dreapta)}")
+        if stanga in self.bitTerminal:
+            raise ValueError(f"Terminalul '{stanga}' nu poate fi în stânga unei producții")
+        
+        # Neterminalele noi primesc codurile următoare (după toate terminalele, deci rămân neterminale)
+        index = len(self.listaProductii)
+        nrNeterminale = len(self.listaNeterminale)
+        nrSimboluri = len(self.simboluri)
+        anulabilVechi = self.anulabil
+        self.listaNeterminale.extend(neterminaleNoi)
+        self.simboluri.extend(neterminaleNoi)
+        for neterminal in neterminaleNoi:
+            self.idSimbol[neterminal] = len(self.idSimbol)
+            self.productiiSimbol.append([])
+            self.aparitiiSimbol.append([])
+        self.anulabil = anulabilVechi + bytearray(len(neterminaleNoi))
+        productie.idStanga = self.idSimbol[stanga]
+        productie.idDreapta = tuple(self.idSimbol[simbol] for simbol in dreapta)
+        
+        # NULLABLE nou și verificarea ciclurilor, înainte de orice modificare a analizei
+        self.listaProductii.append(productie)
+        anulabileNoi = self._anulabileNoi(productie)
+        for neterminal in anulabileNoi:
+            self.anulabil[neterminal] = 1
+        try:
+            if anulabileNoi or sum(not self.anulabil[simbol] for simbol in productie.idDreapta) <= 1:
+                self.verificaCicluri()
+        except ValueError:
+            del self.listaProductii[index:]
+            del self.listaNeterminale[nrNeterminale:]
+            del self.simboluri[nrSimboluri:]
+            del self.productiiSimbol[nrSimboluri:]
+            del self.aparitiiSimbol[nrSimboluri:]
+            for neterminal in neterminaleNoi:
+                del self.idSimbol[neterminal]
+            self.anulabil = anulabilVechi
+            raise
+        
+        for neterminal in neterminaleNoi:
+            self.productiiNeterminal[neterminal] = self.productiiSimbol[self.idSimbol[neterminal]]
+            self.indexNeterminal[neterminal] = len(self.firstBiti)
+            self.firstBiti.append(0)
+            self.followBiti.append(0)
+        self.anulabile |= {self.simboluri[neterminal] for neterminal in anulabileNoi}
+        self._indexeazaProductie(index, productie)
+        self.registruActiuni.adaugaProductie(productie)
+        # Closure-urile precalculate ale neterminalelor care încep (tranzitiv) cu cel din stânga
+        deInvalidat = [productie.idStanga]
+        vazute = {productie.idStanga}
+        while deInvalidat:
+            neterminal = deInvalidat.pop()
+            self.closureNeterminal.pop(neterminal, None)
+            for indexAparitie, pozitie in self.aparitiiSimbol[neterminal]:
+                parinte = self.listaProductii[indexAparitie].idStanga
+                if pozitie == 0 and parinte not in vazute:
+                    vazute.add(parinte)
+                    deInvalidat.append(parinte)
+        
+        followVechi = list(self.followBiti)
+        firstFollowComplet = bool(anulabileNoi)
+        if firstFollowComplet:
+            self.calculeazaFirst()
+            self.calculeazaFollow()
+        else:
+            self._propagaFirstFollow(productie)
+        followModificat = [i + self.nrTerminale for i, biti in enumerate(self.followBiti) if biti != followVechi[i]]
+        
+        afectate, noi = self._actualizeazaAutomaton(productie.idStanga)
+        nrStariInainte = len(self.seturiItemi)
+        nouId = self._renumeroteazaStari()
+        
+        # Rândurile refăcute: stările cu closure schimbat, stările noi și, în SLR, stările
+        # care reduc cu o producție a unui neterminal al cărui FOLLOW s-a schimbat
+        randuri = {nouId[stare] for stare in afectate + noi if nouId[stare] >= 0}
+        if self.mod == MOD_SLR and followModificat:
+            finale = set()
+            for neterminal in followModificat:
+                for indexProductie in self.productiiSimbol[neterminal]:
+                    lungime = len(self.listaProductii[indexProductie].idDreapta)
+                    if lungime:
+                        finale.add(self.bazaItem[indexProductie] + lungime)
+                    else:
+                        # Itemul final A → • este în closure exact în stările cu tranziție pe A
+                        randuri.update(stare for (stare, simbol) in self.tranzitii if simbol == neterminal)
+            randuri.update(setItemi.id for setItemi in self.seturiItemi
+                           if not finale.isdisjoint(setItemi.nucleu))
+        
+        if self.mod == MOD_LALR:
+            self.calculeazaAnticipariLALR()
+            self.tabelAction = {}
+            self.conflicte = []
+            self.construiesteTabelAction()
+        else:
+            for stare in randuri:
+                for terminal in range(self.nrTerminale):
+                    self.tabelAction.pop((stare, terminal), None)
+            self.conflicte = [conflict for conflict in self.conflicte if conflict[0] not in randuri]
+            self.construiesteTabelAction([self.seturiItemi[stare] for stare in sorted(randuri)])
+        for stare in randuri:
+            for simbol in self.nucleeSuccesori(self.seturiItemi[stare]):
+                if simbol >= self.nrTerminale:
+                    self.tabelGoto[(stare, simbol)] = self.tranzitii[(stare, simbol)]
+        self.compileazaTabel()
+        
+        raport = {
+            'stariAfectate': len(afectate),
+            'stariNoi': len(noi),
+            'stariEliminate': nrStariInainte - len(self.seturiItemi),
+            'randuriRecalculate': len(randuri) if self.mod == MOD_SLR else len(self.seturiItemi),
+            'firstFollowComplet': firstFollowComplet,
+            'secunde': time.perf_counter() - start,
+        }
+        if verifica:
+            with tempfile.TemporaryDirectory() as director:
+                numeFisier = os.path.join(director, 'gramatica.txt')
+                self.scrieGramaticaInFisier(numeFisier)
+                completa = Gramatica(numeFisier, mod=self.mod, comprimaTabel=self.comprimaTabel,
+                                     fisierActiuni=False)
+            raport['diferente'] = self.diferenteFataDe(completa)
+        return raport
+    
+    def _anulabileNoi(self, productie) -> set:
+        """Codurile neterminalelor care devin anulabile prin adăugarea producției (încă neindexate)."""
+        anulabil = self.anulabil
+        noi = set()
+        deProcesat = []
+        if all(anulabil[simbol] for simbol in productie.idDreapta):
+            deProcesat.append(productie.idStanga)
+        while deProcesat:
+            neterminal = deProcesat.pop()
+            if anulabil[neterminal] or neterminal in noi:
+                continue
+            noi.add(neterminal)
+            candidati = [self.listaProductii[index] for index, _ in self.aparitiiSimbol[neterminal]]
+            if neterminal in productie.idDreapta:
+                candidati.append(productie)
+            for candidat in candidati:
+                if (not anulabil[candidat.idStanga] and candidat.idStanga not in noi
+                        and all(anulabil[simbol] or simbol in noi for simbol in candidat.idDreapta)):
+                    deProcesat.append(candidat.idStanga)
+        return noi
+    
+    def _propagaFirstFollow(self, productie):
+        """
+        Extinde FIRST și FOLLOW cu contribuțiile unei producții noi, când NULLABLE nu s-a
+        schimbat: relațiile vechi rămân, deci sunt propagate doar bitii noi, pe aparițiile
+        neterminalelor modificate. Mulțimile (self.first, self.follow) sunt refăcute doar
+        pentru neterminalele schimbate.
+        """
+        nrTerminale = self.nrTerminale
+        listaProductii = self.listaProductii
+        anulabil = self.anulabil
+        firstBiti, followBiti = self.firstBiti, self.followBiti
+        
+        # FIRST: X → α Y β cu α anulabil primește biții noi ai lui Y
+        firstNoi = {}  # {index neterminal: biții adăugați}
+        deProcesat = []
+        
+        def adaugaFirst(neterminal: int, biti: int):
+            noi = biti & ~firstBiti[neterminal]
+            if noi:
+                firstBiti[neterminal] |= noi
+                firstNoi[neterminal] = firstNoi.get(neterminal, 0) | noi
+                deProcesat.append((neterminal, noi))
+        
+        adaugaFirst(productie.idStanga - nrTerminale, self._firstSir(productie.idDreapta))
+        while deProcesat:
+            neterminal, noi = deProcesat.pop()
+            for index, pozitie in self.aparitiiSimbol[neterminal + nrTerminale]:
+                sirDreapta = listaProductii[index].idDreapta
+                if all(anulabil[simbol] for simbol in sirDreapta[:pozitie]):
+                    adaugaFirst(listaProductii[index].idStanga - nrTerminale, noi)
+        
+        # FOLLOW: contribuțiile producției noi, ale biților noi din FIRST (B urmat de un sufix
+        # anulabil până la Y) și, prin propagare, ale biților noi din FOLLOW(A) către B din A → α B β
+        followNoi = set()
+        
+        def adaugaFollow(neterminal: int, biti: int):
+            noi = biti & ~followBiti[neterminal]
+            if noi:
+                followBiti[neterminal] |= noi
+                followNoi.add(neterminal)
+                deProcesat.append((neterminal, noi))
+        
+        def propagaSufix(sirDreapta: tuple, sfarsit: int, biti: int):
+            for simbol in reversed(sirDreapta[:sfarsit]):
+                if simbol >= nrTerminale:
+                    adaugaFollow(simbol - nrTerminale, biti)
+                if not anulabil[simbol]:
+                    break
+        
+        sirDreapta = productie.idDreapta
+        followStanga = followBiti[productie.idStanga - nrTerminale]
+        for pozitie, simbol in enumerate(sirDreapta):
+            if simbol >= nrTerminale:
+                sufix = sirDreapta[pozitie + 1:]
+                biti = self._firstSir(sufix)
+                if all(anulabil[s] for s in sufix):
+                    biti |= followStanga
+                adaugaFollow(simbol - nrTerminale, biti)
+        for neterminal, noi in firstNoi.items():
+            for index, pozitie in self.aparitiiSimbol[neterminal + nrTerminale]:
+                propagaSufix(listaProductii[index].idDreapta, pozitie, noi)
+        while deProcesat:
+            neterminal, noi = deProcesat.pop()
+            for index in self.productiiSimbol[neterminal + nrTerminale]:
+                sirDreapta = listaProductii[index].idDreapta
+                propagaSufix(sirDreapta, len(sirDreapta), noi)
+        
+        for neterminal in firstNoi:
+            self.first[self.listaNeterminale[neterminal]] = self.terminaleDinBiti(firstBiti[neterminal])
+        for neterminal in followNoi:
+            self.follow[self.listaNeterminale[neterminal]] = self.terminaleDinBiti(followBiti[neterminal])
+        for neterminal in self.listaNeterminale:
+            self.first.setdefault(neterminal, set())
+            self.follow.setdefault(neterminal, set())
+    
+    def _firstSir(self, simboluri) -> int:
+        """FIRST al unui șir de coduri de simboluri, ca bitset."""
+        biti = 0
+        for simbol in simboluri:
+            if simbol < self.nrTerminale:
+                return biti | (1 << simbol)
+            biti |= self.firstBiti[simbol - self.nrTerminale]
+            if not self.anulabil[simbol]:
+                break
+        return biti
+    
+    def _actualizeazaAutomaton(self, neterminal: int):
+        """
+        Recalculează closure-ul stărilor cu tranziție pe neterminal (dat prin cod; exact cele în care
+        apar itemii producției noi) și succesorii lor; kernel-urile noi devin stări noi,
+        procesate la rândul lor. Stările păstrează numerele; tranzițiile sunt suprascrise.
+        
+        Returns:
+            (stările afectate, stările noi), ca liste de numere
+        """
+        indexNucleu = {setItemi.nucleu: setItemi.id for setItemi in self.seturiItemi}
+        afectate = [stare for (stare, simbol) in self.tranzitii if simbol == neterminal]
+        deProcesat = deque()
+        for stare in afectate:
+            setItemi = self.seturiItemi[stare]
+            setItemi.coduri = self.closure(setItemi.nucleu).coduri
+            deProcesat.append(setItemi)
+        noi = []
+        while deProcesat:
+            setCurent = deProcesat.popleft()
+            for simbol, nucleu in self.nucleeSuccesori(setCurent).items():
+                idDestinatie = indexNucleu.get(nucleu)
+                if idDestinatie is None:
+                    setNou = self.closure(nucleu)
+                    idDestinatie = setNou.id = indexNucleu[nucleu] = len(self.seturiItemi)
+                    self.seturiItemi.append(setNou)
+                    noi.append(idDestinatie)
+                    deProcesat.append(setNou)
+                self.tranzitii[(setCurent.id, simbol)] = idDestinatie
+        return afectate, noi
+    
+    def _renumeroteazaStari(self) -> List[int]:
+        """
+        Renumerotează stările în ordinea în care le-ar numerota genereazaSetItemi (BFS din
+        starea 0, succesorii în ordinea simbolurilor din closure) și elimină stările
+        inaccesibile din seturiItemi, tranzitii, tabelAction, tabelGoto și conflicte.
+        
+        Returns:
+            Numărul nou al fiecărei stări vechi (-1 pentru stările eliminate)
+        """
+        simbolDupaItem = self.simbolDupaItem
+        nouId = [-1] * len(self.seturiItemi)
+        nouId[0] = 0
+        ordine = [0]
+        for stare in ordine:
+            for simbol in dict.fromkeys(simbolDupaItem[cod] for cod in self.seturiItemi[stare].coduri):
+                if simbol != FARA_SIMBOL:
+                    destinatie = self.tranzitii[(stare, simbol)]
+                    if nouId[destinatie] < 0:
+                        nouId[destinatie] = len(ordine)
+                        ordine.append(destinatie)
+        if ordine == list(range(len(self.seturiItemi))):
+            return nouId
+        
+        self.seturiItemi = [self.seturiItemi[stare] for stare in ordine]
+        for setItemi in self.seturiItemi:
+            setItemi.id = nouId[setItemi.id]
+        self.tranzitii = {(nouId[stare], simbol): nouId[destinatie]
+                          for (stare, simbol), destinatie in self.tranzitii.items() if nouId[stare] >= 0}
+        self.tabelGoto = {(nouId[stare], simbol): nouId[destinatie]
+                          for (stare, simbol), destinatie in self.tabelGoto.items() if nouId[stare] >= 0}
+        
+        def renumeroteaza(actiune: str) -> str:
+            return f'd{nouId[int(actiune[1:])]}' if actiune[0] == 'd' else actiune
+        
+        self.tabelAction = {(nouId[stare], terminal): renumeroteaza(actiune)
+                            for (stare, terminal), actiune in self.tabelAction.items() if nouId[stare] >= 0}
+        self.conflicte = [(nouId[stare], terminal, renumeroteaza(existenta), renumeroteaza(noua))
+                          for stare, terminal, existenta, noua in self.conflicte if nouId[stare] >= 0]
+        return nouId
+    
+    def scrieGramaticaInFisier(self, numeFisier: str):
+        """
+        Scrie gramatica (neaugmentată) în formatul citit de citesteGramaticaDinFisier.
+        """
+        augmentata = bool(self.listaProductii) and self.listaProductii[0].simbolNeterminal == self.simbolStart \
+            and self.simbolStart.endswith("'")
+        with open(numeFisier, 'w') as f:
+            f.write(' '.join(neterminal for neterminal in self.listaNeterminale
+                             if not (augmentata and neterminal == self.simbolStart)) + '\n')
+            f.write(' '.join(terminal for terminal in self.listaTerminale
+                             if not (augmentata and terminal == '$')) + '\n')
+            f.write((self.simbolStart[:-1] if augmentata else self.simbolStart) + '\n')
+            productii = self.listaProductii[1:] if augmentata else self.listaProductii
+            f.write('\n'.join(f'{p.simbolNeterminal}->{self.separator.join(p.sirInlocuire)}' for p in productii))
+    
+    def diferenteFataDe(self, alta: 'Gramatica') -> List[str]:
+        """
+        Compară analiza, automatonul și tabelele cu ale altei construcții a aceleiași
+        gramatici (ex. o reconstrucție completă după actualizări incrementale).
+        
+        Returns:
+            Numele structurilor care diferă (listă goală dacă sunt identice)
+        """
+        perechi = [
+            ('listaProductii', [(p.simbolNeterminal, p.sirInlocuire) for p in self.listaProductii],
+             [(p.simbolNeterminal, p.sirInlocuire) for p in alta.listaProductii]),
+            ('anulabile', self.anulabile, alta.anulabile),
+            ('first', self.first, alta.first),
+            ('follow', self.follow, alta.follow),
+            ('seturiItemi', [(s.nucleu, s.coduri) for s in self.seturiItemi],
+             [(s.nucleu, s.coduri) for s in alta.seturiItemi]),
+            ('tranzitii', self.tranzitii, alta.tranzitii),
+            ('anticipari', self.anticipari, alta.anticipari),
+            ('tabelAction', self.tabelAction, alta.tabelAction),
+            ('tabelGoto', self.tabelGoto, alta.tabelGoto),
+            ('conflicte', sorted(self.conflicte), sorted(alta.conflicte)),
+            ('tabel', (self.tabel.coloane, list(self.tabel.celule)), (alta.tabel.coloane, list(alta.tabel.celule))),
+        ]
+        return [nume for nume, a, b in perechi if a != b]
+
     def afiseazaGramatica(self):
         print("Gramatica a fost creata\n")
         print("Neterminale: ")
@@ -578,237 +1386,767 @@ class Gramatica:
         for i in range (0, len(self.listaProductii)):
             self.listaProductii[i].afiseazaProductie()
 
+    def formaInitiala(self) -> tuple:
+        """
+        Forma propozițională din care pornesc propozițiile gramaticii: S din S' → S$
+        pentru gramatica augmentată (fără '$'), altfel simbolul de start.
+        """
+        if self.listaProductii and self.listaProductii[0].simbolNeterminal == self.simbolStart \
+                and self.listaProductii[0].sirInlocuire[-1:] == ('$',):
+            return tuple(self.listaProductii[0].sirInlocuire[:-1])
+        return (self.simbolStart,)
+    
+    def lungimiMinime(self) -> dict:
+        """
+        Calculează, prin punct fix, lungimea minimă a unui șir de terminale derivat din
+        fiecare neterminal (infinit pentru neterminalele neproductive).
+        """
+        infinit = float('inf')
+        lungimi = {neterminal: infinit for neterminal in self.listaNeterminale}
+        schimbat = True
+        while schimbat:
+            schimbat = False
+            for productie in self.listaProductii:
+                lungime = sum(lungimi.get(simbol, 1) for simbol in productie.sirInlocuire)
+                if lungime < lungimi[productie.simbolNeterminal]:
+                    lungimi[productie.simbolNeterminal] = lungime
+                    schimbat = True
+        return lungimi
+    
+    def enumereazaLanturi(self, lungimeMaxima: int, lungimeMinima: int = 0):
+        """
+        Generator leneș al propozițiilor gramaticii (fără '$' de final), în ordinea
+        lungimii și apoi a ordinii terminalelor; fiecare propoziție apare o singură dată,
+        chiar dacă gramatica este ambiguă. Propozițiile sunt text, cu terminalele unite
+        prin self.separator, deci pot fi date direct lui verificaSir.
+        Pentru fiecare lungime, prefixele de terminale sunt parcurse în adâncime; unui
+        prefix îi corespunde mulțimea (deduplicată) a formelor propoziționale rămase după
+        derivarea lui cea mai din stânga. Formele care nu mai pot încăpea în lungime
+        (după lungimea minimă a fiecărui neterminal) sunt eliminate, deci memoria
+        depinde doar de lungime, nu de numărul de propoziții.
+        
+        Args:
+            lungimeMaxima: Lungimea maximă a propozițiilor (în terminale)
+            lungimeMinima: Lungimea minimă a propozițiilor
+        """
+        lungimi = self.lungimiMinime()
+        # Pentru fiecare neterminal: (partea dreaptă, lungimea ei minimă)
+        productii = {}
+        for productie in self.listaProductii:
+            dreapta = tuple(productie.sirInlocuire)
+            productii.setdefault(productie.simbolNeterminal, []).append(
+                (dreapta, sum(lungimi.get(simbol, 1) for simbol in dreapta)))
+        ordineTerminal = {terminal: i for i, terminal in enumerate(self.listaTerminale)}
+        
+        start = self.formaInitiala()
+        start = (start, sum(lungimi.get(simbol, 1) for simbol in start))
+        
+        def normalizeaza(forme, buget):
+            """
+            Expandează neterminalul din stânga până când fiecare formă începe cu un terminal
+            sau e vidă; formele sunt perechi (simboluri, lungime minimă).
+            """
+            rezultat = []
+            vazute = set(forme)
+            deExpandat = list(forme)
+            while deExpandat:
+                forma, lungimeForma = deExpandat.pop()
+                if not forma or forma[0] not in productii:
+                    rezultat.append((forma, lungimeForma))
+                    continue
+                rest = forma[1:]
+                lungimeRest = lungimeForma - lungimi[forma[0]]
+                for dreapta, lungimeDreapta in productii[forma[0]]:
+                    if lungimeRest + lungimeDreapta <= buget:
+                        formaNoua = (dreapta + rest, lungimeRest + lungimeDreapta)
+                        if formaNoua not in vazute:
+                            vazute.add(formaNoua)
+                            deExpandat.append(formaNoua)
+            return rezultat
+        
+        for lungime in range(lungimeMinima, lungimeMaxima + 1):
+            # Parcurgere în adâncime cu stivă explicită: (prefix, forme rămase)
+            stiva = [((), [start])]
+            while stiva:
+                prefix, forme = stiva.pop()
+                forme = normalizeaza(forme, lungime - len(prefix))
+                if len(prefix) == lungime:
+                    if any(not forma for forma, _ in forme):
+                        yield self.separator.join(prefix)
+                    continue
+                urmatoare = {}
+                for forma, lungimeForma in forme:
+                    if forma:
+                        urmatoare.setdefault(forma[0], set()).add((forma[1:], lungimeForma - 1))
+                for terminal in sorted(urmatoare, key=lambda t: ordineTerminal.get(t, len(ordineTerminal)),
+                                       reverse=True):
+                    stiva.append((prefix + (terminal,), urmatoare[terminal]))
+    
     def genereazaLanturi(self, lungimeMaximaSir):
-        listaSiruri = [self.simbolStart]
-        while len(listaSiruri) > 0:
-            sirCurent = listaSiruri.pop(0)
-            if len(sirCurent) > lungimeMaximaSir:
-                continue
-            # verificam daca sirul curent este format doar din terminale, print daca da
-            if all(caracter in self.listaTerminale for caracter in sirCurent):
-                print(sirCurent)
-            else:
-                # generam noi siruri prin inlocuirea neterminalelor
-                for i in range(len(sirCurent)):
-                    # cautam primul neterminal in sirul curent
-                    if sirCurent[i] in self.listaNeterminale:
-                        # inlocuim neterminalul cu fiecare posibilitate de productie
-                        for productie in self.listaProductii:
-                            # daca simbolul neterminal corespunde, inlocuim si generam un nou sir in lista de lanturi
-                            if productie.simbolNeterminal == sirCurent[i]:
-                                noulSir = sirCurent[:i] + productie.sirInlocuire + sirCurent[i+1:]
-                                listaSiruri.append(noulSir)
-                        break
+        """
+        Afișează toate propozițiile gramaticii de lungime cel mult lungimeMaximaSir.
+        """
+        for sir in self.enumereazaLanturi(lungimeMaximaSir):
+            print(sir)
     
-    def verificaSir(self, sir_intrare: str):
+    def verificaSir(self, sir_intrare: str, construiesteArbore: bool = False):
         """
         Parsează un șir de intrare și generează cod intermediar (Three-Address Code).
         Translator Push Down pentru expresii aritmetice.
         
         Args:
             sir_intrare: String cu expresia aritmetică (ex: "a+a*a")
+            construiesteArbore: Dacă este True, arborele de derivare este construit în
+                self.arbore (ArboreSintaxa; rădăcina este FARA dacă șirul este respins)
         
         Returns:
             True dacă șirul este acceptat, False altfel
+        
+        Rezultatul rămâne în self.generator (și self.arbore), deci metoda nu poate fi apelată
+        din mai multe fire pe aceeași gramatică; pentru asta vezi sesiune.GramaticaCompilata.
         """
-        if not self.tabel:
+        self.arbore = None
+        if not self.tabelParsare:
             return False
         
         # Reset generator
         self.generator.reseteaza()
+        if construiesteArbore:
+            self.arbore = ArboreSintaxa.pentruTabel(self.tabelParsare)
         
-        # Inițializare - 3 stive paralele sincronizate
-        stiva_simboluri = ['$']      # Stiva de simboluri (terminale și neterminale)
-        stiva_stari = [0]            # Stiva de stări din automatonul LR
-        stiva_atribute = []          # Stiva de place values (string-uri: 'a', 't1', 't2', etc.)
-        sir_input = sir_intrare + '$'
-        pozitie = 0
-        pas = 0
-        max_pasi = 1000
+        return parseazaSir(self.tabelParsare, self.registruActiuni.actiuni, sir_intrare, self.generator, self.lexer,
+                           self.statistici, self.arbore)
+    
+    def verificaSiruri(self, siruri, workers: int = None, chunksize: int = 512):
+        """
+        Parsează un lot de șiruri în paralel, pe un pool de procese.
+        Tabelul compilat și acțiunile semantice sunt trimise o singură dată fiecărui proces,
+        iar șirurile sunt trimise în blocuri de câte `chunksize`.
         
-        while True:
-            pas += 1
-            if pas > max_pasi:
-                return False
-            
-            # Starea curentă
-            stare_curenta = stiva_stari[-1]
-            
-            # Simbolul curent din input
-            simbol_curent = sir_input[pozitie] if pozitie < len(sir_input) else '$'
-            
-            # Obține acțiunea din tabel
-            actiune = self.tabel.obtine(stare_curenta, simbol_curent)
-            
-            # Verifică tipul acțiunii
-            if actiune == '0' or actiune == '':
-                return False
-            
-            elif actiune == 'acc':
-                return True
-            
-            elif actiune[0] == 'd':
-                # Shift (deplasare) - adaugă în toate cele 3 stive
-                try:
-                    stare_noua = int(actiune[1:])
-                    
-                    # Pentru terminale, place value = simbolul însuși
-                    place_val = simbol_curent
-                    
-                    # Sincronizare: adaugă în toate cele 3 stive
-                    stiva_simboluri.append(simbol_curent)
-                    stiva_stari.append(stare_noua)
-                    stiva_atribute.append(place_val)
-                    pozitie += 1
-                    
-                except ValueError:
-                    return False
-            
-            elif actiune[0] == 'r':
-                # Reduce (reducere) - scoate din toate cele 3 stive
-                try:
-                    numar_productie = int(actiune[1:])
-                    
-                    if numar_productie < 0 or numar_productie >= len(self.listaProductii):
-                        return False
-                    
-                    productie = self.listaProductii[numar_productie]
-                    lungime_productie = len(productie.sirInlocuire)
-                    
-                    # Scoate simbolurile, stările și place values corespunzătoare din toate stivele
-                    place_values = []
-                    if lungime_productie > 0:
-                        for _ in range(lungime_productie):
-                            # Sincronizare: scoate din toate cele 3 stive
-                            if stiva_simboluri and len(stiva_simboluri) > 1:
-                                stiva_simboluri.pop()
-                            if stiva_stari and len(stiva_stari) > 1:
-                                stiva_stari.pop()
-                            if stiva_atribute:
-                                place_values.append(stiva_atribute.pop())
-                    
-                    # Execută acțiunea semantică (returnează place value pentru neterminal)
-                    place_nou = productie.genereaza_actiune_intermediara(place_values, self.generator)
-                    
-                    # Starea după reducere
-                    stare_dupa_reduce = stiva_stari[-1]
-                    neterminal = productie.simbolNeterminal
-                    
-                    # Goto
-                    stare_salt = self.tabel.obtine(stare_dupa_reduce, neterminal)
-                    
-                    if stare_salt == '0' or stare_salt == '':
-                        return False
-                    
-                    # Sincronizare: adaugă neterminalul, starea nouă și place value în toate stivele
-                    stiva_simboluri.append(neterminal)
-                    stiva_stari.append(int(stare_salt))
-                    stiva_atribute.append(place_nou)
-                    
-                except (ValueError, IndexError):
-                    return False
-            
-            else:
-                return False
+        Args:
+            siruri: Iterabil de șiruri de intrare (poate fi consumat leneș)
+            workers: Numărul de procese (implicit numărul de nuclee); 1 parsează în procesul curent
+            chunksize: Numărul de șiruri trimise unui proces într-un bloc
+        
+        Returns:
+            Lista de perechi (acceptat, cod_intermediar) în ordinea intrării;
+            cod_intermediar este lista de instrucțiuni (goală pentru șirurile respinse)
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or not self.tabelParsare:
+            return _verificaBloc(self.tabelParsare, self.registruActiuni.actiuni, self.lexer, siruri)
+        
+        rezultate = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_initializeazaWorker,
+                                 initargs=(self.tabelParsare, self.registruActiuni.actiuni, self.lexer)) as executor:
+            # Limitează blocurile aflate în lucru ca să nu materializăm tot iterabilul
+            inLucru = deque()
+            for bloc in _blocuri(siruri, chunksize):
+                inLucru.append(executor.submit(_verificaBlocWorker, bloc))
+                if len(inLucru) >= 2 * workers:
+                    rezultate.extend(inLucru.popleft().result())
+            while inLucru:
+                rezultate.extend(inLucru.popleft().result())
+        return rezultate
         
 class Productie:
     def __init__ (self, simbolNeterminal, sirInlocuire):
+        """
+        Args:
+            simbolNeterminal: Neterminalul din stânga
+            sirInlocuire: Simbolurile părții drepte, ca secvență de nume; un str este
+                citit caracter cu caracter (ex. 'E+T')
+        """
         self.simbolNeterminal = simbolNeterminal
-        self.sirInlocuire = sirInlocuire
+        self.sirInlocuire = tuple(sirInlocuire)
+        self.index = None  # Poziția în listaProductii, setată de Gramatica.indexeazaProductii
+        self.idStanga = None  # Codurile simbolurilor, setate tot de indexeazaProductii
+        self.idDreapta = None
 
     def afiseazaProductie(self):
-        print(self.simbolNeterminal + " -> " + self.sirInlocuire)
-    
-    def genereaza_actiune_intermediara(self, place_values, generator):
+        print(self.simbolNeterminal + " -> " + formateazaSimboluri(self.sirInlocuire))
+
+
+class TabelCompilat:
+    """
+    Tabelul ACTION/GOTO compilat în rânduri dense de întregi, construit direct din
+    tabelAction și tabelGoto. Fiecare celulă împachetează tipul acțiunii în cei 2 biți
+    de jos și ținta (stare sau număr de regulă) în rest: (tinta << 2) | tip.
+    Celulele GOTO folosesc tipul DEPLASARE, iar 0 înseamnă eroare.
+    """
+    def __init__(self, coloane: List[str], celule, lungimiProductii: List[int], coloaneStanga: List[int]):
         """
-        Execută acțiunea semantică asociată acestei producții.
-        
         Args:
-            place_values: Lista de place values (string-uri) în ordine inversă de pe stivă
-            generator: GeneratorCodIntermediar pentru generare cod
-        
-        Returns:
-            String reprezentând place value pentru neterminalul din stânga producției
-        """
-        # E → E + T
-        if self.simbolNeterminal == 'E' and self.sirInlocuire == 'E+T':
-            T_place = place_values[0]
-            E1_place = place_values[2]
-            E_place = generator.newtemp()
-            generator.emit(f"{E_place} := {E1_place} + {T_place}")
-            return E_place
-        
-        # E → T
-        elif self.simbolNeterminal == 'E' and self.sirInlocuire == 'T':
-            T_place = place_values[0]
-            return T_place
-        
-        # T → T * F
-        elif self.simbolNeterminal == 'T' and self.sirInlocuire == 'T*F':
-            F_place = place_values[0]
-            T1_place = place_values[2]
-            T_place = generator.newtemp()
-            generator.emit(f"{T_place} := {T1_place} * {F_place}")
-            return T_place
-        
-        # T → F
-        elif self.simbolNeterminal == 'T' and self.sirInlocuire == 'F':
-            F_place = place_values[0]
-            return F_place
-        
-        # F → (E)
-        elif self.simbolNeterminal == 'F' and self.sirInlocuire == '(E)':
-            E_place = place_values[1]
-            return E_place
-        
-        # F → a
-        elif self.simbolNeterminal == 'F' and self.sirInlocuire == 'a':
-            a_value = place_values[0]
-            return a_value
-        
-        # Producție fără acțiune semantică definită (ex: E' -> E$)
-        else:
-            return None
+            coloane: Simbolurile în ordinea coloanelor (terminale, '$', neterminale)
+            celule: Tabelul liniarizat pe rânduri (array('i') sau memoryview de întregi)
+            lungimiProductii: Lungimea părții drepte pentru fiecare regulă
+            coloaneStanga: Coloana neterminalului din stânga pentru fiecare regulă (-1 pentru S')
+        """
+        self.coloane = coloane
+        self.indexColoana = {simbol: i for i, simbol in enumerate(coloane)}
+        self.nrColoane = len(coloane)
+        self.celule = celule
+        self.nrStari = len(celule) // self.nrColoane
+        self.lungimiProductii = lungimiProductii
+        self.coloaneStanga = coloaneStanga
+        self.coloanaSfarsit = self.indexColoana['$']
+        self.separator = separatorSimboluri(coloane)  # ' ': intrarea text are simbolurile separate prin spații
+        self._structuriDriver = None
+    
+    def __getstate__(self):
+        # Celulele mmap-uite din cache nu pot fi serializate; le copiem într-un array
+        stare = self.__dict__.copy()
+        stare['_structuriDriver'] = None
+        if isinstance(self.celule, memoryview):
+            stare['celule'] = array('i', self.celule)
+        return stare
+    
+    def structuriDriver(self):
+        """
+        Returnează (baza, verificare, valori, implicit) în forma cu deplasare de rânduri
+        folosită de driver (vezi TabelComprimat); pentru tabelul dens rândurile nu se
+        suprapun, deci fiecare celulă aparține rândului ei și nu există reduceri implicite.
+        """
+        if self._structuriDriver is None:
+            baza = array('i', range(0, self.nrStari * self.nrColoane, self.nrColoane))
+            verificare = array('i', bytes(4 * len(self.celule)))
+            for stare, inceput in enumerate(baza):
+                verificare[inceput:inceput + self.nrColoane] = array('i', [inceput]) * self.nrColoane
+            self._structuriDriver = (baza, verificare, self.celule, array('i', bytes(4 * self.nrStari)))
+        return self._structuriDriver
+    
+    @classmethod
+    def dinTabele(cls, tabelAction: dict, tabelGoto: dict, coloane: List[str], coloanaSimbol: List[int],
+                  nrStari: int, productii):
+        """
+        Compilează dicționarele {(stare, cod simbol): acțiune} în rânduri dense;
+        coloanaSimbol dă coloana fiecărui cod de simbol.
+        """
+        nrColoane = len(coloane)
+        celule = array('i', bytes(4 * nrStari * nrColoane))
         
+        for (stare, terminal), actiune in tabelAction.items():
+            if actiune == 'acc':
+                valoare = ACCEPTARE
+            elif actiune[0] == 'd':
+                valoare = (int(actiune[1:]) << 2) | DEPLASARE
+            else:
+                valoare = (int(actiune[1:]) << 2) | REDUCERE
+            celule[stare * nrColoane + coloanaSimbol[terminal]] = valoare
         
-class TabelGramatica:
-    def __init__(self, numeFisier: str):
-        self.tabel = {}
-        self.selectoriColoana = []
-        self.citesteTabelDinFisier(numeFisier)
+        for (stare, neterminal), stareNoua in tabelGoto.items():
+            if coloanaSimbol[neterminal] >= 0:
+                celule[stare * nrColoane + coloanaSimbol[neterminal]] = (stareNoua << 2) | DEPLASARE
         
-    def citesteTabelDinFisier(self, numeFisier: str):
-        with open(numeFisier, 'r') as f:
-            linii = f.readlines()
-            
-            # Prima linie - selectori pentru coloane
-            self.selectoriColoana = linii[0].strip().split()
-            
-            # Restul liniilor - date (linia 1, 2, 3, ...)
-            for numarLinie in range(1, len(linii)):
-                valori = linii[numarLinie].strip().split()
-                if valori and len(valori) == len(self.selectoriColoana):  # Verifică că linia e validă
-                    # Creează dicționar pentru această linie (indexul liniei = numarLinie - 1)
-                    self.tabel[numarLinie - 1] = {}
-                    for i, selector in enumerate(self.selectoriColoana):
-                        self.tabel[numarLinie - 1][selector] = valori[i]
+        return cls.dinCelule(coloane, celule, productii)
+    
+    @classmethod
+    def dinCelule(cls, coloane: List[str], celule, productii):
+        """
+        Construiește tabelul peste celule deja compilate (ex. încărcate din cache).
+        """
+        indexColoana = {simbol: i for i, simbol in enumerate(coloane)}
+        lungimiProductii = [len(productie.sirInlocuire) for productie in productii]
+        coloaneStanga = [indexColoana.get(productie.simbolNeterminal, -1) for productie in productii]
+        return cls(coloane, celule, lungimiProductii, coloaneStanga)
     
     def obtine(self, selectorLinie: int, selectorColoana: str):
-        return self.tabel.get(selectorLinie, {}).get(selectorColoana, '0')
+        """
+        Returnează celula în formatul text al tabelului ('d5', 'r3', 'acc', '4' sau '0').
+        """
+        coloana = self.indexColoana.get(selectorColoana)
+        if coloana is None or not 0 <= selectorLinie < self.nrStari:
+            return '0'
+        actiune = self.celule[selectorLinie * self.nrColoane + coloana]
+        tip = actiune & 3
+        if tip == EROARE:
+            return '0'
+        if tip == ACCEPTARE:
+            return 'acc'
+        if coloana > self.coloanaSfarsit:
+            return str(actiune >> 2)
+        return ('d' if tip == DEPLASARE else 'r') + str(actiune >> 2)
     
     def afiseazaTabel(self):
         # Header
         print("     ", end="")
-        for selector in self.selectoriColoana:
+        for selector in self.coloane:
             print(f"{selector:5}", end="")
         print()
         
         # Date
-        for linie in sorted(self.tabel.keys()):
+        for linie in range(self.nrStari):
             print(f"{linie:4} ", end="")
-            for selector in self.selectoriColoana:
-                valoare = self.obtine(linie, selector)
-                print(f"{valoare:5}", end="")
+            for selector in self.coloane:
+                print(f"{self.obtine(linie, selector):5}", end="")
             print()
 
+class TabelComprimat:
+    """
+    Varianta comprimată a tabelului compilat, pentru parsare:
+    - fiecare stare are o reducere implicită (cea mai frecventă reducere din rândul ei,
+      exceptând regulile epsilon), care înlocuiește celulele de eroare, iar celulele
+      egale cu ea sunt eliminate;
+    - rândurile rămase identice sunt păstrate o singură dată;
+    - rândurile unice sunt împachetate prin deplasare (comb): rândul stării s ocupă
+      valori[baza[s] + coloana] acolo unde verificare[baza[s] + coloana] == baza[s].
+    Căutarea rămâne O(1): o celulă care nu aparține rândului dă implicit[s].
+    Reducerile implicite pot amâna detectarea unei erori, dar nu schimbă limbajul acceptat.
+    """
+    def __init__(self, coloane: List[str], baza, verificare, valori, implicit,
+                 lungimiProductii: List[int], coloaneStanga: List[int], nrRanduriUnice: int):
+        self.coloane = coloane
+        self.indexColoana = {simbol: i for i, simbol in enumerate(coloane)}
+        self.nrColoane = len(coloane)
+        self.nrStari = len(baza)
+        self.baza = baza
+        self.verificare = verificare
+        self.valori = valori
+        self.implicit = implicit
+        self.lungimiProductii = lungimiProductii
+        self.coloaneStanga = coloaneStanga
+        self.coloanaSfarsit = self.indexColoana['$']
+        self.separator = separatorSimboluri(coloane)
+        self.nrRanduriUnice = nrRanduriUnice
+    
+    @classmethod
+    def dinTabel(cls, tabel: TabelCompilat):
+        """
+        Comprimă un TabelCompilat dens.
+        """
+        nrColoane = tabel.nrColoane
+        nrTerminale = tabel.coloanaSfarsit + 1
+        celule = tabel.celule
+        
+        # Reducerea implicită și rândul rar (coloană, valoare) pentru fiecare stare
+        implicit = array('i', bytes(4 * tabel.nrStari))
+        randuri = []
+        for stare in range(tabel.nrStari):
+            rand = celule[stare * nrColoane:(stare + 1) * nrColoane]
+            frecvente = {}
+            for celula in rand[:nrTerminale]:
+                # Regulile epsilon nu devin implicite: ar putea crește stiva la nesfârșit pe o eroare
+                if celula & 3 == REDUCERE and tabel.lungimiProductii[celula >> 2]:
+                    frecvente[celula] = frecvente.get(celula, 0) + 1
+            if frecvente:
+                implicit[stare] = max(frecvente, key=lambda celula: (frecvente[celula], -celula))
+            randuri.append(tuple((coloana, celula) for coloana, celula in enumerate(rand)
+                                 if celula and not (coloana < nrTerminale and celula == implicit[stare])))
+        
+        # Deduplicare: stările cu rânduri identice primesc aceeași bază
+        randuriUnice = {}
+        for rand in randuri:
+            randuriUnice.setdefault(rand, len(randuriUnice))
+        
+        # Împachetare first-fit, rândurile cele mai dense primele; bazele sunt distincte.
+        # La o coliziune pe coloana c, baza sare direct la următoarea poziție liberă a lui c.
+        ocupat = bytearray(nrColoane)
+        bazeFolosite = set()
+        bazaRand = {}
+        for rand in sorted(randuriUnice, key=lambda r: (-len(r), randuriUnice[r])):
+            coloaneRand = [coloana for coloana, _ in rand]
+            baza = 0
+            while True:
+                if len(ocupat) < baza + nrColoane:
+                    ocupat.extend(bytes(baza + nrColoane - len(ocupat)))
+                for coloana in coloaneRand:
+                    if ocupat[baza + coloana]:
+                        baza = ocupat.find(0, baza + coloana + 1)
+                        baza = (len(ocupat) if baza < 0 else baza) - coloana
+                        break
+                else:
+                    if baza not in bazeFolosite:
+                        break
+                    baza += 1
+            bazeFolosite.add(baza)
+            bazaRand[rand] = baza
+            capat = baza + nrColoane
+            if len(ocupat) < capat:
+                ocupat.extend(bytes(capat - len(ocupat)))
+            for coloana in coloaneRand:
+                ocupat[baza + coloana] = 1
+        
+        lungime = len(ocupat)
+        valori = array('i', bytes(4 * lungime))
+        verificare = array('i', [-1]) * lungime
+        for rand, baza in bazaRand.items():
+            for coloana, celula in rand:
+                valori[baza + coloana] = celula
+                verificare[baza + coloana] = baza
+        
+        baze = array('i', (bazaRand[rand] for rand in randuri))
+        return cls(list(tabel.coloane), baze, verificare, valori, implicit,
+                   tabel.lungimiProductii, tabel.coloaneStanga, len(randuriUnice))
+    
+    def structuriDriver(self):
+        """Returnează (baza, verificare, valori, implicit) pentru driver."""
+        return self.baza, self.verificare, self.valori, self.implicit
+    
+    def actiune(self, stare: int, coloana: int) -> int:
+        """Celula împachetată pentru (stare, coloană), cu reducerea implicită pe terminale."""
+        baza = self.baza[stare]
+        if self.verificare[baza + coloana] == baza:
+            return self.valori[baza + coloana]
+        return self.implicit[stare] if coloana <= self.coloanaSfarsit else EROARE
+    
+    def obtine(self, selectorLinie: int, selectorColoana: str):
+        """
+        Returnează celula în formatul text al tabelului ('d5', 'r3', 'acc', '4' sau '0').
+        """
+        coloana = self.indexColoana.get(selectorColoana)
+        if coloana is None or not 0 <= selectorLinie < self.nrStari:
+            return '0'
+        actiune = self.actiune(selectorLinie, coloana)
+        tip = actiune & 3
+        if tip == EROARE:
+            return '0'
+        if tip == ACCEPTARE:
+            return 'acc'
+        if coloana > self.coloanaSfarsit:
+            return str(actiune >> 2)
+        return ('d' if tip == DEPLASARE else 'r') + str(actiune >> 2)
+    
+    def raportMemorie(self) -> dict:
+        """
+        Compară memoria ocupată de tabelul comprimat cu forma densă echivalentă.
+        """
+        dens = self.nrStari * self.nrColoane * self.valori.itemsize
+        comprimat = sum(len(a) * a.itemsize for a in (self.baza, self.verificare, self.valori, self.implicit))
+        return {
+            'stari': self.nrStari,
+            'randuriUnice': self.nrRanduriUnice,
+            'octetiDens': dens,
+            'octetiComprimat': comprimat,
+            'raport': comprimat / dens if dens else 1.0,
+        }
+
+
+def _digraf(relatie: List[List[int]], initial: List[int]) -> List[int]:
+    """
+    Algoritmul digraph (DeRemer–Pennello): calculează F(x) = F'(x) ∪ ⋃ {F(y) | x R y}
+    pentru mulțimi reprezentate ca bitset-uri întregi. Componentele tare conexe ale
+    relației sunt detectate pe parcurs, deci fiecare mulțime este calculată o singură dată.
+    
+    Args:
+        relatie: relatie[x] = lista nodurilor y cu x R y
+        initial: F'(x) pentru fiecare nod
+    
+    Returns:
+        Lista F(x) pentru fiecare nod
+    """
+    n = len(initial)
+    infinit = n + 1
+    rezultat = list(initial)
+    adancime = [0] * n
+    stiva = []
+    
+    for radacina in range(n):
+        if adancime[radacina]:
+            continue
+        stiva.append(radacina)
+        adancime[radacina] = len(stiva)
+        # Cadre DFS explicite: [nod, următorul vecin, adâncimea la intrare]
+        cadre = [[radacina, 0, len(stiva)]]
+        while cadre:
+            cadru = cadre[-1]
+            x = cadru[0]
+            vecini = relatie[x]
+            if cadru[1] < len(vecini):
+                y = vecini[cadru[1]]
+                cadru[1] += 1
+                if adancime[y] == 0:
+                    stiva.append(y)
+                    adancime[y] = len(stiva)
+                    cadre.append([y, 0, len(stiva)])
+                    continue
+                adancime[x] = min(adancime[x], adancime[y])
+                rezultat[x] |= rezultat[y]
+                continue
+            
+            cadre.pop()
+            if adancime[x] == cadru[2]:
+                # x este rădăcina unei componente tare conexe: toate nodurile ei primesc F(x)
+                while True:
+                    y = stiva.pop()
+                    adancime[y] = infinit
+                    rezultat[y] = rezultat[x]
+                    if y == x:
+                        break
+            if cadre:
+                parinte = cadre[-1][0]
+                adancime[parinte] = min(adancime[parinte], adancime[x])
+                rezultat[parinte] |= rezultat[x]
+    
+    return rezultat
+
+
+def parseazaSir(tabel: TabelCompilat, actiuni, sir_intrare, generator, lexer: Lexer = None,
+                statistici: Statistici = None, arbore: ArboreSintaxa = None) -> bool:
+    """
+    Driver-ul LR: parsează șirul pe tabelul compilat și emite codul intermediar
+    în generatorul dat (care trebuie resetat de apelant).
+    Cu lexer, șirul este tokenizat; altfel fiecare caracter este un terminal sau, dacă
+    gramatica are simboluri de mai multe caractere (tabel.separator), fiecare cuvânt
+    separat prin spații. Șirul poate fi dat și ca secvență de terminale.
+    Cu statistici, parsarea este instrumentată, iar cu arbore este construit și
+    arborele de derivare (vezi ParserPush).
+    
+    Returns:
+        True dacă șirul este acceptat, False altfel
+    """
+    parser = ParserPush(tabel, actiuni, generator, statistici=statistici, arbore=arbore)
+    if lexer is not None:
+        return parser.feedTokeni(lexer.tokenizeaza(sir_intrare)) and parser.finish()
+    if tabel.separator and isinstance(sir_intrare, str):
+        sir_intrare = sir_intrare.split()
+    return parser.feed(sir_intrare) and parser.finish()
+
+
+class ParserPush:
+    """
+    Parser LR în stil push: intrarea este primită pe bucăți prin feed() (ex. citită
+    dintr-un fișier sau socket), iar finish() marchează sfârșitul ei.
+    Stările sunt ținute într-un array('i') compact; stiva de simboluri este păstrată
+    doar în modul de depanare. Nu există limită de pași, iar memoria folosită depinde
+    doar de adâncimea stivei, nu de lungimea intrării.
+    """
+    def __init__(self, tabel: TabelCompilat, actiuni, generator: GeneratorCodIntermediar = None,
+                 depanare: bool = False, statistici: Statistici = None, arbore: ArboreSintaxa = None):
+        """
+        Args:
+            tabel: Tabelul compilat (TabelCompilat dens sau TabelComprimat)
+            actiuni: Acțiunea semantică (sau None) pentru fiecare producție, ca RegistruActiuni.actiuni
+            generator: Generatorul de cod intermediar (implicit unul nou)
+            depanare: Dacă este True, păstrează și stiva de simboluri (indecși de coloană)
+            statistici: Dacă este dat, numără deplasările, reducerile (și pe producții), adâncimea
+                maximă a stivei și temporarele; acțiunile sunt învelite și _consuma este
+                înlocuit doar pentru acest parser, deci bucla neinstrumentată rămâne neschimbată
+            arbore: Dacă este dat (un ArboreSintaxa gol), fiecare token și fiecare reducere
+                adaugă un nod în el, ca mai sus prin învelirea acțiunilor și a lui _consuma
+        """
+        self.tabel = tabel
+        self.actiuni = actiuni
+        self.generator = generator if generator is not None else GeneratorCodIntermediar()
+        self.stiva_stari = array('i', [0])   # Stiva de stări din automatonul LR
+        self.stiva_atribute = []             # Stiva de place values ('a', 't1', 't2', etc.)
+        self.stiva_simboluri = [tabel.coloanaSfarsit] if depanare else None
+        self.acceptat = False
+        self.eroare = False
+        self.statistici = statistici
+        if statistici is not None:
+            self.actiuni = statistici.instrumenteazaActiuni(actiuni, self.stiva_stari)
+            self._consuma = self._consumaInstrumentat
+        self.arbore = arbore
+        if arbore is not None:
+            self.actiuni = arbore.actiuniCuNoduri(self.actiuni, tabel.lungimiProductii)
+            self._consumaFaraArbore = self._consuma
+            self._consuma = self._consumaArbore
+    
+    def feed(self, bucata) -> bool:
+        """
+        Consumă următoarea bucată din intrare; fiecare element este un terminal (caracterele
+        unui str sau numele din orice altă secvență, ex. lista cuvintelor unui text).
+        
+        Returns:
+            False dacă a fost detectată o eroare de sintaxă, True altfel
+        """
+        indexColoana = self.tabel.indexColoana
+        nrTerminale = self.tabel.coloanaSfarsit + 1
+        return self._consuma((indexColoana.get(simbol, nrTerminale), simbol) for simbol in bucata)
+    
+    def feedTokeni(self, tokeni) -> bool:
+        """
+        Consumă tokeni (terminal, lexem) produși de Lexer; lexemul devine place value.
+        
+        Returns:
+            False dacă a fost detectată o eroare de sintaxă, True altfel
+        """
+        indexColoana = self.tabel.indexColoana
+        nrTerminale = self.tabel.coloanaSfarsit + 1
+        return self._consuma((indexColoana.get(terminal, nrTerminale), lexem) for terminal, lexem in tokeni)
+    
+    def finish(self) -> bool:
+        """
+        Marchează sfârșitul intrării.
+        
+        Returns:
+            True dacă intrarea este acceptată, False altfel
+        """
+        # S' → S$ deplasează '$' înainte de acceptare, deci mai e nevoie de un '$' ca anticipare
+        sfarsit = self.tabel.coloanaSfarsit
+        self._consuma(((sfarsit, '$'), (sfarsit, '$')))
+        return self.acceptat
+    
+    def parseazaFlux(self, flux, marimeBloc: int = 1 << 16) -> bool:
+        """
+        Parsează tot conținutul unui flux text (fișier, socket.makefile() etc.) pe blocuri.
+        Dacă simbolurile sunt separate prin spații, un cuvânt tăiat la capătul unui bloc
+        este completat cu începutul blocului următor.
+        """
+        if not self.tabel.separator:
+            for bucata in iter(lambda: flux.read(marimeBloc), ''):
+                if not self.feed(bucata):
+                    return False
+            return self.finish()
+        rest = ''
+        for bucata in iter(lambda: flux.read(marimeBloc), ''):
+            cuvinte = (rest + bucata).split()
+            rest = cuvinte.pop() if cuvinte and not bucata[-1].isspace() else ''
+            if not self.feed(cuvinte):
+                return False
+        return (not rest or self.feed((rest,))) and self.finish()
+    
+    def _consumaArbore(self, perechi) -> bool:
+        """
+        _consuma cu frunze pentru tokeni; la acceptare, rădăcina este nodul simbolului de start.
+        """
+        arbore = self.arbore
+        rezultat = self._consumaFaraArbore(arbore.frunze(perechi, self.tabel.coloanaSfarsit))
+        if self.acceptat and arbore.radacina == FARA:
+            arbore.radacina = arbore.stivaNoduri[0]
+        return rezultat
+    
+    def _consumaInstrumentat(self, perechi) -> bool:
+        """
+        _consuma cu numărarea simbolurilor deplasate și a temporarelor generate.
+        """
+        statistici = self.statistici
+        terminat = self.eroare or self.acceptat
+        temporare = self.generator.contor_temp
+        rezultat = ParserPush._consuma(self, statistici.numaraDeplasari(perechi, self.stiva_stari))
+        statistici.temporare += self.generator.contor_temp - temporare
+        if not terminat and (self.eroare or self.acceptat):
+            # Simbolul la care driverul s-a oprit a fost numărat, dar nu a fost deplasat
+            statistici.deplasari -= 1
+            statistici.inregistreazaParsare(self.acceptat)
+        return rezultat
+    
+    def _consuma(self, perechi) -> bool:
+        """
+        Bucla principală a driver-ului: pentru fiecare pereche (coloană, place value)
+        aplică reducerile până la deplasarea simbolului.
+        """
+        if self.eroare or self.acceptat:
+            return not self.eroare
+        
+        tabel = self.tabel
+        baza, verificare, valori, implicit = tabel.structuriDriver()
+        nrTerminale = tabel.coloanaSfarsit + 1
+        lungimiProductii = tabel.lungimiProductii
+        coloaneStanga = tabel.coloaneStanga
+        actiuni = self.actiuni
+        generator = self.generator
+        stiva_stari = self.stiva_stari
+        stiva_atribute = self.stiva_atribute
+        stiva_simboluri = self.stiva_simboluri
+        
+        nrStari = tabel.nrStari
+        
+        for coloana, place_val in perechi:
+            if coloana >= nrTerminale:
+                self.eroare = True
+                return False
+            
+            # Fără a deplasa simbolul, stiva crește doar prin reduceri epsilon; peste nrStari
+            # stări noi, una se repetă și driverul ar cicla la nesfârșit (tabel cu conflicte)
+            limita = len(stiva_stari) + nrStari
+            while True:
+                # Obține acțiunea împachetată din rândul stării curente
+                # (o celulă care nu aparține rândului înseamnă reducerea implicită a stării)
+                stare = stiva_stari[-1]
+                inceput = baza[stare]
+                actiune = valori[inceput + coloana]
+                if verificare[inceput + coloana] != inceput:
+                    actiune = implicit[stare]
+                tip = actiune & 3
+                
+                if tip == DEPLASARE:
+                    # Shift (deplasare) - pentru terminale, place value = simbolul însuși
+                    stiva_stari.append(actiune >> 2)
+                    stiva_atribute.append(place_val)
+                    if stiva_simboluri is not None:
+                        stiva_simboluri.append(coloana)
+                    break
+                
+                elif tip == REDUCERE:
+                    numar_productie = actiune >> 2
+                    lungime_productie = lungimiProductii[numar_productie]
+                    
+                    # Acțiunea semantică primește place values ale părții drepte, în ordine,
+                    # și returnează place value-ul neterminalului (producțiile fără acțiune dau None)
+                    actiune_semantica = actiuni[numar_productie]
+                    if lungime_productie > 0:
+                        place_nou = (actiune_semantica(stiva_atribute[-lungime_productie:], generator)
+                                     if actiune_semantica is not None else None)
+                        del stiva_stari[-lungime_productie:]
+                        del stiva_atribute[-lungime_productie:]
+                        if stiva_simboluri is not None:
+                            del stiva_simboluri[-lungime_productie:]
+                    else:
+                        if len(stiva_stari) > limita:
+                            self.eroare = True
+                            return False
+                        place_nou = actiune_semantica([], generator) if actiune_semantica is not None else None
+                    
+                    # Goto din starea rămasă în vârful stivei
+                    coloana_neterminal = coloaneStanga[numar_productie]
+                    inceput = baza[stiva_stari[-1]]
+                    salt = valori[inceput + coloana_neterminal]
+                    if salt == EROARE or verificare[inceput + coloana_neterminal] != inceput:
+                        self.eroare = True
+                        return False
+                    
+                    stiva_stari.append(salt >> 2)
+                    stiva_atribute.append(place_nou)
+                    if stiva_simboluri is not None:
+                        stiva_simboluri.append(coloana_neterminal)
+                
+                elif tip == ACCEPTARE:
+                    self.acceptat = True
+                    return True
+                
+                else:
+                    self.eroare = True
+                    return False
+        
+        return True
+
+
+# Starea fiecărui proces din pool-ul folosit de verificaSiruri
+_tabelWorker = None
+_actiuniWorker = None
+_lexerWorker = None
+
+
+def _initializeazaWorker(tabel, actiuni, lexer):
+    global _tabelWorker, _actiuniWorker, _lexerWorker
+    _tabelWorker = tabel
+    _actiuniWorker = actiuni
+    _lexerWorker = lexer
+
+
+def _verificaBlocWorker(bloc):
+    return _verificaBloc(_tabelWorker, _actiuniWorker, _lexerWorker, bloc)
+
+
+def _verificaBloc(tabel, actiuni, lexer, siruri):
+    generator = GeneratorCodIntermediar()
+    rezultate = []
+    for sir in siruri:
+        generator.reseteaza()
+        acceptat = bool(tabel) and parseazaSir(tabel, actiuni, sir, generator, lexer)
+        rezultate.append((acceptat, generator.cod_intermediar if acceptat else []))
+    return rezultate
+
+
+def _blocuri(iterabil, marime: int):
+    iterator = iter(iterabil)
+    while True:
+        bloc = list(islice(iterator, marime))
+        if not bloc:
+            return
+        yield bloc
+
+
 lungimeMaximaSir = 10
@@ -0,0 +1,145 @@
+import sys
+import tracemalloc
+from typing import Callable, List
+
+# Evenimentele trimise observatorilor
+EVENIMENT_FAZA = 'faza'                # o fază a genereazaTabel s-a terminat
+EVENIMENT_CONSTRUCTIE = 'constructie'  # tabelul este construit
+EVENIMENT_PARSARE = 'parsare'          # o parsare s-a terminat (acceptare sau eroare)
+
+
+class Statistici:
+    """
+    Statistici opționale pentru construcția tabelului și pentru parsare.
+    Un obiect Statistici dat la Gramatica (sau la ParserPush) este completat pe loc;
+    fără el, codul instrumentat nu este apelat deloc în bucla driver-ului.
+    Observatorii sunt apelați cu (eveniment, date) la fiecare eveniment, de exemplu
+    pentru a trimite valorile într-un sistem de metrici.
+    """
+    def __init__(self, observator: Callable[[str, dict], None] = None):
+        """
+        Args:
+            observator: Dacă este dat, primul observator înregistrat
+        """
+        self.observatori = []
+        if observator is not None:
+            self.observatori.append(observator)
+
+        # Construcție
+        # Dicționar {fază: {'secunde': durată, 'deltaBlocuri': diferența netă a blocurilor alocate
+        # (poate fi 0 sau negativă), 'varfOcteti': vârful memoriei alocate în fază, doar dacă
+        # tracemalloc urmărește alocările, altfel None}}
+        self.faze = {}
+        self.stari = 0
+        self.iteratiiClosure = 0  # Itemi de kernel procesați de closure plus neterminale expandate
+        self.apeluriGoto = 0      # Tranziții calculate (kernel-uri succesor)
+
+        # Parsare (cumulat peste toate parsările)
+        self.parsari = 0
+        self.deplasari = 0
+        self.reduceri = 0
+        self.reduceriPeProductie = {}  # Dicționar {index producție: număr de reduceri}
+        self.adancimeMaxima = 0        # Adâncimea maximă a stivei de stări (fără starea 0)
+        self.temporare = 0             # Variabile temporare generate de acțiunile semantice
+
+    def adaugaObservator(self, observator: Callable[[str, dict], None]):
+        self.observatori.append(observator)
+
+    def notifica(self, eveniment: str, date: dict):
+        for observator in self.observatori:
+            observator(eveniment, date)
+
+    @staticmethod
+    def incepeFaza():
+        """Pornește măsurarea memoriei unei faze; rezultatul este dat lui inregistreazaFaza."""
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            return sys.getallocatedblocks(), tracemalloc.get_traced_memory()[0]
+        return sys.getallocatedblocks(), None
+
+    def inregistreazaFaza(self, nume: str, secunde: float, inceput):
+        """
+        Args:
+            nume: Numele fazei
+            secunde: Durata fazei
+            inceput: Rezultatul lui incepeFaza, apelat chiar înaintea fazei
+        """
+        blocuri, octeti = inceput
+        date = {'secunde': secunde, 'deltaBlocuri': sys.getallocatedblocks() - blocuri,
+                'varfOcteti': tracemalloc.get_traced_memory()[1] - octeti if octeti is not None else None}
+        self.faze[nume] = date
+        self.notifica(EVENIMENT_FAZA, {'faza': nume, **date})
+
+    def inregistreazaConstructie(self, stari: int):
+        self.stari = stari
+        self.notifica(EVENIMENT_CONSTRUCTIE, {'stari': stari, 'iteratiiClosure': self.iteratiiClosure,
+                                              'apeluriGoto': self.apeluriGoto})
+
+    def inregistreazaParsare(self, acceptat: bool):
+        self.parsari += 1
+        self.notifica(EVENIMENT_PARSARE, {'acceptat': acceptat, 'deplasari': self.deplasari,
+                                          'reduceri': self.reduceri, 'adancimeMaxima': self.adancimeMaxima,
+                                          'temporare': self.temporare})
+
+    def numaraDeplasari(self, perechi, stiva_stari):
+        """
+        Generator care numără simbolurile de intrare consumate de driver. Înaintea fiecărui
+        simbol (și la sfârșit) simbolul anterior a fost deplasat, deci adâncimea stivei este
+        eșantionată și aici: un vârf atins printr-o deplasare este numărat și dacă nu urmează
+        nicio reducere.
+        """
+        for pereche in perechi:
+            self._esantioneazaAdancime(stiva_stari)
+            self.deplasari += 1
+            yield pereche
+        self._esantioneazaAdancime(stiva_stari)
+
+    def _esantioneazaAdancime(self, stiva_stari):
+        adancime = len(stiva_stari) - 1
+        if adancime > self.adancimeMaxima:
+            self.adancimeMaxima = adancime
+
+    def instrumenteazaActiuni(self, actiuni: list, stiva_stari) -> List['ActiuneInstrumentata']:
+        """
+        Returnează acțiunile semantice învelite astfel încât fiecare reducere (inclusiv
+        pentru producțiile fără acțiune) să fie numărată și să eșantioneze adâncimea
+        stivei înaintea ei (deplasările o eșantionează în numaraDeplasari).
+        """
+        return [ActiuneInstrumentata(actiune, index, self, stiva_stari)
+                for index, actiune in enumerate(actiuni)]
+
+    def caDictionar(self) -> dict:
+        """Statisticile ca dicționar serializabil JSON."""
+        return {
+            'faze': self.faze,
+            'stari': self.stari,
+            'iteratiiClosure': self.iteratiiClosure,
+            'apeluriGoto': self.apeluriGoto,
+            'parsari': self.parsari,
+            'deplasari': self.deplasari,
+            'reduceri': self.reduceri,
+            'reduceriPeProductie': self.reduceriPeProductie,
+            'adancimeMaxima': self.adancimeMaxima,
+            'temporare': self.temporare,
+        }
+
+
+class ActiuneInstrumentata:
+    """
+    Învelește acțiunea semantică a unei producții: numără reducerea, apoi execută acțiunea.
+    """
+    __slots__ = ('actiune', 'index', 'statistici', 'stiva_stari')
+
+    def __init__(self, actiune, index: int, statistici: Statistici, stiva_stari):
+        self.actiune = actiune
+        self.index = index
+        self.statistici = statistici
+        self.stiva_stari = stiva_stari
+
+    def __call__(self, valori, generator):
+        statistici = self.statistici
+        statistici.reduceri += 1
+        statistici.reduceriPeProductie[self.index] = statistici.reduceriPeProductie.get(self.index, 0) + 1
+        # Driverul apelează acțiunea înainte de a scoate partea dreaptă de pe stivă
+        statistici._esantioneazaAdancime(self.stiva_stari)
+        return self.actiune(valori, generator) if self.actiune is not None else None
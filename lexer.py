@@ -0,0 +1,100 @@
+import re
+from typing import List, Tuple
+
+# Numele special pentru clasele de tokeni care sunt consumate dar nu ajung la parser
+IGNORA = '%ignora'
+
+
+class Lexer:
+    """
+    Analizorul lexical: clasele de tokeni sunt expresii regulate asociate terminalelor
+    gramaticii, compilate într-o singură expresie regulată master.
+    Regulile sunt încercate în ordinea declarării (prima care se potrivește câștigă).
+    """
+    def __init__(self, reguli: List[Tuple[str, str]], terminale: List[str] = None):
+        """
+        Args:
+            reguli: Perechi (terminal, expresie regulată); terminalul IGNORA marchează
+                tokeni ignorați (ex. spații)
+            terminale: Dacă este dată, lista de terminale ale gramaticii față de care se validează regulile
+        """
+        self.reguli = reguli
+        ignorate = []
+        alternative = []
+        # terminalPeGrup[i] = terminalul regulii al cărei grup exterior are indexul i
+        self.terminalPeGrup = [None]
+        for terminal, expresie in reguli:
+            if terminale is not None and terminal != IGNORA and terminal not in terminale:
+                raise ValueError(f"Terminalul '{terminal}' din lexer nu există în gramatică")
+            compilat = re.compile(expresie)
+            if compilat.match(''):
+                raise ValueError(f"Expresia pentru '{terminal}' acceptă șirul vid: {expresie}")
+            if terminal == IGNORA:
+                # Tokenii ignorați sunt absorbiți ca prefix al fiecărei potriviri
+                ignorate.append(expresie)
+                self.terminalPeGrup.extend([None] * compilat.groups)
+            else:
+                alternative.append((terminal, expresie, compilat.groups))
+        
+        ramuri = []
+        for terminal, expresie, nrGrupuri in alternative:
+            ramuri.append(f'({expresie})')
+            self.terminalPeGrup.append(terminal)
+            self.terminalPeGrup.extend([None] * nrGrupuri)
+        # Un caracter nerecunoscut produce o eroare; \Z absoarbe tokenii ignorați de la final
+        ramuri.append('(.)')
+        self.indexEroare = len(self.terminalPeGrup)
+        self.terminalPeGrup.append(None)
+        ramuri.append(r'\Z')
+        
+        prefix = f"(?:{'|'.join(ignorate)})*" if ignorate else ''
+        self.master = re.compile(prefix + '(?:' + '|'.join(ramuri) + ')', re.DOTALL)
+
+    @classmethod
+    def dinFisier(cls, numeFisier: str, terminale: List[str] = None):
+        """
+        Citește declarațiile lexerului: câte o linie `terminal expresie`, separate prin spații.
+        Liniile goale și cele care încep cu '#' sunt ignorate.
+        """
+        reguli = []
+        with open(numeFisier, 'r') as f:
+            for linie in f:
+                linie = linie.strip()
+                if not linie or linie.startswith('#'):
+                    continue
+                terminal, expresie = linie.split(None, 1)
+                reguli.append((terminal, expresie))
+        return cls(reguli, terminale)
+
+    def tokenizeaza(self, text: str):
+        """
+        Generator de tokeni (terminal, lexem) pentru textul dat.
+        La un caracter nerecunoscut produce (None, caracter) și se oprește.
+        """
+        terminalPeGrup = self.terminalPeGrup
+        indexEroare = self.indexEroare
+        for potrivire in self.master.finditer(text):
+            grup = potrivire.lastindex
+            if grup is None:
+                return
+            if grup == indexEroare:
+                yield None, potrivire.group(grup)
+                return
+            yield terminalPeGrup[grup], potrivire.group(grup)
+
+    def tokenizeazaFlux(self, flux, marimeBloc: int = 1 << 20):
+        """
+        Generator de tokeni pentru un flux text citit pe blocuri.
+        Blocurile sunt tăiate după ultimul '\\n', deci doar tokenii ignorați pot conține '\\n'.
+        """
+        rest = ''
+        for bloc in iter(lambda: flux.read(marimeBloc), ''):
+            bloc = rest + bloc
+            taietura = bloc.rfind('\n') + 1
+            rest = bloc[taietura:]
+            for token in self.tokenizeaza(bloc[:taietura]):
+                yield token
+                if token[0] is None:
+                    return
+        yield from self.tokenizeaza(rest)
+
@@ -1,6 +1,6 @@
 from gramatica import Gramatica
 
-gramatica = Gramatica("gramatica.txt")
+gramatica = Gramatica("gramatica.txt", fisierTabel="tabel_generat_gramatica.txt")
 
 gramatica.afiseazaGramatica()
 
@@ -0,0 +1,181 @@
+import operator
+import re
+import sys
+
+from cod_intermediar import GeneratorCodIntermediar, Temporar
+
+# Operatorii pentru care ordinea operanzilor nu contează la numerotarea valorilor
+OPERATORI_COMUTATIVI = frozenset({'+', '*'})
+
+_EVALUARE_BINARA = {'+': operator.add, '-': operator.sub, '*': operator.mul}
+_EVALUARE_UNARA = {'-': operator.neg, '+': operator.pos}
+_LITERAL_INTREG = re.compile(r'[0-9]+')
+_LITERAL_REAL = re.compile(r'[0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?|[0-9]+[eE][+-]?[0-9]+')
+
+
+def valoareConstanta(operand):
+    """Valoarea numerică a unui operand literal (ex. '42', '1.5'), sau None pentru nume și temporare."""
+    if not isinstance(operand, str):
+        return None
+    if _LITERAL_INTREG.fullmatch(operand):
+        return int(operand)
+    if _LITERAL_REAL.fullmatch(operand):
+        return float(operand)
+    return None
+
+
+def _pliaza(op, arg1, arg2):
+    """Rezultatul literal al operației, dacă operanzii sunt literali și operația este sigură; altfel None."""
+    valoare1 = valoareConstanta(arg1)
+    if valoare1 is None:
+        return None
+    if arg2 is None:
+        functie = _EVALUARE_UNARA.get(op)
+        return None if functie is None else str(functie(valoare1))
+    valoare2 = valoareConstanta(arg2)
+    if valoare2 is None:
+        return None
+    if op == '/':
+        # Împărțirea este pliată doar când rezultatul nu depinde de semantica împărțirii întregi
+        if valoare2 == 0 or (isinstance(valoare1, int) and isinstance(valoare2, int) and valoare1 % valoare2):
+            return None
+        return str(valoare1 // valoare2 if isinstance(valoare1, int) and isinstance(valoare2, int)
+                   else valoare1 / valoare2)
+    functie = _EVALUARE_BINARA.get(op)
+    return None if functie is None else str(functie(valoare1, valoare2))
+
+
+def _cheieSortare(operand):
+    return isinstance(operand, Temporar), str(operand)
+
+
+def _materializeaza(inlocuire: dict, rezultat: list, variabile) -> int:
+    """
+    Temporarele înlocuite cu una dintre `variabile` (nume care urmează să fie reatribuite)
+    primesc valoarea acum, printr-o copie, și nu mai sunt înlocuite.
+
+    Returns:
+        Numărul de copii scrise înapoi (nu mai sunt propagate)
+    """
+    materializate = 0
+    for temporar, valoare in list(inlocuire.items()):
+        if valoare in variabile:
+            rezultat.append((':=', valoare, None, temporar))
+            del inlocuire[temporar]
+            materializate += 1
+    return materializate
+
+
+def optimizeaza(generator: GeneratorCodIntermediar, iesiri=None) -> dict:
+    """
+    Optimizează pe loc codul păstrat de generator (un singur bloc de bază):
+    numerotarea locală a valorilor elimină subexpresiile comune (cu operanzii
+    operatorilor comutativi ordonați canonic), copiile și operațiile pe literali sunt
+    propagate sau pliate, iar la final temporarele moarte sunt eliminate.
+    Temporarele au o singură atribuire, deci pot fi înlocuite direct cu valoarea lor;
+    instrucțiunile text (emit cu un singur șir) nu sunt analizate și opresc
+    numerotarea și eliminarea codului mort dinaintea lor.
+
+    Args:
+        generator: Generatorul cu codul de optimizat (creat cu pastreaza=True)
+        iesiri: Temporarele citite după bloc (implicit rezultatul ultimei instrucțiuni);
+            dacă una a fost înlocuită, valoarea ei este copiată înapoi la final
+
+    Returns:
+        Raport cu numărul de instrucțiuni înainte și după și cu numărul fiecărei transformări
+    """
+    quadruple = list(generator.quadruple())
+    if iesiri is None:
+        iesiri = [quadruple[-1][3]] if quadruple and isinstance(quadruple[-1][3], Temporar) else []
+    raport = {'inainte': len(quadruple), 'dupa': 0, 'subexpresiiComune': 0, 'constantePliate': 0,
+              'copiiPropagate': 0, 'temporareMoarte': 0}
+
+    inlocuire = {}   # Dicționar {temporar: operandul care îi ține valoarea}
+    expresii = {}    # Dicționar {(op, arg1, arg2): operandul care ține deja valoarea}
+    rezultat = []
+    for op, arg1, arg2, destinatie in quadruple:
+        if op is None:
+            # Instrucțiunea text poate reatribui orice variabilă cu nume
+            nume = {valoare for valoare in inlocuire.values()
+                    if isinstance(valoare, str) and valoareConstanta(valoare.lstrip('-')) is None}
+            raport['copiiPropagate'] -= _materializeaza(inlocuire, rezultat, nume)
+            rezultat.append((op, arg1, arg2, destinatie))
+            expresii.clear()
+            continue
+        arg1 = inlocuire.get(arg1, arg1)
+        arg2 = inlocuire.get(arg2, arg2)
+        temporara = isinstance(destinatie, Temporar)
+        if not temporara:
+            # O variabilă cu nume poate fi reatribuită: valorile calculate din ea nu mai sunt valide
+            expresii = {cheie: valoare for cheie, valoare in expresii.items()
+                        if destinatie not in cheie and valoare != destinatie}
+            # La fel temporarele înlocuite cu ea: le păstrăm valoarea dinaintea reatribuirii
+            raport['copiiPropagate'] -= _materializeaza(inlocuire, rezultat, (destinatie,))
+
+        if op == ':=':
+            if not temporara:
+                # Copia într-o variabilă cu nume rămâne în cod; doar operandul ei a fost înlocuit
+                rezultat.append((op, arg1, None, destinatie))
+                continue
+            valoare, contor = arg1, 'copiiPropagate'
+        else:
+            valoare, contor = _pliaza(op, arg1, arg2), 'constantePliate'
+            if valoare is None:
+                if op in OPERATORI_COMUTATIVI and arg2 is not None:
+                    cheie = (op, *sorted((arg1, arg2), key=_cheieSortare))
+                else:
+                    cheie = (op, arg1, arg2)
+                valoare, contor = expresii.get(cheie), 'subexpresiiComune'
+                if valoare is None:
+                    rezultat.append((op, arg1, arg2, destinatie))
+                    if temporara:
+                        expresii[cheie] = destinatie
+                    continue
+
+        raport[contor] += 1
+        if temporara:
+            inlocuire[destinatie] = valoare
+        else:
+            rezultat.append((':=', valoare, None, destinatie))
+
+    # Temporarele de ieșire înlocuite primesc înapoi valoarea
+    for temporar in iesiri:
+        if temporar in inlocuire:
+            rezultat.append((':=', inlocuire[temporar], None, temporar))
+
+    # Eliminarea temporarelor moarte, de la final spre început
+    vii = set(iesiri)
+    toateVii = False
+    pastrate = []
+    for quad in reversed(rezultat):
+        op, arg1, arg2, destinatie = quad
+        if op is None:
+            toateVii = True
+        elif isinstance(destinatie, Temporar) and destinatie not in vii and not toateVii:
+            raport['temporareMoarte'] += 1
+            continue
+        pastrate.append(quad)
+        vii.update(operand for operand in (arg1, arg2) if isinstance(operand, Temporar))
+    pastrate.reverse()
+
+    generator.inlocuiesteCod(pastrate)
+    raport['dupa'] = len(pastrate)
+    return raport
+
+
+if __name__ == '__main__':
+    # python optimizare.py [gramatica.txt] "a*a+(a*a+a)" ...
+    from gramatica import Gramatica
+
+    argumente = sys.argv[1:] or ['a*a+(a*a+a)']
+    numeGramatica = argumente.pop(0) if argumente[0].endswith('.txt') else 'gramatica.txt'
+    gramatica = Gramatica(numeGramatica)
+    for sir in argumente:
+        print(f"Șir: '{sir}'")
+        if not gramatica.verificaSir(sir):
+            print("RESPINS\n")
+            continue
+        gramatica.generator.afiseaza_cod_intermediar()
+        raport = optimizeaza(gramatica.generator)
+        gramatica.generator.afiseaza_cod_intermediar()
+        print(f"Instrucțiuni: {raport['inainte']} -> {raport['dupa']} ({raport})\n")
@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import List
+
+from cod_intermediar import GeneratorCodIntermediar, Temporar, formateazaQuad
+from gramatica import ParserPush
+
+def _renumeroteaza(atribute: list, prag: int, deplasare: int) -> list:
+    """Atributele cu temporarele mai mari decât `prag` renumerotate cu `deplasare`."""
+    return [Temporar(valoare + deplasare) if type(valoare) is Temporar and valoare > prag else valoare
+            for valoare in atribute]
+
+
+def _renumeroteazaColoana(coloana: array, prag: int, deplasare: int) -> array:
+    """La fel, pentru o coloană de cod, unde temporarul tn este codificat ca -n."""
+    return array('i', [cod - deplasare if cod < -prag else cod for cod in coloana])
+
+
+class PunctControl:
+    """
+    Configurația parserului după consumarea primelor `pozitie` simboluri ale intrării
+    (stiva de stări, stiva de atribute, contorul de temporare) și codul emis de acolo
+    până la următorul punct de control (sau până la sfârșitul parsării).
+    Configurația depinde doar de text[:pozitie], deci rămâne validă la orice editare după ea.
+    Atributele și codul sunt aduse la numerotarea curentă a temporarelor doar la cerere
+    (vezi ParserIncremental._actualizeaza); `versiune` este numărul de renumerotări din
+    jurnalul parserului deja aplicate.
+    """
+    __slots__ = ('pozitie', 'stari', 'atribute', 'contorTemp', 'cod', 'contorFinal', 'versiune')
+
+    def __init__(self, pozitie: int, stari: array, atribute: list, contorTemp: int, versiune: int):
+        self.pozitie = pozitie
+        self.stari = stari
+        self.atribute = atribute
+        self.contorTemp = contorTemp
+        self.cod = None  # Coloanele (op, arg1, arg2, rezultat) ale segmentului de cod
+        self.contorFinal = contorTemp  # Contorul de temporare la sfârșitul segmentului
+        self.versiune = versiune
+
+
+class ParserIncremental:
+    """
+    Reparsare incrementală a unei intrări editate (fiecare caracter este un terminal sau,
+    dacă gramatica are simboluri de mai multe caractere, fiecare cuvânt; pozițiile și
+    editările numără atunci cuvinte).
+    La parsare sunt păstrate puncte de control la fiecare `interval` simboluri, fiecare cu
+    segmentul de cod emis până la următorul. O editare (offset, sters, inserat) reia
+    parsarea din ultimul punct de control dinaintea ei și, după sfârșitul editării, compară
+    configurația cu punctul de control corespunzător din parsarea anterioară: dacă stivele
+    coincid, restul parsării ar fi identic, deci punctele de control rămase (cu segmentele
+    lor de cod) sunt refolosite și parsarea se oprește.
+
+    Temporarele create după punctul de reluare pot fi numerotate diferit în cele două
+    parsări; resincronizarea acceptă o diferență constantă, care este adăugată într-un
+    jurnal de renumerotări aplicat leneș fiecărui punct de control, la prima lui folosire.
+    Astfel o editare costă parsarea regiunii editate plus mutarea pozițiilor punctelor
+    de control, nu reparsarea întregii intrări.
+    Resincronizarea presupune că acțiunile semantice depind doar de valorile primite și
+    de generator (cum sunt cele predefinite din actiuni.py).
+    """
+    def __init__(self, tabel, actiuni, interval: int = 64):
+        """
+        Args:
+            tabel: Tabelul compilat (TabelCompilat dens sau TabelComprimat)
+            actiuni: Acțiunea semantică (sau None) pentru fiecare producție, ca RegistruActiuni.actiuni
+            interval: Numărul de simboluri dintre două puncte de control consecutive
+        """
+        if interval < 1:
+            raise ValueError("Intervalul dintre punctele de control trebuie să fie pozitiv")
+        self.tabel = tabel
+        self.actiuni = actiuni
+        self.interval = interval
+        # Generatorul primește doar codul segmentului curent; tabelele lui de internare
+        # sunt comune tuturor segmentelor
+        self.generator = GeneratorCodIntermediar()
+        self.text = self._simboluri('')  # Simbolurile intrării (sau textul, dacă simbolurile sunt caractere)
+        self.puncte: List[PunctControl] = []  # Punctele de control, în ordinea pozițiilor
+        self.renumerotari = []  # Jurnalul de renumerotări (prag, deplasare): tn cu n > prag devine tn+deplasare
+        self.acceptat = False
+        self.ultimaEditare = {}  # Dicționar {'reluareDe', 'simboluriParsate', 'resincronizareLa'}
+
+    @classmethod
+    def dinGramatica(cls, gramatica, interval: int = 64) -> 'ParserIncremental':
+        """Parser incremental pe tabelul și acțiunile semantice ale gramaticii."""
+        if gramatica.lexer is not None:
+            raise ValueError("Parsarea incrementală lucrează pe simboluri, nu pe tokeni; "
+                             "gramatica are un lexer (construiți-o fără fisierLexer)")
+        return cls(gramatica.tabelParsare, gramatica.registruActiuni.actiuni, interval)
+
+    def quadruple(self):
+        """Generator de quadruple (op, arg1, arg2, rezultat) ale ultimei parsări, în ordine."""
+        for punct in self.puncte:
+            self._actualizeaza(punct)
+            yield from self.generator.decodifica(*punct.cod)
+
+    @property
+    def cod_intermediar(self):
+        """Instrucțiunile ultimei parsări, ca text (generat la fiecare acces)."""
+        return [formateazaQuad(*quad) for quad in self.quadruple()]
+
+    def parseaza(self, text: str) -> bool:
+        """
+        Parsează complet textul și păstrează punctele de control.
+
+        Returns:
+            True dacă textul este acceptat, False altfel
+        """
+        self.text = self._simboluri(text)
+        self.generator.reseteaza()
+        self.puncte = []
+        self.renumerotari = []
+        parser = ParserPush(self.tabel, self.actiuni, self.generator)
+        return self._continua(parser, PunctControl(0, array('i', parser.stiva_stari), [], 0, 0), [])
+
+    def editeaza(self, offset: int, sters: int, inserat: str) -> bool:
+        """
+        Aplică o editare (înlocuiește `sters` simboluri de la `offset` cu `inserat`) și reparsează.
+        Înainte de prima parsare textul este vid, deci editarea îl parsează complet pe `inserat`.
+
+        Returns:
+            True dacă textul editat este acceptat, False altfel
+        """
+        if offset < 0 or sters < 0 or offset + sters > len(self.text):
+            raise ValueError(f"Editare în afara textului: ({offset}, {sters}) pentru lungimea {len(self.text)}")
+        inserat = self._simboluri(inserat)
+        if not self.puncte:
+            # Nicio parsare anterioară, deci niciun punct de control de la care să reluăm
+            return self.parseaza(self.text[:offset] + inserat + self.text[offset + sters:])
+        pozitii = [punct.pozitie for punct in self.puncte]
+        # Ultimul punct de control care nu depinde de textul editat
+        indexReper = bisect_right(pozitii, offset) - 1
+        reper = self.puncte[indexReper]
+        # Punctele de după editare sunt candidații pentru resincronizare, la pozițiile lor din textul nou
+        deplasareText = len(inserat) - sters
+        candidati = self.puncte[max(bisect_left(pozitii, offset + sters), indexReper + 1):]
+        for punct in candidati:
+            punct.pozitie += deplasareText
+
+        self.text = self.text[:offset] + inserat + self.text[offset + sters:]
+        self.puncte = self.puncte[:indexReper]
+        self._actualizeaza(reper)
+        self.generator.trunchiaza(0, reper.contorTemp)
+        parser = ParserPush(self.tabel, self.actiuni, self.generator)
+        parser.stiva_stari = array('i', reper.stari)
+        parser.stiva_atribute = list(reper.atribute)
+        return self._continua(parser, reper, candidati)
+
+    def _simboluri(self, text):
+        """Textul ca secvență de simboluri: lista cuvintelor, dacă simbolurile sunt separate prin spații."""
+        if self.tabel.separator and isinstance(text, str):
+            return text.split()
+        return text
+
+    def _continua(self, parser: ParserPush, reper: PunctControl, candidati: List[PunctControl]) -> bool:
+        """
+        Parsează textul de la poziția reperului până la sfârșit sau până la resincronizarea
+        cu unul dintre `candidati` (punctele de control vechi, cu pozițiile din textul nou).
+        """
+        text = self.text
+        generator = self.generator
+        stari = parser.stiva_stari
+        atribute = parser.stiva_atribute
+        pozitie = reper.pozitie
+        urmatorCandidat = 0
+        punct = PunctControl(pozitie, array('i', stari), list(atribute), generator.contor_temp,
+                             len(self.renumerotari))
+        self.puncte.append(punct)
+        inceputRegiune = len(self.puncte) - 1
+
+        while pozitie < len(text):
+            while urmatorCandidat < len(candidati) and candidati[urmatorCandidat].pozitie <= pozitie:
+                urmatorCandidat += 1
+            tinta = min(punct.pozitie + self.interval, len(text))
+            if urmatorCandidat < len(candidati):
+                tinta = min(tinta, candidati[urmatorCandidat].pozitie)
+            if not parser.feed(text[pozitie:tinta]):
+                self._inchideSegment(punct)
+                self._terminaEditare(reper, tinta, None)
+                self.acceptat = False
+                return False
+            pozitie = tinta
+
+            if urmatorCandidat < len(candidati) and candidati[urmatorCandidat].pozitie == pozitie:
+                vechi = candidati[urmatorCandidat]
+                self._actualizeaza(vechi)
+                deplasare = generator.contor_temp - vechi.contorTemp
+                if (stari == vechi.stari and len(atribute) == len(vechi.atribute)
+                        and atribute == (_renumeroteaza(vechi.atribute, reper.contorTemp, deplasare)
+                                         if deplasare else vechi.atribute)):
+                    self._inchideSegment(punct)
+                    self._resincronizeaza(reper, candidati[urmatorCandidat:], deplasare, inceputRegiune)
+                    self._terminaEditare(reper, pozitie, pozitie)
+                    return self.acceptat
+
+            if pozitie < len(text):
+                self._inchideSegment(punct)
+                punct = PunctControl(pozitie, array('i', stari), list(atribute), generator.contor_temp,
+                                     len(self.renumerotari))
+                self.puncte.append(punct)
+
+        self.acceptat = parser.finish()
+        self._inchideSegment(punct)
+        self._terminaEditare(reper, len(text), None)
+        return self.acceptat
+
+    def _inchideSegment(self, punct: PunctControl):
+        """Mută în punctul de control codul emis de la el încoace; generatorul este golit."""
+        generator = self.generator
+        punct.cod = (generator.coloanaOp[:], generator.coloanaArg1[:],
+                     generator.coloanaArg2[:], generator.coloanaRezultat[:])
+        punct.contorFinal = generator.contor_temp
+        generator.trunchiaza(0, generator.contor_temp)
+
+    def _resincronizeaza(self, reper: PunctControl, candidati: List[PunctControl], deplasare: int,
+                         inceputRegiune: int):
+        """
+        Preia punctele de control ale parsării anterioare de la resincronizare încolo.
+        Contoarele lor sunt mutate imediat; atributele și codul, prin jurnal, la cerere.
+        """
+        if deplasare:
+            for punct in candidati:
+                punct.contorTemp += deplasare
+            self.renumerotari.append((reper.contorTemp, deplasare))
+            # Punctele regiunii reparsate au deja numerotarea nouă
+            for punct in self.puncte[inceputRegiune:]:
+                punct.versiune = len(self.renumerotari)
+        self.puncte.extend(candidati)
+
+    def _actualizeaza(self, punct: PunctControl):
+        """Aplică punctului de control renumerotările din jurnal care nu i-au fost aplicate."""
+        for prag, deplasare in self.renumerotari[punct.versiune:]:
+            # Temporarele segmentului sunt cel mult contorFinal; sub prag renumerotarea nu schimbă nimic
+            if punct.contorFinal <= prag:
+                continue
+            punct.atribute = _renumeroteaza(punct.atribute, prag, deplasare)
+            op, arg1, arg2, rezultat = punct.cod
+            punct.cod = (op, _renumeroteazaColoana(arg1, prag, deplasare),
+                         _renumeroteazaColoana(arg2, prag, deplasare),
+                         _renumeroteazaColoana(rezultat, prag, deplasare))
+            punct.contorFinal += deplasare
+        punct.versiune = len(self.renumerotari)
+
+    def _terminaEditare(self, reper: PunctControl, sfarsit: int, resincronizare):
+        self.ultimaEditare = {'reluareDe': reper.pozitie, 'simboluriParsate': sfarsit - reper.pozitie,
+                              'resincronizareLa': resincronizare}
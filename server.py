@@ -0,0 +1,368 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from esantionare import Esantionator
+from gramatica import Gramatica, MOD_SLR, MOD_LALR, _initializeazaWorker, _verificaBlocWorker
+from sesiune import GramaticaCompilata
+
+# Încadrarea cererilor și a răspunsurilor pe conexiune
+INCADRARE_LINIE = 'linie'      # câte o expresie pe linie; răspunsurile sunt linii JSON
+INCADRARE_LUNGIME = 'lungime'  # lungimea pe 4 octeți (big-endian), apoi conținutul UTF-8
+
+_LUNGIME = struct.Struct('>I')
+
+
+class ServerParsare:
+    """
+    Server asyncio (TCP sau socket Unix) care parsează expresii pe o GramaticaCompilata
+    încărcată o singură dată. Fiecare cerere primește răspunsul JSON
+    {"acceptat": bool, "cod": [instrucțiuni]} (sau {"eroare": mesaj}).
+
+    Cererile pot fi trimise în pipeline: o conexiune citește cereri noi fără să aștepte
+    răspunsurile, iar răspunsurile sunt scrise în ordinea cererilor. Expresiile scurte sunt
+    parsate direct în bucla de evenimente; cele de cel puțin `pragLot` caractere sunt
+    adunate în loturi (cererile sosite în aceeași iterație a buclei, cel mult `marimeLot`)
+    și trimise pool-ului de procese. Numărul de cereri în lucru este limitat la `maxInLucru`
+    în total și la `maxPipeline` pe conexiune: la limită conexiunile nu mai sunt citite, deci
+    clienții sunt frânați de controlul fluxului TCP în loc ca cererile să se acumuleze în memorie.
+    """
+    def __init__(self, gramatica: GramaticaCompilata, incadrare: str = INCADRARE_LINIE, workers: int = 0,
+                 pragLot: int = 4096, marimeLot: int = 64, maxInLucru: int = 1024, maxPipeline: int = 128,
+                 maxOcteti: int = 1 << 24):
+        """
+        Args:
+            gramatica: Gramatica compilată folosită pentru toate conexiunile
+            incadrare: INCADRARE_LINIE sau INCADRARE_LUNGIME
+            workers: Numărul de procese pentru cererile mari (0 = totul în bucla de evenimente)
+            pragLot: Lungimea de la care o expresie este trimisă pool-ului
+            marimeLot: Numărul maxim de expresii dintr-un lot trimis pool-ului
+            maxInLucru: Numărul maxim de cereri primite și încă fără răspuns scris
+            maxPipeline: Numărul maxim de cereri fără răspuns scris pe o singură conexiune
+                (un client care nu citește răspunsurile nu ocupă toate locurile din maxInLucru)
+            maxOcteti: Lungimea maximă a unei cereri; o cerere mai lungă închide conexiunea
+        """
+        if incadrare not in (INCADRARE_LINIE, INCADRARE_LUNGIME):
+            raise ValueError(f"Încadrare necunoscută: {incadrare}")
+        self.gramatica = gramatica
+        self.incadrare = incadrare
+        self.pragLot = pragLot
+        self.marimeLot = marimeLot
+        self.maxInLucru = maxInLucru
+        self.maxPipeline = maxPipeline
+        self.maxOcteti = maxOcteti
+        self.sesiune = gramatica.sesiune()  # Pentru cererile parsate în bucla de evenimente
+        self.workers = workers
+        self.executor = None
+        if workers > 0:
+            # Procesele sunt pornite cu 'spawn': un proces creat prin fork ar moșteni socketurile
+            # deschise, iar conexiunile închise de server ar rămâne deschise în el
+            self.executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                                initializer=_initializeazaWorker,
+                                                initargs=(gramatica.tabel, gramatica.actiuni, gramatica.lexer))
+        self.lot = []  # Perechi (expresie, viitor) care așteaptă trimiterea către pool
+        self.inLucru = None  # asyncio.Semaphore, creat în bucla serverului
+        self.server = None
+        self.conexiuni = set()  # Task-urile conexiunilor deschise
+        self.cereri = 0
+        self.loturi = 0
+
+    async def porneste(self, gazda: str = '127.0.0.1', port: int = 0, caleUnix: str = None):
+        """Pornește serverul; cu `caleUnix` ascultă pe socketul Unix dat, altfel pe TCP."""
+        self.inLucru = asyncio.Semaphore(self.maxInLucru)
+        if self.executor is not None:
+            # Procesele pool-ului pornesc acum, nu la primul lot
+            bucla = asyncio.get_running_loop()
+            await asyncio.gather(*(bucla.run_in_executor(self.executor, _verificaBlocWorker, [])
+                                   for _ in range(self.workers)))
+        limita = self.maxOcteti + 1
+        if caleUnix is not None:
+            self.server = await asyncio.start_unix_server(self._conexiune, caleUnix, limit=limita)
+        else:
+            self.server = await asyncio.start_server(self._conexiune, gazda, port, limit=limita)
+        return self.server
+
+    @property
+    def adresa(self):
+        return self.server.sockets[0].getsockname()
+
+    async def opreste(self):
+        """Oprește acceptarea conexiunilor și așteaptă ca cele deschise să se încheie."""
+        self.server.close()
+        await asyncio.gather(*self.conexiuni, return_exceptions=True)
+        await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def _conexiune(self, cititor: asyncio.StreamReader, scriitor: asyncio.StreamWriter):
+        # Viitorii răspunsurilor, în ordinea cererilor; coada face legătura cu scrierea
+        raspunsuri = asyncio.Queue(self.maxPipeline)
+        task = asyncio.current_task()
+        self.conexiuni.add(task)
+        scriere = asyncio.ensure_future(self._scrieRaspunsuri(raspunsuri, scriitor))
+        try:
+            while True:
+                try:
+                    expresie = await self._citesteCerere(cititor)
+                except (ValueError, asyncio.LimitOverrunError, asyncio.IncompleteReadError) as eroare:
+                    viitor = asyncio.get_running_loop().create_future()
+                    viitor.set_result({'eroare': str(eroare) or 'Cerere incompletă'})
+                    await self.inLucru.acquire()
+                    await raspunsuri.put(viitor)
+                    break
+                if expresie is None:
+                    break
+                await self.inLucru.acquire()
+                await raspunsuri.put(self._trimite(expresie))
+        except ConnectionError:
+            pass
+        finally:
+            await raspunsuri.put(None)
+            await scriere
+            self.conexiuni.discard(task)
+
+    async def _citesteCerere(self, cititor: asyncio.StreamReader):
+        """Următoarea expresie de pe conexiune sau None la închiderea ei."""
+        if self.incadrare == INCADRARE_LINIE:
+            linie = await cititor.readline()
+            if not linie:
+                return None
+            if len(linie) > self.maxOcteti:
+                raise ValueError(f"Cerere mai lungă de {self.maxOcteti} octeți")
+            return linie.decode('utf-8').rstrip('\r\n')
+        try:
+            antet = await cititor.readexactly(_LUNGIME.size)
+        except asyncio.IncompleteReadError as eroare:
+            if not eroare.partial:
+                return None
+            raise
+        lungime, = _LUNGIME.unpack(antet)
+        if lungime > self.maxOcteti:
+            raise ValueError(f"Cerere mai lungă de {self.maxOcteti} octeți")
+        return (await cititor.readexactly(lungime)).decode('utf-8')
+
+    def _trimite(self, expresie: str) -> asyncio.Future:
+        """Viitorul răspunsului: rezolvat imediat pentru expresiile scurte, prin pool pentru cele lungi."""
+        viitor = asyncio.get_running_loop().create_future()
+        self.cereri += 1
+        if self.executor is None or len(expresie) < self.pragLot:
+            acceptat = self.sesiune.verificaSir(expresie)
+            viitor.set_result({'acceptat': acceptat, 'cod': self.sesiune.cod_intermediar if acceptat else []})
+            return viitor
+        self.lot.append((expresie, viitor))
+        if len(self.lot) >= self.marimeLot:
+            self._trimiteLot()
+        elif len(self.lot) == 1:
+            # Lotul pleacă la sfârșitul iterației curente, cu toate cererile sosite până atunci
+            asyncio.get_running_loop().call_soon(self._trimiteLot)
+        return viitor
+
+    def _trimiteLot(self):
+        if not self.lot:
+            return
+        lot, self.lot = self.lot, []
+        self.loturi += 1
+        rezultate = asyncio.get_running_loop().run_in_executor(
+            self.executor, _verificaBlocWorker, [expresie for expresie, _ in lot])
+
+        def distribuie(rezultate):
+            if rezultate.exception() is not None:
+                for _, viitor in lot:
+                    viitor.set_result({'eroare': repr(rezultate.exception())})
+                return
+            for (_, viitor), (acceptat, cod) in zip(lot, rezultate.result()):
+                viitor.set_result({'acceptat': acceptat, 'cod': cod})
+        rezultate.add_done_callback(distribuie)
+
+    async def _scrieRaspunsuri(self, raspunsuri: asyncio.Queue, scriitor: asyncio.StreamWriter):
+        conectat = True
+        try:
+            while True:
+                viitor = await raspunsuri.get()
+                if viitor is None:
+                    break
+                raspuns = await viitor
+                self.inLucru.release()
+                if not conectat:
+                    continue
+                try:
+                    scriitor.write(self._incadreaza(raspuns))
+                    # drain() așteaptă doar dacă bufferul de scriere este plin (clientul nu citește)
+                    await scriitor.drain()
+                except ConnectionError:
+                    conectat = False
+        finally:
+            scriitor.close()
+
+    def _incadreaza(self, raspuns: dict) -> bytes:
+        continut = json.dumps(raspuns, ensure_ascii=False).encode('utf-8')
+        if self.incadrare == INCADRARE_LINIE:
+            return continut + b'\n'
+        return _LUNGIME.pack(len(continut)) + continut
+
+
+async def _deschide(adresa):
+    if isinstance(adresa, str):
+        return await asyncio.open_unix_connection(adresa)
+    return await asyncio.open_connection(*adresa)
+
+
+def _cadruCerere(expresie: str, incadrare: str) -> bytes:
+    continut = expresie.encode('utf-8')
+    if incadrare == INCADRARE_LINIE:
+        return continut + b'\n'
+    return _LUNGIME.pack(len(continut)) + continut
+
+
+async def _citesteRaspuns(cititor: asyncio.StreamReader, incadrare: str) -> dict:
+    if incadrare == INCADRARE_LINIE:
+        continut = await cititor.readline()
+        if not continut:
+            raise ConnectionError("Serverul a închis conexiunea")
+    else:
+        lungime, = _LUNGIME.unpack(await cititor.readexactly(_LUNGIME.size))
+        continut = await cititor.readexactly(lungime)
+    return json.loads(continut)
+
+
+def percentila(valori: list, p: float) -> float:
+    """Percentila p (0-100) a unei liste sortate, prin metoda rangului cel mai apropiat."""
+    if not valori:
+        return 0.0
+    return valori[min(len(valori) - 1, max(0, int(round(p / 100 * len(valori))) - 1))]
+
+
+async def genereazaIncarcare(adresa, expresii: list, conexiuni: int = 8, adancime: int = 32,
+                             incadrare: str = INCADRARE_LINIE) -> dict:
+    """
+    Generator de încărcare local: trimite expresiile (împărțite între `conexiuni`
+    conexiuni), fiecare conexiune având cel mult `adancime` cereri în pipeline, și
+    măsoară latența fiecărei cereri (de la trimitere la primirea răspunsului).
+
+    Args:
+        adresa: (gazdă, port) sau calea unui socket Unix
+
+    Returns:
+        Dicționar cu numărul de cereri, acceptate, durata, cereri/s și percentilele latenței (ms)
+    """
+    latente = []
+    acceptate = [0]
+
+    async def client(expresiiClient):
+        cititor, scriitor = await _deschide(adresa)
+        locuri = asyncio.Semaphore(adancime)
+        trimise = asyncio.Queue()  # Momentele de trimitere, în ordinea cererilor
+
+        async def primeste():
+            for _ in expresiiClient:
+                raspuns = await _citesteRaspuns(cititor, incadrare)
+                latente.append(time.perf_counter() - trimise.get_nowait())
+                acceptate[0] += bool(raspuns.get('acceptat'))
+                locuri.release()
+
+        primire = asyncio.ensure_future(primeste())
+        for expresie in expresiiClient:
+            await locuri.acquire()
+            trimise.put_nowait(time.perf_counter())
+            scriitor.write(_cadruCerere(expresie, incadrare))
+            await scriitor.drain()
+        await primire
+        scriitor.close()
+        await scriitor.wait_closed()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(expresii[i::conexiuni]) for i in range(conexiuni) if expresii[i::conexiuni]))
+    durata = time.perf_counter() - start
+    latente.sort()
+    return {
+        'cereri': len(latente),
+        'acceptate': acceptate[0],
+        'secunde': durata,
+        'cereriPeSecunda': len(latente) / durata if durata else 0.0,
+        **{f'p{p}Ms': percentila(latente, p) * 1000 for p in (50, 90, 99, 99.9)},
+        'maxMs': latente[-1] * 1000 if latente else 0.0,
+    }
+
+
+def _expresiiIncarcare(gramatica: Gramatica, numar: int, lungimeMaxima: int, proportieMari: float,
+                       lungimeMare: int, samanta: int) -> list:
+    """Propoziții extrase uniform, o parte dintre ele mari (concatenate cu '+' dacă gramatica are '+')."""
+    aleator = random.Random(samanta)
+    esantionator = Esantionator(gramatica, lungimeMaxima, samanta)
+    lungimi = {lungime: 1 for lungime in range(1, lungimeMaxima + 1)}
+    expresii = list(esantionator.esantioane(numar, lungimi))
+    if proportieMari > 0 and '+' in gramatica.listaTerminale:
+        separator = gramatica.separator
+        for i in range(numar):
+            if aleator.random() < proportieMari:
+                parti = esantionator.esantioane(2 * lungimeMare // lungimeMaxima + 1, lungimi)
+                expresii[i] = f'{separator}+{separator}'.join(
+                    f'({separator}{parte}{separator})' if '(' in gramatica.listaTerminale else parte
+                    for parte in parti)
+    return expresii
+
+
+async def _ruleazaIncarcare(argumente, gramatica: Gramatica):
+    server = ServerParsare(GramaticaCompilata.dinGramatica(gramatica), argumente.incadrare, argumente.workers,
+                           argumente.prag_lot)
+    await server.porneste(caleUnix=argumente.unix)
+    try:
+        expresii = _expresiiIncarcare(gramatica, argumente.cereri, 30, argumente.proportie_mari,
+                                      argumente.lungime_mare, argumente.samanta)
+        rezultat = await genereazaIncarcare(argumente.unix or server.adresa[:2], expresii, argumente.conexiuni,
+                                            argumente.adancime, argumente.incadrare)
+    finally:
+        await server.opreste()
+    print(f"{rezultat['cereri']} cereri ({rezultat['acceptate']} acceptate) în {rezultat['secunde']:.2f} s, "
+          f"{rezultat['cereriPeSecunda']:,.0f} cereri/s, {server.loturi} loturi trimise pool-ului")
+    print(f"latență (ms): p50 {rezultat['p50Ms']:.2f}  p90 {rezultat['p90Ms']:.2f}  "
+          f"p99 {rezultat['p99Ms']:.2f}  p99.9 {rezultat['p99.9Ms']:.2f}  max {rezultat['maxMs']:.2f}")
+
+
+async def _servesteLaNesfarsit(argumente, gramatica: Gramatica):
+    server = ServerParsare(GramaticaCompilata.dinGramatica(gramatica), argumente.incadrare, argumente.workers,
+                           argumente.prag_lot)
+    await server.porneste(argumente.gazda, argumente.port, argumente.unix)
+    print(f"Ascult pe {argumente.unix or server.adresa[:2]} ({argumente.incadrare})", flush=True)
+    async with server.server:
+        await server.server.serve_forever()
+
+
+def main(argumente=None) -> int:
+    parser = argparse.ArgumentParser(description="Server asyncio de parsare și generator de încărcare local.")
+    parser.add_argument('gramatica', nargs='?', default='gramatica.txt')
+    parser.add_argument('--lexer', help="Declarațiile lexerului (ex. gramatica.lex); implicit fără lexer")
+    parser.add_argument('--mod', default=MOD_SLR, choices=[MOD_SLR, MOD_LALR])
+    parser.add_argument('--gazda', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="Calea socketului Unix (în locul TCP)")
+    parser.add_argument('--incadrare', default=INCADRARE_LINIE, choices=[INCADRARE_LINIE, INCADRARE_LUNGIME])
+    parser.add_argument('--workers', type=int, default=0, help="Procese pentru cererile mari (0 = fără pool)")
+    parser.add_argument('--prag-lot', type=int, default=4096)
+    parser.add_argument('--incarcare', action='store_true',
+                        help="Pornește serverul local și măsoară latența cu generatorul de încărcare")
+    parser.add_argument('--cereri', type=int, default=20000)
+    parser.add_argument('--conexiuni', type=int, default=8)
+    parser.add_argument('--adancime', type=int, default=32, help="Cereri în pipeline pe conexiune")
+    parser.add_argument('--proportie-mari', type=float, default=0.0,
+                        help="Proporția de cereri mari (cel puțin --lungime-mare caractere)")
+    parser.add_argument('--lungime-mare', type=int, default=20000)
+    parser.add_argument('--samanta', type=int, default=0)
+    argumente = parser.parse_args(argumente)
+
+    gramatica = Gramatica(argumente.gramatica, fisierLexer=argumente.lexer, mod=argumente.mod)
+    if argumente.incarcare:
+        asyncio.run(_ruleazaIncarcare(argumente, gramatica))
+    else:
+        asyncio.run(_servesteLaNesfarsit(argumente, gramatica))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Empty, SimpleQueue
+
+from arbore import ArboreSintaxa
+from cod_intermediar import GeneratorCodIntermediar
+from gramatica import ParserPush, parseazaSir, _blocuri
+from instrumentare import Statistici
+
+
+class GramaticaCompilata:
+    """
+    Partea imuabilă a unei Gramatica, de care are nevoie parsarea: producțiile, tabelul
+    de parsare, acțiunile semantice și lexerul. Nu este modificată de nicio parsare,
+    deci poate fi folosită simultan din oricâte fire de execuție, fără blocări; starea
+    unei parsări (stivele, generatorul de cod, arborele) ține de o SesiuneParsare.
+
+    Acțiunile sunt copiate la compilare: acțiunile înregistrate ulterior în Gramatica
+    nu se văd aici (se compilează din nou).
+    """
+    __slots__ = ('listaProductii', 'listaTerminale', 'simbolStart', 'mod', 'tabel', 'actiuni', 'lexer')
+
+    def __init__(self, listaProductii, listaTerminale, simbolStart: str, mod: str, tabel, actiuni, lexer=None):
+        """
+        Args:
+            listaProductii: Producțiile gramaticii augmentate, în ordinea numerelor de regulă
+            listaTerminale: Terminalele gramaticii
+            simbolStart: Simbolul de start
+            mod: Modul de construcție al tabelului (MOD_SLR sau MOD_LALR)
+            tabel: Tabelul compilat (TabelCompilat dens sau TabelComprimat); None dacă lipsește
+            actiuni: Acțiunea semantică (sau None) pentru fiecare producție
+            lexer: Lexer opțional; fără el fiecare caracter este un terminal
+        """
+        self.listaProductii = tuple(listaProductii)
+        self.listaTerminale = tuple(listaTerminale)
+        self.simbolStart = simbolStart
+        self.mod = mod
+        self.tabel = tabel
+        self.actiuni = tuple(actiuni)
+        self.lexer = lexer
+        if tabel:
+            # Structurile driver-ului tabelului dens sunt construite leneș; le construim acum,
+            # ca firele să nu le construiască (și să le înlocuiască) concurent
+            tabel.structuriDriver()
+
+    @classmethod
+    def dinGramatica(cls, gramatica) -> 'GramaticaCompilata':
+        return cls(gramatica.listaProductii, gramatica.listaTerminale, gramatica.simbolStart, gramatica.mod,
+                   gramatica.tabelParsare, gramatica.registruActiuni.actiuni, gramatica.lexer)
+
+    def sesiune(self, statistici: Statistici = None) -> 'SesiuneParsare':
+        return SesiuneParsare(self, statistici)
+
+    def verificaSiruri(self, siruri, workers: int = 4, chunksize: int = 512) -> list:
+        """
+        Parsează un lot de șiruri pe un pool de fire de execuție care împart tabelul;
+        fiecare bloc de `chunksize` șiruri este parsat într-o sesiune luată din pool.
+        Cu GIL, câștigul apare doar la acțiuni care eliberează GIL-ul; fără GIL
+        (Python free-threaded), blocurile sunt parsate în paralel.
+
+        Returns:
+            Lista de perechi (acceptat, cod_intermediar) în ordinea intrării, ca
+            Gramatica.verificaSiruri
+        """
+        pool = PoolSesiuni(self, workers)
+
+        def verificaBloc(bloc):
+            with pool.imprumuta() as sesiune:
+                return [(acceptat, sesiune.cod_intermediar if acceptat else [])
+                        for acceptat in map(sesiune.verificaSir, bloc)]
+
+        rezultate = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for rezultateBloc in executor.map(verificaBloc, _blocuri(siruri, chunksize)):
+                rezultate.extend(rezultateBloc)
+        return rezultate
+
+
+class SesiuneParsare:
+    """
+    Starea unei parsări pe o GramaticaCompilata: generatorul de cod intermediar, arborele
+    ultimei parsări și, opțional, statisticile. O sesiune este folosită de un singur fir
+    la un moment dat, dar poate parsa oricâte șiruri, unul după altul (ca
+    Gramatica.verificaSir); este ieftină de creat și poate fi refolosită printr-un PoolSesiuni.
+    """
+    __slots__ = ('gramatica', 'generator', 'statistici', 'arbore')
+
+    def __init__(self, gramatica: GramaticaCompilata, statistici: Statistici = None):
+        """
+        Args:
+            gramatica: Gramatica compilată, comună tuturor sesiunilor
+            statistici: Dacă este dat, completat la fiecare parsare a acestei sesiuni
+                (un obiect Statistici nu trebuie împărțit între sesiuni din fire diferite)
+        """
+        self.gramatica = gramatica
+        self.generator = GeneratorCodIntermediar()
+        self.statistici = statistici
+        self.arbore = None
+
+    def verificaSir(self, sir_intrare, construiesteArbore: bool = False) -> bool:
+        """
+        Parsează un șir și generează codul intermediar în generatorul sesiunii.
+
+        Args:
+            sir_intrare: Șirul de intrare (tokenizat dacă gramatica are lexer)
+            construiesteArbore: Dacă este True, arborele de derivare este construit în self.arbore
+
+        Returns:
+            True dacă șirul este acceptat, False altfel
+        """
+        gramatica = self.gramatica
+        self.arbore = None
+        if not gramatica.tabel:
+            return False
+        self.generator.reseteaza()
+        if construiesteArbore:
+            self.arbore = ArboreSintaxa.pentruTabel(gramatica.tabel)
+        return parseazaSir(gramatica.tabel, gramatica.actiuni, sir_intrare, self.generator, gramatica.lexer,
+                           self.statistici, self.arbore)
+
+    def parser(self, depanare: bool = False) -> ParserPush:
+        """Un ParserPush nou pe generatorul (resetat al) sesiunii, pentru intrări primite pe bucăți."""
+        self.arbore = None
+        self.generator.reseteaza()
+        return ParserPush(self.gramatica.tabel, self.gramatica.actiuni, self.generator, depanare,
+                          self.statistici)
+
+    def quadruple(self):
+        return self.generator.quadruple()
+
+    @property
+    def cod_intermediar(self):
+        """Instrucțiunile ultimei parsări, ca text."""
+        return self.generator.cod_intermediar
+
+
+class PoolSesiuni:
+    """
+    Pool de sesiuni refolosibile pe aceeași GramaticaCompilata. obtine() și elibereaza()
+    pot fi apelate din orice fir; sesiunile sunt create la cerere, iar cel mult `marime`
+    sesiuni libere sunt păstrate.
+    """
+    def __init__(self, gramatica: GramaticaCompilata, marime: int = 16):
+        self.gramatica = gramatica
+        self.marime = marime
+        self.libere = SimpleQueue()
+
+    def obtine(self) -> SesiuneParsare:
+        try:
+            return self.libere.get_nowait()
+        except Empty:
+            return SesiuneParsare(self.gramatica)
+
+    def elibereaza(self, sesiune: SesiuneParsare):
+        """Pune sesiunea înapoi în pool; codul și arborele ultimei parsări sunt eliberate."""
+        if self.libere.qsize() >= self.marime:
+            return
+        sesiune.generator.reseteaza()
+        sesiune.arbore = None
+        self.libere.put(sesiune)
+
+    @contextmanager
+    def imprumuta(self):
+        """Context manager: `with pool.imprumuta() as sesiune: ...`"""
+        sesiune = self.obtine()
+        try:
+            yield sesiune
+        finally:
+            self.elibereaza(sesiune)
@@ -0,0 +1,36 @@
+from typing import Tuple
+
+
+def citesteSimboluri(text: str, declarate) -> Tuple[str, ...]:
+    """
+    Împarte un șir de simboluri (ex. partea dreaptă a unei producții) în nume de simboluri:
+    cuvintele separate prin spații care sunt simboluri declarate rămân întregi, celelalte
+    sunt citite caracter cu caracter. Astfel 'expr + term' dă ('expr', '+', 'term'), iar
+    forma compactă a gramaticilor cu simboluri de un caracter, 'E+T', dă ('E', '+', 'T').
+
+    Args:
+        text: Textul de împărțit
+        declarate: Mulțimea (sau dicționarul) simbolurilor declarate
+    """
+    simboluri = []
+    for cuvant in text.split():
+        if cuvant in declarate:
+            simboluri.append(cuvant)
+        else:
+            simboluri.extend(cuvant)
+    return tuple(simboluri)
+
+
+def separatorSimboluri(simboluri) -> str:
+    """
+    Separatorul cu care sunt scrise șirurile de simboluri: '' dacă toate simbolurile au
+    un singur caracter (ex. E+T, a*a), altfel un spațiu (ex. expr + term, id * id).
+    """
+    return ' ' if any(len(simbol) > 1 for simbol in simboluri) else ''
+
+
+def formateazaSimboluri(simboluri, separator: str = None) -> str:
+    """Șirul de simboluri ca text; implicit separatorul este ales după simbolurile date."""
+    if separator is None:
+        separator = separatorSimboluri(simboluri)
+    return separator.join(simboluri)
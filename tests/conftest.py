@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+# Modulele proiectului sunt în rădăcina depozitului
+RADACINA = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RADACINA)
+
+
+@pytest.fixture
+def scrieGramatica(tmp_path):
+    """Scrie o gramatică (liniile fișierului) în directorul temporar și întoarce calea fișierului."""
+    def scrie(*linii, nume: str = 'g.txt') -> str:
+        cale = tmp_path / nume
+        cale.write_text('\n'.join(linii) + '\n')
+        return str(cale)
+    return scrie
+
+
+@pytest.fixture
+def gramaticaExpresii() -> str:
+    """Calea gramaticii de expresii din depozit."""
+    return os.path.join(RADACINA, 'gramatica.txt')
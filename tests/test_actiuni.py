@@ -0,0 +1,39 @@
+import shutil
+
+import pytest
+
+from actiuni import Binar, Copiaza
+from gramatica import Gramatica
+
+COD_ASTEPTAT = ['t1 := a * a', 't2 := a + t1']
+
+
+def test_fisierul_act_de_langa_gramatica(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    assert gramatica.verificaSir('a+a*a')
+    assert gramatica.generator.cod_intermediar == COD_ASTEPTAT
+
+
+def test_traducerea_implicita_fara_fisier_act(gramaticaExpresii, tmp_path):
+    # Gramatica copiată fără gramatica.act păstrează traducerea expresiilor
+    copie = str(tmp_path / 'expresii.txt')
+    shutil.copy(gramaticaExpresii, copie)
+    gramatica = Gramatica(copie)
+    assert gramatica.verificaSir('a+a*a')
+    assert gramatica.generator.cod_intermediar == COD_ASTEPTAT
+
+
+def test_traducerea_implicita_doar_pentru_productiile_existente(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica('E T', 'a + -', 'E', 'E->E+T', 'E->T', 'T->a', 'T->-T'))
+    actiuni = gramatica.registruActiuni.actiuni
+    numere = {f'{p.simbolNeterminal}->{"".join(p.sirInlocuire)}': i for i, p in enumerate(gramatica.listaProductii)}
+    assert isinstance(actiuni[numere['E->E+T']], Binar)
+    assert isinstance(actiuni[numere['E->T']], Copiaza)
+    assert actiuni[numere['T->a']] is None and actiuni[numere['T->-T']] is None
+
+
+def test_declaratie_gresita(gramaticaExpresii, tmp_path):
+    act = tmp_path / 'gresit.act'
+    act.write_text('E->E+T => binar + 0 7\n')
+    with pytest.raises(ValueError, match='gresit.act:1: Indicele 7'):
+        Gramatica(gramaticaExpresii, fisierActiuni=str(act))
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from gramatica import Gramatica, MOD_LALR, MOD_SLR, Productie
+
+CANDIDATI_NOI = 'QWXYZKLMNOPRUV'
+
+
+def _adaugaAleator(gramatica, pasi: int, samanta: int) -> int:
+    """
+    Adaugă producții aleatoare (uneori cu un neterminal nou) și cere, la fiecare pas,
+    comparația cu reconstrucția completă. Producțiile respinse (ciclice, simboluri
+    nedeclarate) sunt sărite.
+
+    Returns:
+        Numărul de producții adăugate efectiv
+    """
+    aleator = random.Random(samanta)
+    adaugate = 0
+    for _ in range(pasi):
+        neterminale = [n for n in gramatica.listaNeterminale if n != gramatica.simbolStart]
+        terminale = [t for t in gramatica.listaTerminale if t != '$']
+        noi = ()
+        if aleator.random() < 0.1:
+            noi = tuple(c for c in CANDIDATI_NOI
+                        if c not in gramatica.listaNeterminale and c not in gramatica.listaTerminale)[:1]
+        simboluri = neterminale + terminale + list(noi)
+        stanga = noi[0] if noi and aleator.random() < 0.5 else aleator.choice(neterminale + list(noi))
+        dreapta = tuple(aleator.choice(simboluri) for _ in range(aleator.choice([0, 1, 1, 2, 2, 3])))
+        if noi and noi[0] not in dreapta and stanga != noi[0]:
+            noi = ()
+        try:
+            raport = gramatica.adaugaProductieIncremental(Productie(stanga, dreapta), noi, verifica=True)
+        except ValueError:
+            continue
+        assert raport['diferente'] == [], (stanga, dreapta, noi)
+        adaugate += 1
+    return adaugate
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+@pytest.mark.parametrize('samanta', range(3))
+def test_expresii(gramaticaExpresii, mod, samanta):
+    gramatica = Gramatica(gramaticaExpresii, mod=mod)
+    assert _adaugaAleator(gramatica, 30, samanta) > 0
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_simboluri_de_mai_multe_caractere(scrieGramatica, mod):
+    gramatica = Gramatica(scrieGramatica('expr term factor', 'id + * ( )', 'expr',
+                                         'expr -> expr + term', 'expr -> term', 'term -> term * factor',
+                                         'term -> factor', 'factor -> ( expr )', 'factor -> id'),
+                          mod=mod)
+    assert _adaugaAleator(gramatica, 30, 7) > 0
+
+
+def test_neterminal_nou_anulabil(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii, mod=MOD_LALR)
+    adaugari = [('Q', (), ('Q',)), ('F', ('Q', 'a'), ()), ('E', ('E', 'Q', '+', 'T'), ()), ('Q', ('a',), ())]
+    for stanga, dreapta, noi in adaugari:
+        raport = gramatica.adaugaProductieIncremental(Productie(stanga, dreapta), noi, verifica=True)
+        assert raport['diferente'] == []
+    assert gramatica.verificaSir('a+a') and gramatica.verificaSir('aa+a')
+
+
+
+def test_raportul_arata_ce_a_fost_recalculat_complet(gramaticaExpresii):
+    slr = Gramatica(gramaticaExpresii, mod=MOD_SLR, fisierActiuni=False)
+    raport = slr.adaugaProductieIncremental(Productie('F', ('(', 'F', ')')), verifica=True)
+    assert raport['diferente'] == [] and not raport['firstFollowComplet']
+    assert raport['randuriRecalculate'] < len(slr.seturiItemi)
+    # Un neterminal nou anulabil schimbă relațiile FIRST/FOLLOW
+    raport = slr.adaugaProductieIncremental(Productie('Q', ()), ('Q',), verifica=True)
+    assert raport['diferente'] == [] and raport['firstFollowComplet']
+
+    lalr = Gramatica(gramaticaExpresii, mod=MOD_LALR, fisierActiuni=False)
+    raport = lalr.adaugaProductieIncremental(Productie('F', ('(', 'F', ')')), verifica=True)
+    assert raport['diferente'] == [] and raport['randuriRecalculate'] == len(lalr.seturiItemi)
@@ -0,0 +1,80 @@
+import pytest
+
+from arbore import FARA
+from gramatica import Gramatica
+
+LINII_EPSILON = ['E X T Y F', 'a + * ( )', 'E',
+                 'E->TX', 'X->+TX', 'X->', 'T->FY', 'Y->*FY', 'Y->', 'F->(E)', 'F->a']
+
+
+def _forma(arbore, nod: int) -> str:
+    """Arborele ca expresie cu paranteze, ex. E(T(F(a)))."""
+    if arbore.esteFrunza(nod):
+        return arbore.text(nod)
+    return arbore.numeSimbol(nod) + '(' + ' '.join(_forma(arbore, copil) for copil in arbore.copii(nod)) + ')'
+
+
+def _verificaIntervale(arbore):
+    """Fiecare frunză acoperă un token, iar fiecare nod intern exact intervalul copiilor lui."""
+    frunze = 0
+    for nod, intrare in arbore.parcurge():
+        if not intrare:
+            continue
+        if arbore.esteFrunza(nod):
+            assert arbore.sfarsit[nod] == arbore.inceput[nod] + 1
+            assert arbore.inceput[nod] == frunze
+            frunze += 1
+            continue
+        copii = list(arbore.copii(nod))
+        if copii:
+            assert arbore.inceput[nod] == arbore.inceput[copii[0]]
+            assert arbore.sfarsit[nod] == arbore.sfarsit[copii[-1]]
+            for stang, drept in zip(copii, copii[1:]):
+                assert arbore.sfarsit[stang] == arbore.inceput[drept]
+        else:
+            assert arbore.inceput[nod] == arbore.sfarsit[nod]
+    assert frunze == len(arbore.lexeme)
+
+
+@pytest.mark.parametrize('comprimaTabel', [False, True])
+def test_forma_si_intervale(gramaticaExpresii, comprimaTabel):
+    gramatica = Gramatica(gramaticaExpresii, comprimaTabel=comprimaTabel)
+    assert gramatica.verificaSir('a+a*(a)', construiesteArbore=True)
+    arbore = gramatica.arbore
+    assert _forma(arbore, arbore.radacina) == 'E(E(T(F(a))) + T(T(F(a)) * F(( E(T(F(a))) ))))'
+    assert (arbore.inceput[arbore.radacina], arbore.sfarsit[arbore.radacina]) == (0, 7)
+    assert arbore.text(arbore.radacina) == 'a+a*(a)'
+    _verificaIntervale(arbore)
+
+
+def test_productii_vide_au_interval_gol(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica(*LINII_EPSILON))
+    assert gramatica.verificaSir('a*a+a', construiesteArbore=True)
+    arbore = gramatica.arbore
+    _verificaIntervale(arbore)
+    vide = [nod for nod, intrare in arbore.parcurge()
+            if intrare and not arbore.esteFrunza(nod) and arbore.primCopil[nod] == FARA]
+    assert [arbore.numeSimbol(nod) for nod in vide] == ['Y', 'Y', 'X']
+    assert [arbore.inceput[nod] for nod in vide] == [3, 5, 5]
+
+
+def test_cursor(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    gramatica.verificaSir('a+a', construiesteArbore=True)
+    cursor = gramatica.arbore.cursor()
+    assert cursor.simbol == 'E' and cursor.interval == (0, 3)
+    assert cursor.mergiLaPrimulCopil() and cursor.simbol == 'E' and cursor.text == 'a'
+    assert cursor.mergiLaFrate() and cursor.text == '+'
+    assert cursor.mergiLaFrate() and cursor.simbol == 'T' and cursor.interval == (2, 3)
+    assert not cursor.mergiLaFrate()
+    assert cursor.mergiLaParinte() and cursor.nod == gramatica.arbore.radacina
+    assert not cursor.mergiLaParinte()
+
+
+def test_intrare_adanca_si_respinsa(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    assert gramatica.verificaSir('(' * 3000 + 'a' + ')' * 3000, construiesteArbore=True)
+    _verificaIntervale(gramatica.arbore)
+    assert len(gramatica.arbore.lexeme) == 6001
+    assert not gramatica.verificaSir('a+(a', construiesteArbore=True)
+    assert gramatica.arbore.radacina == FARA
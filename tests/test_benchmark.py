@@ -0,0 +1,16 @@
+from benchmark import numarTokeni
+from gramatica import Gramatica
+
+
+def test_numar_tokeni_pe_caractere(gramaticaExpresii):
+    assert numarTokeni(Gramatica(gramaticaExpresii), 'a+a*(a)') == 7
+
+
+def test_numar_tokeni_pe_cuvinte(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica('expr', 'id +', 'expr', 'expr -> expr + id', 'expr -> id'))
+    assert numarTokeni(gramatica, 'id + id  +\nid') == 5
+
+
+def test_numar_tokeni_cu_lexer(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii, fisierLexer=True)
+    assert numarTokeni(gramatica, 'alfa + 42 * (beta_1)') == 7
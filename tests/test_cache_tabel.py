@@ -0,0 +1,48 @@
+import os
+
+from gramatica import Gramatica, MOD_LALR, MOD_SLR
+
+LINII = ('E T F', 'a + * ( )', 'E', 'E->E+T', 'E->T', 'T->T*F', 'T->F', 'F->(E)', 'F->a')
+# Aceeași gramatică, cu minusul unar
+LINII_MINUS = ('E T F', 'a + * ( ) -') + LINII[2:] + ('F->-F',)
+
+
+def _fisiereCache(director) -> list:
+    return sorted(nume for nume in os.listdir(director) if nume.endswith('.lrt'))
+
+
+def test_optiuni_diferite_raman_in_cache(scrieGramatica, tmp_path):
+    director = str(tmp_path / 'cache')
+    gramatica = scrieGramatica(*LINII)
+    optiuni = [dict(mod=MOD_SLR), dict(mod=MOD_LALR), dict(mod=MOD_LALR, minimizeaza=True)]
+    for argumente in optiuni:
+        assert not Gramatica(gramatica, directorCache=director, **argumente).dinCache
+    assert len(_fisiereCache(director)) == 3
+    # Alternarea modurilor găsește de fiecare dată cache-ul
+    for argumente in optiuni + optiuni:
+        incarcata = Gramatica(gramatica, directorCache=director, **argumente)
+        assert incarcata.dinCache and incarcata.verificaSir('a+a*(a)')
+
+
+def test_acelasi_nume_in_directoare_diferite(scrieGramatica, tmp_path):
+    director = str(tmp_path / 'cache')
+    prima = scrieGramatica(*LINII)
+    (tmp_path / 'alt').mkdir()
+    a_doua = scrieGramatica(*LINII_MINUS, nume='alt/g.txt')
+    Gramatica(prima, directorCache=director)
+    Gramatica(a_doua, directorCache=director)
+    assert Gramatica(prima, directorCache=director).dinCache
+    incarcata = Gramatica(a_doua, directorCache=director)
+    assert incarcata.dinCache and incarcata.verificaSir('-a+a')
+
+
+def test_gramatica_modificata_inlocuieste_intrarea(scrieGramatica, tmp_path):
+    director = str(tmp_path / 'cache')
+    gramatica = scrieGramatica(*LINII)
+    Gramatica(gramatica, directorCache=director)
+    vechi = _fisiereCache(director)
+    scrieGramatica(*LINII_MINUS)
+    assert not Gramatica(gramatica, directorCache=director).dinCache
+    noi = _fisiereCache(director)
+    assert len(noi) == 1 and noi != vechi
+    assert Gramatica(gramatica, directorCache=director).verificaSir('-a')
@@ -0,0 +1,42 @@
+from esantionare import Esantionator
+from gramatica import Gramatica
+
+
+def test_recursivitate_dreapta(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica('S', 'a b', 'S', 'S->aS', 'S->b'))
+    esantionator = Esantionator(gramatica, 8, samanta=1)
+    assert [esantionator.numarDerivari(n) for n in range(9)] == [0] + [1] * 8
+    assert esantionator.esantion(5) == 'aaaab'
+
+
+def test_atribuire_l_r(scrieGramatica):
+    # S → L = R | R, L → * R | i, R → L: recursivă la dreapta prin R și L
+    gramatica = Gramatica(scrieGramatica('S L R', '= * i', 'S', 'S->L=R', 'S->R', 'L->*R', 'L->i', 'R->L'))
+    esantionator = Esantionator(gramatica, 9, samanta=2)
+    assert [esantionator.numarDerivari(n) for n in range(6)] == [0, 1, 1, 2, 3, 4]
+    for lungime in range(1, 10):
+        for _ in range(20):
+            assert gramatica.verificaSir(esantionator.esantion(lungime))
+
+
+def test_recursivitate_stanga_si_ambiguitate(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica('S', 'x', 'S', 'S->SS', 'S->x'))
+    # Numerele lui Catalan: derivările lui x^n din S → S S | x
+    assert Esantionator(gramatica, 8).numar['S'] == [0, 1, 1, 2, 5, 14, 42, 132, 429]
+
+
+def test_gramatica_expresii(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    esantionator = Esantionator(gramatica, 9, samanta=3)
+    assert [esantionator.numarDerivari(n) for n in range(8)] == [0, 1, 0, 3, 0, 11, 0, 45]
+    assert all(gramatica.verificaSir(propozitie) for propozitie in esantionator.esantioane(200, {3: 1, 9: 1}))
+
+
+
+def test_corpus_numara_octeti(scrieGramatica, tmp_path):
+    gramatica = Gramatica(scrieGramatica('S', 'λ x', 'S', 'S->λS', 'S->x'))
+    corpus = tmp_path / 'corpus.txt'
+    octeti = Esantionator(gramatica, 6, samanta=1).scrieCorpus(str(corpus), 50, {3: 1, 6: 1}, marimeBloc=7)
+    text = corpus.read_text(encoding='utf-8')
+    assert len(text.splitlines()) == 50
+    assert octeti == corpus.stat().st_size == len(text.encode('utf-8')) > len(text)
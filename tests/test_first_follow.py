@@ -0,0 +1,43 @@
+from itertools import product
+
+import pytest
+
+from gramatica import Gramatica, MOD_LALR, MOD_SLR
+
+# Gramatica de expresii fără recursivitate la stânga, cu producții epsilon
+LINII_EPSILON = ['E X T Y F', 'a + * ( )', 'E',
+                 'E->TX', 'X->+TX', 'X->', 'T->FY', 'Y->*FY', 'Y->', 'F->(E)', 'F->a']
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_multimi_cu_epsilon(scrieGramatica, mod):
+    gramatica = Gramatica(scrieGramatica(*LINII_EPSILON), mod=mod)
+    assert gramatica.anulabile == {'X', 'Y'}
+    assert gramatica.first['E'] == gramatica.first['T'] == gramatica.first['F'] == {'(', 'a'}
+    assert gramatica.first['X'] == {'+'} and gramatica.first['Y'] == {'*'}
+    assert gramatica.follow['X'] == gramatica.follow['E'] == {')', '$'}
+    assert gramatica.follow['Y'] == gramatica.follow['T'] == {'+', ')', '$'}
+    assert gramatica.follow['F'] == {'+', '*', ')', '$'}
+
+
+def test_prefix_si_sufix_anulabile(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica('S A B', 'a b c', 'S', 'S->ABc', 'A->aA', 'A->', 'B->b', 'B->'))
+    assert gramatica.first['S'] == {'a', 'b', 'c'}
+    assert gramatica.follow['A'] == {'b', 'c'} and gramatica.follow['B'] == {'c'}
+    assert all(gramatica.verificaSir(sir) for sir in ['c', 'ac', 'bc', 'aabc', 'aaac'])
+    assert not any(gramatica.verificaSir(sir) for sir in ['', 'a', 'cb', 'bbc', 'bac'])
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_acelasi_limbaj_ca_forma_recursiva_la_stanga(scrieGramatica, gramaticaExpresii, mod):
+    cuEpsilon = Gramatica(scrieGramatica(*LINII_EPSILON), mod=mod)
+    recursiva = Gramatica(gramaticaExpresii, mod=mod)
+    for lungime in range(7):
+        for simboluri in product('a+*()', repeat=lungime):
+            sir = ''.join(simboluri)
+            assert cuEpsilon.verificaSir(sir) == recursiva.verificaSir(sir), sir
+
+
+def test_simbol_nedeclarat(scrieGramatica):
+    with pytest.raises(ValueError):
+        Gramatica(scrieGramatica('S', 'a', 'S', 'S->aB'))
@@ -0,0 +1,88 @@
+import importlib.util
+import random
+
+import pytest
+
+from benchmark import FamilieExpresie
+from esantionare import Esantionator
+from generare_parser import GeneratorModul
+from gramatica import Gramatica, MOD_LALR, MOD_SLR
+
+
+def _incarcaModul(gramatica, director):
+    cale = director / 'parser_generat.py'
+    GeneratorModul(gramatica).scrie(str(cale))
+    specificatie = importlib.util.spec_from_file_location(f'parser_generat_{id(gramatica)}', cale)
+    modul = importlib.util.module_from_spec(specificatie)
+    specificatie.loader.exec_module(modul)
+    return modul
+
+
+def _comparaCuDriverul(gramatica, modul, intrari):
+    for intrare in intrari:
+        acceptat = gramatica.verificaSir(intrare)
+        assert modul.parseaza(intrare) == acceptat, intrare
+        assert modul.cod_intermediar(intrare) == (gramatica.generator.cod_intermediar if acceptat else None), intrare
+
+
+def _intrari(gramatica, lungimeMaxima: int, samanta: int) -> list:
+    """Propoziții extrase uniform și variante stricate ale lor (ultimul terminal înlocuit, trunchiate)."""
+    esantionator = Esantionator(gramatica, lungimeMaxima, samanta)
+    aleator = random.Random(samanta)
+    terminale = [terminal for terminal in gramatica.listaTerminale if terminal != '$']
+    intrari = []
+    for lungime in range(1, lungimeMaxima + 1):
+        if not esantionator.numarDerivari(lungime):
+            continue
+        for propozitie in esantionator.esantioane(10, lungime):
+            simboluri = propozitie.split() if gramatica.separator else list(propozitie)
+            intrari.append(propozitie)
+            intrari.append(gramatica.separator.join(simboluri[:-1] + [aleator.choice(terminale)]))
+            intrari.append(gramatica.separator.join(simboluri[:len(simboluri) // 2]))
+    return intrari
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_expresii(gramaticaExpresii, tmp_path, mod):
+    gramatica = Gramatica(gramaticaExpresii, mod=mod)
+    _comparaCuDriverul(gramatica, _incarcaModul(gramatica, tmp_path), _intrari(gramatica, 25, 1))
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_niveluri_de_precedenta(scrieGramatica, tmp_path, mod):
+    familie = FamilieExpresie(6)
+    gramatica = Gramatica(scrieGramatica(familie.text), mod=mod)
+    modul = _incarcaModul(gramatica, tmp_path)
+    aleator = random.Random(3)
+    intrari = [familie.intrare(lungime, aleator, acceptat) for lungime in (10, 200) for acceptat in (True, False)]
+    _comparaCuDriverul(gramatica, modul, intrari + _intrari(gramatica, 15, 2))
+
+
+def test_cu_lexer(gramaticaExpresii, tmp_path):
+    gramatica = Gramatica(gramaticaExpresii, fisierLexer=True)
+    assert gramatica.lexer is not None
+    modul = _incarcaModul(gramatica, tmp_path)
+    _comparaCuDriverul(gramatica, modul, ['alfa + 42 * (beta_1 + gamma * 7)', 'x * (y + ', '(a) + b ? c', ''])
+    assert modul.parseazaTokeni([('a', 'x'), ('+', '+'), ('a', 'y')])
+
+
+def test_simboluri_de_mai_multe_caractere(scrieGramatica, tmp_path):
+    scrieGramatica('expr -> expr + term => binar + 0 2', 'term -> term * factor => binar * 0 2',
+                   'expr -> term => copiaza 0', 'term -> factor => copiaza 0',
+                   'factor -> ( expr ) => copiaza 1', 'factor -> id => copiaza 0', nume='g.act')
+    gramatica = Gramatica(scrieGramatica('expr term factor', 'id + * ( )', 'expr',
+                                         'expr -> expr + term', 'expr -> term', 'term -> term * factor',
+                                         'term -> factor', 'factor -> ( expr )', 'factor -> id'))
+    modul = _incarcaModul(gramatica, tmp_path)
+    assert modul.cod_intermediar('( id + id ) * id') == ['t1 := id + id', 't2 := t1 * id']
+    _comparaCuDriverul(gramatica, modul, _intrari(gramatica, 15, 4))
+
+
+def test_reducerile_epsilon_fara_sfarsit_sunt_respinse(scrieGramatica, tmp_path):
+    # Gramatică cu conflicte pe care, fără limită, driverul ar cicla pe reducerea A-> (vezi test_parser_push)
+    gramatica = Gramatica(scrieGramatica('S A B', 'a b', 'S', 'S->bA', 'S->B', 'S->AAa', 'A->bb', 'A->',
+                                         'A->SB', 'B->BaB', 'B->Ab'), fisierActiuni=False)
+    modul = _incarcaModul(gramatica, tmp_path)
+    assert not modul.parseaza('')
+    assert modul.traduce('') is None
+    _comparaCuDriverul(gramatica, modul, ['b', 'bb', 'ab', 'bab'])
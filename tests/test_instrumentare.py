@@ -0,0 +1,46 @@
+import tracemalloc
+
+from gramatica import Gramatica, ParserPush
+from instrumentare import EVENIMENT_FAZA, Statistici
+
+
+def test_adancimea_maxima_include_deplasarile(scrieGramatica):
+    # S → a S | b: toate deplasările preced prima reducere, iar vârful stivei (n+1 stări peste
+    # starea 0, după deplasarea lui b) este atins fără nicio reducere între deplasări
+    gramatica = Gramatica(scrieGramatica('S', 'a b', 'S', 'S->aS', 'S->b'))
+    statistici = Statistici()
+    parser = ParserPush(gramatica.tabelParsare, gramatica.registruActiuni.actiuni, statistici=statistici)
+    assert parser.feed('aaaab') and parser.finish()
+    assert statistici.adancimeMaxima == 5
+    assert statistici.deplasari == 6  # a a a a b $
+
+
+def test_adancimea_fara_reduceri(scrieGramatica):
+    # Până la b, S → a S | b doar deplasează: vârful trebuie numărat înainte de orice reducere
+    gramatica = Gramatica(scrieGramatica('S', 'a b', 'S', 'S->aS', 'S->b'))
+    statistici = Statistici()
+    parser = ParserPush(gramatica.tabelParsare, gramatica.registruActiuni.actiuni, statistici=statistici)
+    assert parser.feed('aaaa')
+    assert statistici.adancimeMaxima == 4 and statistici.reduceri == 0
+    # O eroare după alte deplasări oprește parsarea tot fără reduceri
+    assert not parser.feed('aa$')
+    assert statistici.adancimeMaxima == 6 and statistici.reduceri == 0
+
+
+def test_fazele_construirii(gramaticaExpresii):
+    evenimente = []
+    statistici = Statistici(lambda eveniment, date: evenimente.append((eveniment, date)))
+    Gramatica(gramaticaExpresii, statistici=statistici)
+    assert set(statistici.faze) >= {'actionGoto', 'compilare'}
+    for date in statistici.faze.values():
+        assert isinstance(date['deltaBlocuri'], int) and date['varfOcteti'] is None
+    assert sum(eveniment == EVENIMENT_FAZA for eveniment, _ in evenimente) == len(statistici.faze)
+
+    tracemalloc.start()
+    try:
+        statistici = Statistici()
+        Gramatica(gramaticaExpresii, statistici=statistici)
+    finally:
+        tracemalloc.stop()
+    assert all(date['varfOcteti'] >= 0 for date in statistici.faze.values())
+    assert max(date['varfOcteti'] for date in statistici.faze.values()) > 0
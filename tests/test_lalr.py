@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from gramatica import Gramatica, MOD_LALR
+
+# Anticiparea itemului inițial S' → • S $ în automatonul canonic (nu este un terminal al gramaticii)
+SFARSIT_CANONIC = '#'
+
+
+def _anticipariCanonice(gramatica) -> dict:
+    """
+    Anticipările LALR(1) de referință: automatonul LR(1) canonic, construit direct din
+    definiție, cu stările unite după nucleul LR(0).
+
+    Returns:
+        Dicționar {(stare LR(0), număr regulă): mulțime de terminale} pentru reducerile
+        cu cel puțin o anticipare (fără S' → S $)
+    """
+    productii = gramatica.listaProductii
+    neterminale = set(gramatica.listaNeterminale)
+    anulabile = set()
+    first = {neterminal: set() for neterminal in neterminale}
+
+    def firstSir(sir, anticipari):
+        rezultat = set()
+        for simbol in sir:
+            if simbol not in neterminale:
+                return rezultat | {simbol}
+            rezultat |= first[simbol]
+            if simbol not in anulabile:
+                return rezultat
+        return rezultat | anticipari
+
+    schimbat = True
+    while schimbat:
+        schimbat = False
+        for productie in productii:
+            stanga = productie.simbolNeterminal
+            if stanga not in anulabile and all(simbol in anulabile for simbol in productie.sirInlocuire):
+                anulabile.add(stanga)
+                schimbat = True
+            nou = firstSir(productie.sirInlocuire, set())
+            if not nou <= first[stanga]:
+                first[stanga] |= nou
+                schimbat = True
+
+    def closure(itemi):
+        itemi = set(itemi)
+        deProcesat = list(itemi)
+        while deProcesat:
+            index, punct, anticipare = deProcesat.pop()
+            dreapta = productii[index].sirInlocuire
+            if punct < len(dreapta) and dreapta[punct] in neterminale:
+                for terminal in firstSir(dreapta[punct + 1:], {anticipare}):
+                    for urmatoare in gramatica.productiiNeterminal[dreapta[punct]]:
+                        item = (urmatoare, 0, terminal)
+                        if item not in itemi:
+                            itemi.add(item)
+                            deProcesat.append(item)
+        return frozenset(itemi)
+
+    stari = [closure({(0, 0, SFARSIT_CANONIC)})]
+    vazute = set(stari)
+    for stare in stari:
+        simboluri = {productii[i].sirInlocuire[p] for i, p, _ in stare if p < len(productii[i].sirInlocuire)}
+        for simbol in simboluri:
+            succesor = closure({(i, p + 1, a) for i, p, a in stare
+                                if p < len(productii[i].sirInlocuire) and productii[i].sirInlocuire[p] == simbol})
+            if succesor not in vazute:
+                vazute.add(succesor)
+                stari.append(succesor)
+
+    stareDupaNucleu = {}
+    for setItemi in gramatica.seturiItemi:
+        itemi = frozenset((gramatica.itemiInternati[cod].idProductie, gramatica.itemiInternati[cod].pozitiePunct)
+                          for cod in setItemi.coduri)
+        stareDupaNucleu[itemi] = setItemi.id
+    anticipari = {}
+    for stare in stari:
+        id_stare = stareDupaNucleu[frozenset((i, p) for i, p, _ in stare)]
+        for index, punct, anticipare in stare:
+            if index and punct == len(productii[index].sirInlocuire):
+                anticipari.setdefault((id_stare, index), set()).add(anticipare)
+    return anticipari
+
+
+def _gramaticaAleatoare(aleator: random.Random) -> list:
+    neterminale = ['S', 'A', 'B', 'C'][:aleator.randint(2, 4)]
+    terminale = ['x', 'y', 'z']
+    productii = set()
+    for neterminal in neterminale:
+        for _ in range(aleator.randint(1, 3)):
+            dreapta = ''.join(aleator.choice(neterminale + terminale * 2) for _ in range(aleator.randint(1, 3)))
+            productii.add(f'{neterminal}->{dreapta}')
+    return [' '.join(neterminale), ' '.join(terminale), 'S'] + sorted(productii)
+
+
+@pytest.mark.parametrize('samanta', range(4))
+def test_lalr_fata_de_lr1_canonic(scrieGramatica, samanta):
+    aleator = random.Random(samanta)
+    verificate = 0
+    for _ in range(60):
+        linii = _gramaticaAleatoare(aleator)
+        try:
+            gramatica = Gramatica(scrieGramatica(*linii), mod=MOD_LALR, fisierActiuni=False)
+        except ValueError:
+            # Gramatică ciclică (A ⇒+ A), respinsă la construcție
+            continue
+        obtinute = {cheie: gramatica.terminaleDinBiti(biti) for cheie, biti in gramatica.anticipari.items()
+                    if cheie[1] != 0 and biti}
+        assert obtinute == _anticipariCanonice(gramatica), linii
+        verificate += 1
+    assert verificate > 30
+
+
+def test_gramatica_lalr_care_nu_este_slr(scrieGramatica):
+    # S → L = R | R, L → * R | i, R → L: conflict SLR pe '=', rezolvat de LALR
+    linii = ('S L R', '= * i', 'S', 'S->L=R', 'S->R', 'L->*R', 'L->i', 'R->L')
+    assert Gramatica(scrieGramatica(*linii)).conflicte
+    gramatica = Gramatica(scrieGramatica(*linii), mod=MOD_LALR)
+    assert not gramatica.conflicte
+    assert gramatica.verificaSir('*i=**i') and not gramatica.verificaSir('i==i')
@@ -0,0 +1,39 @@
+import pytest
+
+from gramatica import Gramatica
+from lexer import Lexer
+
+LINII = ('E T F', 'a + * ( )', 'E', 'E->E+T', 'E->T', 'T->T*F', 'T->F', 'F->(E)', 'F->a')
+LEXER = ('a [A-Za-z_][A-Za-z0-9_]*|[0-9]+', '+ \\+', '* \\*', '( \\(', ') \\)', '%ignora \\s+')
+
+
+def test_tokenizare():
+    lexer = Lexer([('a', r'[a-z]+'), ('+', r'\+'), ('%ignora', r'\s+')], ['a', '+'])
+    assert list(lexer.tokenizeaza(' ab + c ')) == [('a', 'ab'), ('+', '+'), ('a', 'c')]
+    assert list(lexer.tokenizeaza('ab ? c')) == [('a', 'ab'), (None, '?')]
+    with pytest.raises(ValueError, match='nu există în gramatică'):
+        Lexer([('b', 'b')], ['a'])
+
+
+def test_lexerul_este_optional(scrieGramatica):
+    gramatica = scrieGramatica(*LINII)
+    with pytest.raises(FileNotFoundError):
+        Gramatica(gramatica, fisierLexer=True)
+    fisierLexer = scrieGramatica(*LEXER, nume='g.lex')
+
+    # Fișierul .lex de lângă gramatică nu schimbă nimic dacă lexerul nu este cerut
+    faraLexer = Gramatica(gramatica)
+    assert faraLexer.lexer is None
+    assert not faraLexer.verificaSir('abc') and not faraLexer.verificaSir('alfa + 42')
+    assert faraLexer.verificaSir('a+a*a')
+
+    for cuLexer in (Gramatica(gramatica, fisierLexer=True), Gramatica(gramatica, fisierLexer=fisierLexer)):
+        assert cuLexer.lexer is not None
+        assert cuLexer.verificaSir('alfa + 42 * (beta)')
+        assert cuLexer.generator.cod_intermediar == ['t1 := 42 * beta', 't2 := alfa + t1']
+
+
+def test_fara_actiuni(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica(*LINII), fisierActiuni=False)
+    assert not any(gramatica.registruActiuni.actiuni)
+    assert gramatica.verificaSir('a+a') and gramatica.generator.cod_intermediar == []
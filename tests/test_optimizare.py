@@ -0,0 +1,81 @@
+import random
+
+from cod_intermediar import GeneratorCodIntermediar, Temporar
+from optimizare import optimizeaza, valoareConstanta
+
+VARIABILE = ('x', 'y', 'z')
+
+
+def _genereaza(*quadruple) -> GeneratorCodIntermediar:
+    generator = GeneratorCodIntermediar()
+    for quad in quadruple:
+        generator.emit(*quad)
+    generator.contor_temp = max((int(q[3]) for q in quadruple if isinstance(q[3], Temporar)), default=0)
+    return generator
+
+
+def _executa(quadruple, initiale: dict) -> dict:
+    """Interpretează codul liniar; întoarce valorile tuturor variabilelor și temporarelor."""
+    valori = dict(initiale)
+
+    def citeste(operand):
+        # Plierea poate produce și literali negativi (ex. '-2')
+        constanta = valoareConstanta(operand.lstrip('-')) if isinstance(operand, str) else None
+        if constanta is None:
+            return valori[operand]
+        return -constanta if operand.startswith('-') else constanta
+
+    for op, arg1, arg2, destinatie in quadruple:
+        if op == ':=':
+            valori[destinatie] = citeste(arg1)
+        elif arg2 is None:
+            valori[destinatie] = -citeste(arg1)
+        else:
+            a, b = citeste(arg1), citeste(arg2)
+            valori[destinatie] = a + b if op == '+' else a - b if op == '-' else a * b
+    return valori
+
+
+def test_reatribuirea_sursei_unei_copii():
+    t1, t2 = Temporar(1), Temporar(2)
+    generator = _genereaza((':=', 'x', None, t1), (':=', '5', None, 'x'), ('+', t1, '1', t2))
+    raport = optimizeaza(generator)
+    valori = _executa(generator.quadruple(), {'x': 10})
+    assert valori[t2] == 11 and valori['x'] == 5
+    # Copia lui x a fost scrisă înapoi înainte de reatribuire, deci nu a fost propagată
+    assert raport['copiiPropagate'] == 0
+
+
+def test_copiile_in_variabile_nu_sunt_numarate():
+    t1 = Temporar(1)
+    generator = _genereaza(('+', 'x', 'y', t1), (':=', t1, None, 'z'), (':=', 'z', None, 'x'))
+    raport = optimizeaza(generator, iesiri=[])
+    assert raport['copiiPropagate'] == 0
+    assert list(generator.quadruple()) == [('+', 'x', 'y', t1), (':=', t1, None, 'z'), (':=', 'z', None, 'x')]
+
+
+def test_programe_aleatoare():
+    aleator = random.Random(7)
+    for _ in range(2000):
+        quadruple = []
+        temporare = []
+        for _ in range(aleator.randint(1, 12)):
+            operanzi = list(VARIABILE) + temporare + [str(aleator.randint(0, 3))]
+            destinatie = aleator.choice(VARIABILE) if aleator.random() < 0.4 else Temporar(len(temporare) + 1)
+            op = aleator.choice((':=', ':=', '+', '*', '-', 'neg'))
+            if op == ':=':
+                quad = (op, aleator.choice(operanzi), None, destinatie)
+            elif op == 'neg':
+                quad = ('-', aleator.choice(operanzi), None, destinatie)
+            else:
+                quad = (op, aleator.choice(operanzi), aleator.choice(operanzi), destinatie)
+            quadruple.append(quad)
+            if isinstance(destinatie, Temporar):
+                temporare.append(destinatie)
+        initiale = {'x': 2, 'y': -3, 'z': 5}
+        asteptat = _executa(quadruple, initiale)
+        generator = _genereaza(*quadruple)
+        optimizeaza(generator, iesiri=temporare)
+        obtinut = _executa(generator.quadruple(), initiale)
+        for nume in list(VARIABILE) + temporare:
+            assert obtinut[nume] == asteptat[nume], (quadruple, list(generator.quadruple()))
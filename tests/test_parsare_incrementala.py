@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from esantionare import Esantionator
+from gramatica import Gramatica
+from parsare_incrementala import ParserIncremental
+
+
+def _verificaFataDeParsareaCompleta(gramatica, parser):
+    acceptat = gramatica.verificaSir(parser.text)
+    assert parser.acceptat == acceptat
+    if acceptat:
+        assert parser.cod_intermediar == gramatica.generator.cod_intermediar
+
+
+def test_editare_inainte_de_parsare(gramaticaExpresii):
+    parser = ParserIncremental.dinGramatica(Gramatica(gramaticaExpresii))
+    assert parser.editeaza(0, 0, 'a+a')
+    assert parser.cod_intermediar == ['t1 := a + a']
+    assert parser.editeaza(3, 0, '*a')
+    assert parser.cod_intermediar == ['t1 := a * a', 't2 := a + t1']
+    with pytest.raises(ValueError, match='în afara textului'):
+        ParserIncremental.dinGramatica(Gramatica(gramaticaExpresii)).editeaza(1, 0, 'a')
+
+
+@pytest.mark.parametrize('interval', [1, 3, 16])
+def test_editari_aleatoare_fata_de_parsarea_completa(gramaticaExpresii, interval):
+    gramatica = Gramatica(gramaticaExpresii)
+    esantionator = Esantionator(gramatica, 121, samanta=interval)
+    aleator = random.Random(interval)
+    parser = ParserIncremental.dinGramatica(gramatica, interval)
+    parser.parseaza(esantionator.esantion(121))
+    resincronizari = 0
+    for _ in range(300):
+        text = parser.text
+        alegere = aleator.random()
+        if alegere < 0.4:
+            # Un operand înlocuit cu o expresie
+            pozitii = [i for i, c in enumerate(text) if c == 'a']
+            parser.editeaza(aleator.choice(pozitii), 1, esantionator.esantion(aleator.choice([1, 3, 5, 7])))
+        elif alegere < 0.6:
+            # Un operator cu operandul lui, șters
+            pozitii = [i for i in range(len(text) - 1) if text[i] in '+*' and text[i + 1] == 'a'
+                       and (i + 2 == len(text) or text[i + 2] in '+*)')]
+            if pozitii:
+                parser.editeaza(aleator.choice(pozitii), 2, '')
+        elif alegere < 0.75 or not parser.acceptat:
+            # Un caracter arbitrar (de obicei textul devine invalid); uneori se reia de la zero
+            if not parser.acceptat and aleator.random() < 0.5:
+                parser.parseaza(esantionator.esantion(121))
+            else:
+                parser.editeaza(aleator.randrange(len(text)), 1, aleator.choice('+*()a'))
+        else:
+            pozitii = [i for i, c in enumerate(text) if c == '+']
+            if pozitii:
+                parser.editeaza(aleator.choice(pozitii), 1, '*')
+        _verificaFataDeParsareaCompleta(gramatica, parser)
+        resincronizari += parser.ultimaEditare.get('resincronizareLa') is not None
+    # Editările valide din mijlocul textului trebuie să se resincronizeze cu parsarea anterioară
+    assert resincronizari > 30
+
+
+def test_simboluri_de_mai_multe_caractere(scrieGramatica):
+    scrieGramatica('expr -> expr + term => binar + 0 2', 'term -> term * factor => binar * 0 2',
+                   'expr -> term => copiaza 0', 'term -> factor => copiaza 0',
+                   'factor -> ( expr ) => copiaza 1', 'factor -> id => copiaza 0', nume='g.act')
+    gramatica = Gramatica(scrieGramatica('expr term factor', 'id + * ( )', 'expr',
+                                         'expr -> expr + term', 'expr -> term', 'term -> term * factor',
+                                         'term -> factor', 'factor -> ( expr )', 'factor -> id'))
+    parser = ParserIncremental(gramatica.tabelParsare, gramatica.registruActiuni.actiuni, interval=2)
+    assert parser.parseaza('id + id * id + id')
+    # Pozițiile numără cuvinte: al treilea simbol (id) devine o expresie în paranteze
+    assert parser.editeaza(2, 1, '( id * id )')
+    assert parser.text == 'id + ( id * id ) * id + id'.split()
+    assert parser.cod_intermediar == ['t1 := id * id', 't2 := t1 * id', 't3 := id + t2', 't4 := t3 + id']
+    _verificaFataDeParsareaCompleta(gramatica, parser)
+    assert not parser.editeaza(0, 1, '+')
+    _verificaFataDeParsareaCompleta(gramatica, parser)
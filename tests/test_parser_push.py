@@ -0,0 +1,73 @@
+import io
+
+from gramatica import Gramatica, ParserPush
+
+INTRARI = ['a+a*a', '(a+a)*a', 'a*a+(a*a+a)', 'a+', 'a)+a', '((a)', 'a*a*a+(*)']
+
+
+def _parser(gramatica, **optiuni):
+    return ParserPush(gramatica.tabel, gramatica.registruActiuni.actiuni, **optiuni)
+
+
+def _parseazaPeBucati(gramatica, bucati):
+    parser = _parser(gramatica)
+    for bucata in bucati:
+        if not parser.feed(bucata):
+            return False, None
+    return parser.finish(), list(parser.generator.cod_intermediar)
+
+
+def test_intrare_lunga_fara_limita_de_pasi(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    assert gramatica.verificaSir('a' + '+a' * 5000)
+    assert len(gramatica.generator.cod_intermediar) == 5000
+    assert gramatica.verificaSir('(' * 2000 + 'a' + ')' * 2000)
+    assert not gramatica.verificaSir('(' * 2000 + 'a' + ')' * 1999)
+
+
+def test_orice_impartire_in_bucati(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    for sir in INTRARI:
+        asteptat = gramatica.verificaSir(sir)
+        cod = list(gramatica.generator.cod_intermediar) if asteptat else None
+        for i in range(len(sir) + 1):
+            for j in range(i, len(sir) + 1):
+                acceptat, codBucati = _parseazaPeBucati(gramatica, [sir[:i], sir[i:j], sir[j:]])
+                assert acceptat == asteptat, (sir, i, j)
+                if asteptat:
+                    assert codBucati == cod, (sir, i, j)
+
+
+def test_eroarea_este_semnalata_la_feed(gramaticaExpresii):
+    parser = _parser(Gramatica(gramaticaExpresii))
+    assert parser.feed('a+')
+    assert not parser.feed('*a')
+    assert not parser.finish()
+
+
+def test_flux_citit_pe_blocuri(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    text = '*'.join(['(a+a)'] * 3000)
+    assert _parser(gramatica).parseazaFlux(io.StringIO(text), marimeBloc=7)
+    assert not _parser(gramatica).parseazaFlux(io.StringIO(text + '+'), marimeBloc=7)
+
+
+def test_stiva_de_simboluri_doar_la_depanare(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    assert _parser(gramatica).stiva_simboluri is None
+    parser = _parser(gramatica, depanare=True)
+    parser.feed('(a+')
+    assert [parser.tabel.coloane[c] for c in parser.stiva_simboluri] == ['$', '(', 'E', '+']
+
+
+# Recursivitate stângă ascunsă (S->B, B->Ab, A->, A->SB): tabelul are conflicte și, pe unele
+# intrări, reducerea A-> urmată de salturi s-ar repeta la nesfârșit fără a deplasa simbolul
+LINII_CICLU_EPSILON = ('S A B', 'a b', 'S', 'S->bA', 'S->B', 'S->AAa', 'A->bb', 'A->', 'A->SB',
+                       'B->BaB', 'B->Ab')
+
+
+def test_reducerile_epsilon_fara_sfarsit_sunt_respinse(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica(*LINII_CICLU_EPSILON), fisierActiuni=False)
+    assert gramatica.conflicte
+    assert not gramatica.verificaSir('')
+    assert gramatica.verificaSir('b')
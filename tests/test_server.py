@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from gramatica import Gramatica
+from server import INCADRARE_LINIE, INCADRARE_LUNGIME, ServerParsare, _cadruCerere, _citesteRaspuns, _deschide
+from sesiune import GramaticaCompilata
+
+CERERI = ['a+a*a', 'a+', '(a+a)*a', 'abc', '*'.join(['(a+a)'] * 300)]
+
+
+def _asteptat(compilata: GramaticaCompilata, expresie: str) -> dict:
+    sesiune = compilata.sesiune()
+    acceptat = sesiune.verificaSir(expresie)
+    return {'acceptat': acceptat, 'cod': sesiune.cod_intermediar if acceptat else []}
+
+
+async def _trimitePipeline(server: ServerParsare, cereri: list, incadrare: str) -> list:
+    """Trimite toate cererile pe o conexiune, fără să aștepte răspunsuri, apoi le citește."""
+    cititor, scriitor = await _deschide(server.adresa)
+    scriitor.write(b''.join(_cadruCerere(cerere, incadrare) for cerere in cereri))
+    await scriitor.drain()
+    raspunsuri = [await _citesteRaspuns(cititor, incadrare) for _ in cereri]
+    scriitor.close()
+    await scriitor.wait_closed()
+    return raspunsuri
+
+
+async def _ruleaza(compilata: GramaticaCompilata, cereri: list, **optiuni):
+    server = ServerParsare(compilata, **optiuni)
+    await server.porneste()
+    try:
+        return await _trimitePipeline(server, cereri, server.incadrare), server
+    finally:
+        await server.opreste()
+
+
+@pytest.fixture
+def compilata(gramaticaExpresii) -> GramaticaCompilata:
+    return GramaticaCompilata.dinGramatica(Gramatica(gramaticaExpresii))
+
+
+@pytest.mark.parametrize('incadrare', [INCADRARE_LINIE, INCADRARE_LUNGIME])
+def test_raspunsuri_in_ordinea_cererilor(compilata, incadrare):
+    raspunsuri, server = asyncio.run(_ruleaza(compilata, CERERI, incadrare=incadrare))
+    assert raspunsuri == [_asteptat(compilata, cerere) for cerere in CERERI]
+    assert raspunsuri[0] == {'acceptat': True, 'cod': ['t1 := a * a', 't2 := a + t1']}
+    assert server.cereri == len(CERERI) and server.loturi == 0
+
+
+def test_cereri_mari_trimise_pool_ului(compilata):
+    raspunsuri, server = asyncio.run(_ruleaza(compilata, CERERI, workers=1, pragLot=100))
+    assert raspunsuri == [_asteptat(compilata, cerere) for cerere in CERERI]
+    assert server.loturi == 1
+
+
+def test_cerere_prea_lunga(compilata):
+    async def ruleaza():
+        server = ServerParsare(compilata, incadrare=INCADRARE_LUNGIME, maxOcteti=16)
+        await server.porneste()
+        try:
+            cititor, scriitor = await _deschide(server.adresa)
+            scriitor.write(_cadruCerere('a+a', INCADRARE_LUNGIME) + _cadruCerere('a+' * 10 + 'a', INCADRARE_LUNGIME))
+            primul = await _citesteRaspuns(cititor, INCADRARE_LUNGIME)
+            alDoilea = await _citesteRaspuns(cititor, INCADRARE_LUNGIME)
+            inchis = await cititor.read() == b''
+            scriitor.close()
+            return primul, alDoilea, inchis
+        finally:
+            await server.opreste()
+
+    primul, alDoilea, inchis = asyncio.run(ruleaza())
+    assert primul['acceptat'] and 'eroare' in alDoilea and inchis
@@ -0,0 +1,91 @@
+import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gramatica import Gramatica
+from sesiune import GramaticaCompilata, PoolSesiuni
+
+FIRE = 8
+
+
+def _expresie(aleator: random.Random, adancime: int = 0) -> str:
+    if adancime > 3 or aleator.random() < 0.3:
+        return 'a'
+    operator = aleator.choice('+*')
+    expresie = _expresie(aleator, adancime + 1) + operator + _expresie(aleator, adancime + 1)
+    return f'({expresie})' if aleator.random() < 0.3 else expresie
+
+
+@pytest.fixture
+def referinta(gramaticaExpresii):
+    """(gramatică, intrări, rezultatele lui Gramatica.verificaSir parsate pe rând)."""
+    gramatica = Gramatica(gramaticaExpresii)
+    aleator = random.Random(5)
+    intrari = [_expresie(aleator) for _ in range(400)] + ['a+', '(a', 'a**a']
+    rezultate = []
+    for sir in intrari:
+        acceptat = gramatica.verificaSir(sir)
+        rezultate.append((acceptat, list(gramatica.generator.cod_intermediar) if acceptat else []))
+    return gramatica, intrari, rezultate
+
+
+@pytest.fixture
+def comutareDesa():
+    """Schimbă firul de execuție cât mai des, ca parsările concurente să se întrepătrundă."""
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_sesiuni_intercalate_pe_bucati(referinta):
+    gramatica, _, _ = referinta
+    compilata = GramaticaCompilata.dinGramatica(gramatica)
+    prima, aDoua = compilata.sesiune(), compilata.sesiune()
+    parserPrim, parserDoi = prima.parser(), aDoua.parser()
+    for bucataPrim, bucataDoi in zip(['a+', 'a*', 'a'], ['(a', '+a)', '*a']):
+        assert parserPrim.feed(bucataPrim) and parserDoi.feed(bucataDoi)
+    assert parserPrim.finish() and parserDoi.finish()
+    assert prima.cod_intermediar == ['t1 := a * a', 't2 := a + t1']
+    assert aDoua.cod_intermediar == ['t1 := a + a', 't2 := t1 * a']
+
+
+def test_fire_concurente_nu_se_influenteaza(referinta, comutareDesa):
+    gramatica, intrari, rezultate = referinta
+    compilata = GramaticaCompilata.dinGramatica(gramatica)
+    celule = bytes(compilata.tabel.celule)
+    bariera = threading.Barrier(FIRE)
+
+    def parseaza(deplasare: int) -> list:
+        sesiune = compilata.sesiune()
+        bariera.wait()
+        rezultat = []
+        # Fiecare fir parcurge intrările în altă ordine, deci firele parsează șiruri diferite
+        for i in range(len(intrari)):
+            index = (i + deplasare * 37) % len(intrari)
+            acceptat = sesiune.verificaSir(intrari[index], construiesteArbore=index % 3 == 0)
+            rezultat.append((index, acceptat, list(sesiune.cod_intermediar) if acceptat else []))
+            if index % 3 == 0 and acceptat:
+                assert sesiune.arbore.text(sesiune.arbore.radacina) == intrari[index]
+        return rezultat
+
+    with ThreadPoolExecutor(FIRE) as executor:
+        for rezultat in executor.map(parseaza, range(FIRE)):
+            for index, acceptat, cod in rezultat:
+                assert (acceptat, cod) == rezultate[index], intrari[index]
+    assert bytes(compilata.tabel.celule) == celule
+
+
+def test_verifica_siruri_si_pool(referinta, comutareDesa):
+    gramatica, intrari, rezultate = referinta
+    compilata = GramaticaCompilata.dinGramatica(gramatica)
+    assert compilata.verificaSiruri(intrari, workers=FIRE, chunksize=16) == rezultate
+    pool = PoolSesiuni(compilata, marime=2)
+    with pool.imprumuta() as prima, pool.imprumuta() as aDoua, pool.imprumuta() as aTreia:
+        assert len({id(prima), id(aDoua), id(aTreia)}) == 3
+        assert aTreia.verificaSir('a*a') and aTreia.cod_intermediar == ['t1 := a * a']
+    assert pool.libere.qsize() == 2
+    assert pool.obtine().cod_intermediar == []
@@ -0,0 +1,71 @@
+import io
+import random
+
+import pytest
+
+from gramatica import Gramatica, MOD_LALR, MOD_SLR, ParserPush
+from simboluri import citesteSimboluri, formateazaSimboluri, separatorSimboluri
+
+LINII_CUVINTE = ['expr term factor', 'id + * ( )', 'expr',
+                 'expr -> expr + term', 'expr -> term', 'term -> term * factor',
+                 'term -> factor', 'factor -> ( expr )', 'factor -> id']
+
+
+def test_citire_simboluri():
+    declarate = {'expr', 'term', 'id', 'E', 'T', '+'}
+    assert citesteSimboluri('expr + term', declarate) == ('expr', '+', 'term')
+    assert citesteSimboluri('E+T', declarate) == ('E', '+', 'T')
+    assert citesteSimboluri('  ', declarate) == ()
+    assert separatorSimboluri(['E', '+']) == '' and separatorSimboluri(['expr', '+']) == ' '
+    assert formateazaSimboluri(('id', '*', 'id')) == 'id * id' and formateazaSimboluri(('a', '*')) == 'a*'
+
+
+def test_simbolurile_sunt_internate(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica(*LINII_CUVINTE))
+    assert gramatica.separator == ' '
+    terminale = [gramatica.idSimbol[t] for t in gramatica.listaTerminale]
+    neterminale = [gramatica.idSimbol[n] for n in gramatica.listaNeterminale]
+    assert sorted(terminale + neterminale) == list(range(len(gramatica.idSimbol)))
+    assert max(terminale) < min(neterminale)
+    assert gramatica.first['expr'] == {'(', 'id'}
+    assert gramatica.follow['term'] == {'+', '*', ')', '$'}
+    assert gramatica.listaProductii[1].sirInlocuire == ('expr', '+', 'term')
+
+
+def test_forma_compacta_da_acelasi_automat(scrieGramatica, gramaticaExpresii):
+    spatiat = scrieGramatica('E T F', 'a + * ( )', 'E', 'E -> E + T', 'E -> T', 'T -> T * F',
+                             'T -> F', 'F -> ( E )', 'F -> a')
+    assert Gramatica(spatiat).diferenteFataDe(Gramatica(gramaticaExpresii)) == []
+
+
+@pytest.mark.parametrize('optiuni', [{'mod': MOD_SLR}, {'mod': MOD_LALR}, {'comprimaTabel': True},
+                                     {'minimizeaza': True}])
+def test_parsare_pe_cuvinte(scrieGramatica, gramaticaExpresii, optiuni):
+    cuvinte = Gramatica(scrieGramatica(*LINII_CUVINTE), **optiuni)
+    caractere = Gramatica(gramaticaExpresii, **optiuni)
+    assert cuvinte.verificaSir('( id + id ) * id')
+    assert cuvinte.verificaSir('  id\t+\nid  ')
+    assert not cuvinte.verificaSir('id+id') and not cuvinte.verificaSir('id id')
+    # Același limbaj ca gramatica E/T/F, cu 'id' în locul lui 'a'
+    for propozitie in caractere.enumereazaLanturi(6):
+        for sir in (propozitie, propozitie[:-1], propozitie + ')'):
+            text = ' '.join('id' if simbol == 'a' else simbol for simbol in sir)
+            assert cuvinte.verificaSir(text) == caractere.verificaSir(sir), text
+
+
+def test_flux_cu_cuvinte_taiate_intre_blocuri(scrieGramatica):
+    gramatica = Gramatica(scrieGramatica(*LINII_CUVINTE))
+    aleator = random.Random(9)
+    text = ' * '.join('( id + id )' for _ in range(500))
+    for marimeBloc in (1, 2, 3, 7, 64):
+        parser = ParserPush(gramatica.tabelParsare, gramatica.registruActiuni.actiuni)
+        assert parser.parseazaFlux(io.StringIO(text), marimeBloc=marimeBloc)
+    parser = ParserPush(gramatica.tabelParsare, gramatica.registruActiuni.actiuni)
+    cuvinte = text.split()
+    while cuvinte:
+        taietura = aleator.randint(1, 5)
+        bucata, cuvinte = cuvinte[:taietura], cuvinte[taietura:]
+        assert parser.feed(bucata)
+    assert parser.finish()
+    assert not ParserPush(gramatica.tabelParsare, gramatica.registruActiuni.actiuni).parseazaFlux(
+        io.StringIO('id + idd'), marimeBloc=3)
@@ -0,0 +1,148 @@
+from itertools import product
+
+import pytest
+
+from gramatica import EROARE, Gramatica, MOD_LALR, MOD_SLR, REDUCERE
+
+ACCEPTATE = ['a', 'a+a', 'a*a', 'a+a*a', '(a+a)', 'a*a+(a*a+a)', '((a))*(a+a)']
+RESPINSE = ['', 'abc', 'a*a*a+(*)', 'a+', '(a', 'a)', '+a', 'aa', '()']
+
+# Gramatica de expresii cu producții epsilon (X și Y anulabile)
+LINII_EPSILON = ['E X T Y F', 'a + * ( )', 'E',
+                 'E->TX', 'X->+TX', 'X->', 'T->FY', 'Y->*FY', 'Y->', 'F->(E)', 'F->a']
+
+
+def _parseazaCuDictionare(gramatica, sir: str) -> bool:
+    """Driver de referință care citește direct dicționarele tabelAction și tabelGoto."""
+    idSimbol = gramatica.idSimbol
+    simboluri = [idSimbol.get(simbol, -1) for simbol in sir] + [idSimbol['$']]
+    stive = [0]
+    pozitie = 0
+    while True:
+        anticipare = simboluri[pozitie] if pozitie < len(simboluri) else idSimbol['$']
+        actiune = gramatica.tabelAction.get((stive[-1], anticipare))
+        if actiune is None:
+            return False
+        if actiune == 'acc':
+            return True
+        if actiune[0] == 'd':
+            stive.append(int(actiune[1:]))
+            pozitie += 1
+            continue
+        productie = gramatica.listaProductii[int(actiune[1:])]
+        if productie.sirInlocuire:
+            del stive[-len(productie.sirInlocuire):]
+        salt = gramatica.tabelGoto.get((stive[-1], idSimbol[productie.simbolNeterminal]))
+        if salt is None:
+            return False
+        stive.append(salt)
+
+
+def _intrariExhaustive(alfabet: str, lungimeMaxima: int):
+    for lungime in range(lungimeMaxima + 1):
+        for simboluri in product(alfabet, repeat=lungime):
+            yield ''.join(simboluri)
+
+
+def test_celulele_compilate_reproduc_tabelele(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    tabel = gramatica.tabel
+    for stare in range(tabel.nrStari):
+        for simbol in tabel.coloane:
+            cheie = (stare, gramatica.idSimbol[simbol])
+            if simbol in gramatica.listaNeterminale:
+                asteptat = gramatica.tabelGoto.get(cheie)
+                asteptat = '0' if asteptat is None else str(asteptat)
+            else:
+                asteptat = gramatica.tabelAction.get(cheie, '0')
+            assert tabel.obtine(stare, simbol) == asteptat, (stare, simbol)
+
+
+def test_exemple(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    assert all(gramatica.verificaSir(sir) for sir in ACCEPTATE)
+    assert not any(gramatica.verificaSir(sir) for sir in RESPINSE)
+    assert gramatica.verificaSir('a+a*a')
+    assert gramatica.generator.cod_intermediar == ['t1 := a * a', 't2 := a + t1']
+
+
+def test_acelasi_limbaj_ca_tabelele_text(gramaticaExpresii):
+    gramatica = Gramatica(gramaticaExpresii)
+    for sir in _intrariExhaustive('a+*()x', 5):
+        assert gramatica.verificaSir(sir) == _parseazaCuDictionare(gramatica, sir), sir
+
+
+def test_export_text_optional(gramaticaExpresii, tmp_path):
+    cale = tmp_path / 'tabel.txt'
+    Gramatica(gramaticaExpresii)
+    assert not cale.exists()
+    Gramatica(gramaticaExpresii, fisierTabel=str(cale))
+    assert cale.read_text().strip()
+
+
+@pytest.fixture(params=[MOD_SLR, MOD_LALR])
+def perechiTabele(request, scrieGramatica, gramaticaExpresii):
+    """Perechi (dens, comprimat) pentru gramatica de expresii și varianta ei cu epsilon."""
+    perechi = []
+    for cale in (gramaticaExpresii, scrieGramatica(*LINII_EPSILON)):
+        perechi.append((Gramatica(cale, mod=request.param),
+                        Gramatica(cale, mod=request.param, comprimaTabel=True)))
+    return perechi
+
+
+def test_comprimat_pastreaza_celulele_explicite(perechiTabele):
+    for dens, comprimat in perechiTabele:
+        tabel, tabelComprimat = dens.tabel, comprimat.tabelParsare
+        for stare in range(tabel.nrStari):
+            implicit = tabelComprimat.implicit[stare]
+            assert implicit == EROARE or (implicit & 3 == REDUCERE
+                                          and tabel.lungimiProductii[implicit >> 2] > 0)
+            for coloana in range(tabel.nrColoane):
+                celula = tabel.celule[stare * tabel.nrColoane + coloana]
+                if celula != EROARE:
+                    assert tabelComprimat.actiune(stare, coloana) == celula, (stare, coloana)
+                elif coloana > tabel.coloanaSfarsit:
+                    assert tabelComprimat.actiune(stare, coloana) == EROARE
+                else:
+                    assert tabelComprimat.actiune(stare, coloana) in (EROARE, implicit)
+        assert tabelComprimat.raportMemorie()['raport'] < 1
+
+
+def test_comprimat_accepta_acelasi_limbaj(perechiTabele):
+    for dens, comprimat in perechiTabele:
+        for sir in _intrariExhaustive('a+*()x', 5):
+            acceptat = dens.verificaSir(sir)
+            assert comprimat.verificaSir(sir) == acceptat, sir
+            if acceptat:
+                assert comprimat.generator.cod_intermediar == dens.generator.cod_intermediar, sir
+
+
+def test_gramatica_ciclica_respinsa(scrieGramatica):
+    with pytest.raises(ValueError, match='ciclică'):
+        Gramatica(scrieGramatica('S A', 'a', 'S', 'S->A', 'A->S', 'S->a'), comprimaTabel=True)
+
+
+# Gramatici mici (cu conflicte rezolvate) în care minimizarea unește stări
+GRAMATICI_CU_STARI_ECHIVALENTE = [
+    ['S', 'a', 'S', 'S->', 'S->aa', 'S->aS'],
+    ['S A', 'a', 'S', 'S->aA', 'A->aA', 'A->a', 'A->aa'],
+    ['S A', 'a b', 'S', 'S->SbA', 'S->', 'S->a', 'A->Ab', 'A->ba', 'A->Sba'],
+    ['S A B', 'a b c', 'S', 'S->bbb', 'S->AAc', 'S->AAA', 'A->', 'A->B', 'B->cc', 'B->aA', 'B->aSA'],
+]
+
+
+@pytest.mark.parametrize('mod', [MOD_SLR, MOD_LALR])
+def test_minimizarea_pastreaza_limbajul(scrieGramatica, gramaticaExpresii, mod):
+    cai = [gramaticaExpresii, scrieGramatica(*LINII_EPSILON, nume='epsilon.txt')]
+    cai += [scrieGramatica(*linii, nume=f'g{i}.txt') for i, linii in enumerate(GRAMATICI_CU_STARI_ECHIVALENTE)]
+    stariUnite = 0
+    for cale in cai:
+        initial = Gramatica(cale, mod=mod)
+        minimizat = Gramatica(cale, mod=mod, minimizeaza=True)
+        assert len(minimizat.clasaStare) == len(initial.seturiItemi)
+        assert minimizat.tabel.nrStari == len(set(minimizat.clasaStare)) <= initial.tabel.nrStari
+        stariUnite += initial.tabel.nrStari - minimizat.tabel.nrStari
+        alfabet = ''.join(t for t in initial.listaTerminale if t != '$')
+        for sir in _intrariExhaustive(alfabet, 6):
+            assert minimizat.verificaSir(sir) == initial.verificaSir(sir), (cale, sir)
+    assert stariUnite > 0